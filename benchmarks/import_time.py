@@ -0,0 +1,79 @@
+"""
+## Benchmark de tiempo de importación
+Este script mide el tiempo de arranque en frío de `import odoo_api_manager`
+en procesos nuevos de Python y revisa que los módulos pesados no se carguen
+al importar la librería.
+
+Uso:
+>>> python benchmarks/import_time.py
+>>> python benchmarks/import_time.py --runs 20 --check
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Raíz del código fuente de la librería
+SRC_PATH = Path(__file__).resolve().parent.parent / 'src'
+
+# Módulos que no deben cargarse al importar la librería
+HEAVY_MODULES = (
+    'pandas',
+    'numpy',
+    'asyncio',
+    'dotenvironment',
+    'odoo_api_manager._typing._base.catalogs',
+)
+
+# Código ejecutado en cada proceso
+PROBE = (
+    'import sys, time; '
+    'start = time.perf_counter(); '
+    'import odoo_api_manager; '
+    'elapsed = time.perf_counter() - start; '
+    f'print(elapsed); print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+)
+
+def measure(
+    runs: int,
+) -> tuple[list[float], set[str]]:
+
+    # Entorno de los procesos con la librería en la ruta de importación
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join([str(SRC_PATH), os.environ.get('PYTHONPATH', '')])}
+
+    timings: list[float] = []
+    loaded: set[str] = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE],
+            capture_output= True,
+            text= True,
+            check= True,
+            env= env,
+        ).stdout.splitlines()
+        timings.append(float(output[0]))
+        loaded.update(filter(None, output[1].split(',')) if len(output) > 1 else ())
+
+    return ( timings, loaded )
+
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description= 'Tiempo de importación de odoo_api_manager.')
+    parser.add_argument('--runs', type= int, default= 10, help= 'Cantidad de procesos a medir.')
+    parser.add_argument('--check', action= 'store_true', help= 'Termina con error si se cargan módulos pesados.')
+    args = parser.parse_args()
+
+    ( timings, loaded ) = measure(args.runs)
+
+    print(f'import odoo_api_manager ({args.runs} procesos)')
+    print(f'  mínimo:  {min(timings) * 1000:8.1f} ms')
+    print(f'  mediana: {statistics.median(timings) * 1000:8.1f} ms')
+    print(f'  máximo:  {max(timings) * 1000:8.1f} ms')
+    print(f'  módulos pesados cargados: {", ".join(sorted(loaded)) or "ninguno"}')
+
+    return 1 if args.check and loaded else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
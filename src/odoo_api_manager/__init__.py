@@ -1 +1,17 @@
+from typing import TYPE_CHECKING
 from ._main import OdooAPIManager
+from ._resources import normalize_criteria
+from ._sync import SyncEngine
+
+if TYPE_CHECKING:
+    from ._async import AsyncOdooAPIManager
+
+def __getattr__(name: str):
+
+    # El cliente asíncrono se importa hasta que se solicita para no cargar
+    # `asyncio` en aplicaciones síncronas
+    if name == 'AsyncOdooAPIManager':
+        from ._async import AsyncOdooAPIManager
+        return AsyncOdooAPIManager
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
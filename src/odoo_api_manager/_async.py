@@ -0,0 +1,567 @@
+from __future__ import annotations
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    Optional,
+)
+from ._base import _OdooAPIBase
+from ._batching import AsyncReadBatcher
+from ._resources import Params
+from ._settings import PRESETS
+from ._templates import (
+    XMLRPC_COMMON,
+    XMLRPC_OBJECT,
+)
+from ._transport import AsyncProxyPool
+from ._typing.aliases import RecordID
+from ._typing.criteria_structure import CriteriaStructure
+from ._typing.generics import _O
+from ._typing.literals import (
+    AccessRights,
+    APIMethods,
+    FieldFields,
+    ModelName,
+    OutputOptions,
+)
+from ._typing.misc import (
+    AltDatabaseArg,
+    RecordData,
+    ListOrItem,
+    ModelField,
+    SerializableValue,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+class AsyncOdooAPIManager(_OdooAPIBase[_O]):
+    """
+    # Conexión asíncrona al API de Odoo
+    Versión para `asyncio` de `OdooAPIManager`. Expone los mismos métodos con
+    los mismos parámetros, pero éstos retornan awaitables y no bloquean el
+    event loop. La configuración de credenciales en el archivo `.env` es la
+    misma.
+
+    Forma de uso:
+    >>> async with AsyncOdooAPIManager() as odoo:
+    >>>     data = await odoo.search_read('sale.order', [('state', '=', 'sale')])
+
+    La autenticación se realiza en la primera solicitud (o al entrar al
+    bloque `async with`). La cantidad de solicitudes simultáneas al API se
+    limita con el argumento `max_concurrency`, por lo que pueden lanzarse
+    cientos de solicitudes a la vez sin saturar el servidor:
+    >>> odoo = AsyncOdooAPIManager(max_concurrency=8)
+    >>> results = await asyncio.gather(*[
+    >>>     odoo.read('sale.order', ids) for ids in chunks
+    >>> ])
+
+    Cada operación de red espera como máximo `timeout` segundos (`120` por
+    defecto, a diferencia de `OdooAPIManager`, que espera indefinidamente),
+    por lo que un servidor que no responde no bloquea las solicitudes en
+    espera ni sus lugares en `max_concurrency`.
+    """
+
+    def __init__(
+        self,
+        alt_db: AltDatabaseArg | None = None,
+        default_output: OutputOptions = 'dataframe',
+        max_concurrency: int = PRESETS.POOL_SIZE,
+        timeout: float | None = PRESETS.TIMEOUT,
+        normalize_criteria: bool = False,
+    ) -> None:
+
+        # Inicialización de la configuración compartida
+        super().__init__(alt_db, default_output, max_concurrency, timeout, normalize_criteria)
+
+        # Parámetro de URL
+        URL_PARAM = {'url': self._credentials.url}
+        # Creación de las conexiones. Éstas se abren hasta la primera solicitud
+        self._common = AsyncProxyPool(XMLRPC_COMMON.format(**URL_PARAM), 1, self._timeout)
+        self._models = AsyncProxyPool(XMLRPC_OBJECT.format(**URL_PARAM), self._pool_size, self._timeout)
+
+        # Token de autenticación
+        self._uid: int | None = None
+        # Candado para que llamadas simultáneas compartan una sola autenticación
+        self._auth_lock = asyncio.Lock()
+        # Agrupador de lecturas de registros individuales
+        self._batcher = AsyncReadBatcher(self)
+
+    async def __aenter__(
+        self,
+    ) -> 'AsyncOdooAPIManager[_O]':
+
+        # Autenticación del usuario
+        await self.connect()
+
+        return self
+
+    async def __aexit__(
+        self,
+        *_,
+    ) -> None:
+
+        # Cierre de conexiones
+        await self.close()
+
+    async def connect(
+        self,
+    ) -> None:
+        """
+        ## Autenticación
+        Este método autentica al usuario en el API. No es necesario llamarlo
+        explícitamente ya que la autenticación se realiza en la primera
+        solicitud.
+        >>> await odoo.connect()
+        """
+
+        # Si ya se cuenta con un token de autenticación no se hace nada
+        if self._uid is not None:
+            return
+
+        async with self._auth_lock:
+            # Se revisa de nuevo por si otra llamada autenticó mientras se esperaba
+            if self._uid is None:
+                self._uid = await self._common.call(
+                    'authenticate',
+                    self._credentials.db,
+                    self._credentials.username,
+                    self._credentials.token,
+                    {},
+                )
+
+    async def close(
+        self,
+    ) -> None:
+        """
+        ## Cierre de conexiones
+        Este método cierra las conexiones persistentes abiertas hacia el API.
+        >>> await odoo.close()
+        """
+
+        await self._common.close()
+        await self._models.close()
+
+    async def version(
+        self,
+    ) -> dict:
+        """
+        Versión del sistema Odoo con el que se tiene conexión.
+        >>> await odoo.version()
+        """
+
+        return await self._common.call('version')
+
+    async def check_access_rights(
+        self,
+        model: ModelName,
+        right_type: AccessRights,
+        raise_exception: bool = False,
+    ) -> bool:
+        """
+        ## Permisos de acceso
+        Versión asíncrona de `OdooAPIManager.check_access_rights`.
+        >>> await odoo.check_access_rights('res.partner', 'write')
+        """
+
+        # Construcción de parámetros
+        params = Params(
+            right_type= right_type,
+            raise_exception= raise_exception,
+        )
+
+        # Ejecución del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= 'check_access_rights',
+            args= params.args,
+            kwargs= params.kwargs,
+        )
+
+        return response
+
+    async def create(
+        self,
+        model: ModelName,
+        records_data: ListOrItem[RecordData],
+    ) -> int:
+        """
+        ## Creación de registro
+        Versión asíncrona de `OdooAPIManager.create`.
+        >>> partner_id = await odoo.create('res.partner', {'name': 'Nombre de un cliente'})
+        """
+
+        # Se acondiciona el valor de datos
+        records_data = self._convert_to_list(records_data)
+
+        # Construcción de parámetros
+        params = Params(
+            records_data= records_data,
+        )
+
+        # Ejecución del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= 'create',
+            args= params.args,
+        )
+
+        return response
+
+    async def search(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> list[int]:
+        """
+        ## Búsqueda de registros
+        Versión asíncrona de `OdooAPIManager.search`.
+        >>> await odoo.search("sale.order", [("state", "=", "cancel")])
+        """
+
+        # Construcción de parámetros
+        params = Params(
+            search_criteria= search_criteria,
+            offset= offset,
+            limit= limit,
+        )
+
+        # Ejecución del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= 'search',
+            args= params.args,
+            kwargs= params.kwargs,
+        )
+
+        return response
+
+    async def get_value(
+        self,
+        model: ModelName,
+        record_id: RecordID,
+        field: ModelField,
+    ) -> SerializableValue:
+        """
+        ## Obtención del valor de un registro
+        Versión asíncrona de `OdooAPIManager.get_value`.
+        >>> await odoo.get_value('product.template', 53, 'list_price')
+
+        Las llamadas realizadas en una misma iteración del event loop se
+        agrupan en una sola lectura por modelo y conjunto de campos:
+        >>> prices = await asyncio.gather(*[
+        >>>     odoo.get_value('product.template', id, 'list_price') for id in ids
+        >>> ])
+        """
+
+        # Obtención del registro en la lectura agrupada de la iteración
+        record = await self._batcher.load(model, record_id, [field])
+
+        # Si no existe el registro se retorna un None para evitar errores
+        if not record:
+            return None
+
+        # Se retorna el valor del registro
+        value = record[field]
+
+        return value
+
+    async def get_values(
+        self,
+        model: ModelName,
+        record_ids: RecordID,
+        fields: list[ModelField]
+    ) -> tuple[SerializableValue]:
+        """
+        ## Obtención de valores de un registro
+        Versión asíncrona de `OdooAPIManager.get_values`.
+        >>> name, price = await odoo.get_values('product.template', 53, ['name', 'list_price'])
+
+        Al igual que `get_value`, las llamadas realizadas en una misma
+        iteración del event loop se agrupan en una sola lectura.
+        """
+
+        # Se acepta la ID dentro de una lista, igual que en `read`
+        ids = self._convert_to_list(record_ids)
+        if len(ids) > 1:
+            raise ValueError('`get_values` obtiene los valores de un solo registro.')
+        if not ids:
+            return None
+
+        # Obtención del registro en la lectura agrupada de la iteración
+        record = await self._batcher.load(model, ids[0], fields)
+
+        # Si no existe el registro se retorna un None para evitar errores
+        if not record:
+            return None
+
+        return tuple([record[field] for field in fields])
+
+    async def read(
+        self,
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Optional[OutputOptions] = None,
+    ) -> list[dict] | pd.DataFrame:
+        """
+        ## Lectura de registros
+        Versión asíncrona de `OdooAPIManager.read`.
+        >>> await odoo.read("sale.order", [52, 87, 129, 132], ['name', 'state'])
+        """
+
+        # Se acondiciona el valor de datos
+        record_ids = self._convert_to_list(record_ids)
+
+        # Construcción de parámetros
+        params = Params(
+            record_ids= record_ids,
+            fields= fields,
+        )
+
+        # Obtención de los datos a partir del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= 'read',
+            args= params.args,
+            kwargs= params.kwargs,
+        )
+
+        # Conversión en formato de salida configurado
+        converted_data = self._build_output(response, output, model= model)
+
+        return converted_data
+
+    async def search_read(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: list[ModelField] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Optional[OutputOptions] = None,
+    ) -> list[dict] | pd.DataFrame:
+        """
+        ## Búsqueda y lectura de registros
+        Versión asíncrona de `OdooAPIManager.search_read`.
+        >>> await odoo.search_read("sale.order", [("state", "=", "sale")], ['name'])
+        """
+
+        # Construcción de parámetros
+        params = Params(
+            search_criteria= search_criteria,
+            fields= fields,
+            offset= offset,
+            limit= limit,
+        )
+
+        # Obtención de los datos a partir del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= 'search_read',
+            args= params.args,
+            kwargs= params.kwargs,
+        )
+
+        # Conversión en formato de salida configurado
+        converted_data = self._build_output(response, output, model= model)
+
+        return converted_data
+
+    async def search_count(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = []
+    ) -> int:
+        """
+        ## Conteo de una búsqueda
+        Versión asíncrona de `OdooAPIManager.search_count`.
+        >>> await odoo.search_count("sale.order", [("state", "=", "cancel")])
+        """
+
+        # Construcción de parámetros
+        params = Params(
+            search_criteria= search_criteria,
+        )
+
+        # Ejecución del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= 'search_count',
+            args= params.args,
+        )
+
+        return response
+
+    async def write(
+        self,
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        record_data: RecordData,
+    ) -> Literal[True]:
+        """
+        ## Actualización de registros
+        Versión asíncrona de `OdooAPIManager.write`.
+        >>> await odoo.write("sale.order", [52, 87, 129], {"state": "done"})
+        """
+
+        # Se acondiciona el valor de datos
+        record_ids = self._convert_to_list(record_ids)
+
+        # Construcción de parámetros
+        params = Params(
+            record_ids= record_ids,
+            records_data= record_data,
+        )
+
+        # Ejecución del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= 'write',
+            args= params.args,
+        )
+
+        return response
+
+    async def unlink(
+        self,
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+    ) -> Literal[True]:
+        """
+        ## Eliminación de registros
+        Versión asíncrona de `OdooAPIManager.unlink`.
+        >>> await odoo.unlink("sale.order", [52, 87, 129])
+        """
+
+        # Se acondiciona el valor de datos
+        record_ids = self._convert_to_list(record_ids)
+
+        # Construcción de parámetros
+        params = Params(
+            record_ids= record_ids,
+        )
+
+        # Ejecución del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= 'unlink',
+            args= params.args,
+        )
+
+        return response
+
+    async def execute(
+        self,
+        model: ModelName,
+        method: str,
+        record_ids: ListOrItem[RecordID],
+        kwargs: dict[str, SerializableValue] = {},
+    ) -> Literal[True]:
+        """
+        ## Ejecución de método de modelo
+        Versión asíncrona de `OdooAPIManager.execute`.
+        >>> await odoo.execute('sale.order', 'action_confirm', [15])
+        """
+
+        # Se acondiciona el valor de datos
+        record_ids = self._convert_to_list(record_ids)
+
+        # Construcción de parámetros
+        params = Params(
+            record_ids= record_ids,
+            kwargs= kwargs,
+        )
+
+        # Ejecución del método de solicitud al API
+        response = await self._request(
+            model= model,
+            method= method,
+            args= params.args,
+            kwargs= kwargs,
+        )
+
+        # Si un diccionario fue recibido...
+        if isinstance(response, dict):
+            # Se indica que la ejecución del método está fuera del alcance de la librería
+            raise NotImplementedError(
+                'Este método requiere una interacción de interfaz para ser ejecutado.\n'
+                'No se completó la ejecución.'
+            )
+
+        # Si un `True` fue recibido...
+        else:
+
+            return response
+
+    async def model_fields(
+        self,
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: OutputOptions | None = None,
+    ) -> pd.DataFrame | list[dict]:
+        """
+        ## Obtener información de los campos de un modelo
+        Versión asíncrona de `OdooAPIManager.model_fields`.
+        >>> await odoo.model_fields("sale.order")
+        """
+
+        # Criterio inicial de búsqueda
+        search_criteria: CriteriaStructure = [('model_id', '=', model)]
+
+        # Si se especificaron los campos, se rearma el criterio de búsqueda
+        if fields:
+            # Se interta el operador 'and' al principio de la lista
+            search_criteria.insert(0, '&')
+            # Se añade la tupla de coincidencia por nombre
+            search_criteria.append(('name', 'in', fields))
+
+        # Obtención de los datos a partir del método de solicitud al API
+        response = await self.search_read(
+            model= 'ir.model.fields',
+            search_criteria= search_criteria,
+            fields= attributes,
+            output= 'dict',
+        )
+
+        # Conversión en formato de salida configurado
+        converted_data = self._build_output(response, output, model= 'ir.model.fields')
+
+        return converted_data
+
+    async def _request(
+        self,
+        /,
+        model: ModelName,
+        method: APIMethods,
+        args: list,
+        kwargs: dict = {},
+    ):
+
+        # Autenticación en la primera solicitud
+        await self.connect()
+
+        # Criterio de búsqueda en forma canónica
+        args = self._normalize_args(method, args)
+
+        # Se realiza la solicitud al API
+        return await self._models.call(
+            'execute_kw',
+            # Base de datos de la API
+            self._credentials.db,
+            # ID del usuario
+            self._uid,
+            # Token del usuario
+            self._credentials.token,
+            # Modelo de Odoo
+            model,
+            # Método de solicitud
+            method,
+            # Args
+            args,
+            # Kwargs
+            kwargs,
+        )
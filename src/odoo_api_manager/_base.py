@@ -0,0 +1,170 @@
+from __future__ import annotations
+from typing import (
+    TYPE_CHECKING,
+    Generic,
+)
+from ._constants import SEARCH_METHODS
+from ._output import (
+    build_columns,
+    build_frame,
+    build_records,
+    build_table,
+    Record,
+    RecordTable,
+)
+from ._resources import (
+    Credentials,
+    normalize_criteria,
+)
+from ._templates import SESSION_INFO
+from ._typing.generics import (
+    _O,
+    _T,
+)
+from ._typing.literals import (
+    APIMethods,
+    ModelName,
+    OutputOptions,
+)
+from ._typing.misc import (
+    AltDatabaseArg,
+    ColumnData,
+    RecordData,
+    ListOrItem,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+class _OdooAPIBase(Generic[_O]):
+    """
+    ## Base de las conexiones al API de Odoo
+    Esta clase interna contiene la configuración y el formateo de salida
+    compartidos entre `OdooAPIManager` y `AsyncOdooAPIManager`. Las subclases
+    sólo implementan la forma en la que se realizan las solicitudes al API.
+    """
+
+    def __init__(
+        self,
+        alt_db: AltDatabaseArg | None,
+        default_output: OutputOptions,
+        pool_size: int,
+        timeout: float | None,
+        normalize: bool = False,
+    ) -> None:
+
+        # Obtención de las variables de entorno
+        self._credentials = Credentials(alt_db)
+        # Se configura el formato de salida de la información
+        self._default_output = default_output
+        # Cantidad máxima de conexiones simultáneas al API
+        self._pool_size = pool_size
+        # Tiempo máximo de espera de cada operación de red
+        self._timeout = timeout
+        # Normalización de los criterios de búsqueda antes de cada solicitud
+        self._normalize = normalize
+
+        # Inicialización de la información de la sesión
+        self._initialize_session_info()
+
+    def session_info(
+        self,
+    ) -> None:
+        """
+        ## Información de la sesión
+        Este método hace una impresión de la información de la sesión actual:
+        >>> odoo.session_info()
+        >>> # Base de datos: your-database-name
+        >>> # URL de origen: https://your-database-name.odoo.com
+        >>> # Usuario: username_api@example.com
+        >>> # Token de API: ****************************************
+        """
+        print(self._info)
+
+    def _build_output(
+        self,
+        response: list[RecordData],
+        output: OutputOptions | None,
+        field_types: dict[str, str] | None = None,
+        split_m2o: bool = False,
+        model: ModelName | None = None,
+    ) -> list[dict] | ColumnData | RecordTable | list[Record] | pd.DataFrame:
+        """
+        ## Formateo de salida
+        Este método interno formatea la salida de las funciones de lectura
+        desde el API de Odoo. Si se estableció un formato de salida en la
+        inicialización de la instancia, éste se mantiene. De lo contrario se
+        utiliza el formateo especificado en la ejecución de la función de
+        lectura. En caso de no haberlo se utiliza el formato de salida por
+        defecto que es Pandas DataFrame.
+
+        Si se proveen los tipos de campo de Odoo de las columnas, el
+        DataFrame se construye con tipos de datos de Pandas en lugar de
+        `object`, y con `split_m2o` las columnas `many2one` se separan en
+        columnas de ID y nombre.
+
+        Los formatos `tuples` y `records` son formatos compactos en memoria:
+        una tabla de encabezado y tuplas, y una lista de registros de la
+        clase con `__slots__` generada para el modelo.
+        """
+
+        # Formato de salida resultante
+        output = output or self._default_output
+
+        # Construcción de DataFrame
+        if output == 'dataframe':
+            return build_frame(response, field_types, split_m2o)
+        # Construcción de columnas
+        if output == 'columns':
+            return build_columns(response)
+        # Construcción de tabla de tuplas
+        if output == 'tuples':
+            return build_table(response)
+        # Construcción de registros compactos
+        if output == 'records':
+            return build_records(response, model)
+
+        # Retorno de información en lista de diccionarios
+        return response
+
+    def _normalize_args(
+        self,
+        method: APIMethods,
+        args: list,
+    ) -> list:
+        """
+        ### Normalización del criterio de búsqueda
+        Este método interno reemplaza el criterio de búsqueda de los métodos
+        de búsqueda por su forma canónica si la instancia normaliza los
+        criterios de búsqueda.
+        """
+
+        if not self._normalize or method not in SEARCH_METHODS or not args:
+            return args
+
+        return [normalize_criteria(args[0]), *args[1:]]
+
+    def _convert_to_list(
+        self,
+        items: ListOrItem[_T]
+    ) -> list[_T]:
+
+        # Revisión de si el elemento proporcionado no es una lista
+        if not isinstance(items, list):
+            items = [items]
+
+        return items
+
+    def _initialize_session_info(
+        self,
+    ) -> None:
+
+        self._info =  (
+            SESSION_INFO
+            .format(**{
+                'api_db': self._credentials.db,
+                'url': self._credentials.url,
+                'username': self._credentials.username,
+                'token': len(self._credentials.token) * '*',
+            })
+        )
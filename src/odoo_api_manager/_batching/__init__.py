@@ -0,0 +1,2 @@
+from ._async_batch import AsyncReadBatcher
+from ._batch import ReadBatch
@@ -0,0 +1,98 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from .._typing.aliases import RecordID
+from .._typing.literals import ModelName
+from .._typing.misc import (
+    ModelField,
+    RecordData,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+    from .._async import AsyncOdooAPIManager
+
+class AsyncReadBatcher():
+    """
+    ## Agrupador asíncrono de lecturas
+    Esta clase agrupa las lecturas de registros individuales solicitadas en
+    una misma iteración del event loop (por ejemplo, con `asyncio.gather`) y
+    las envía al API como una sola lectura por modelo y conjunto de campos.
+    Cada solicitud recibe su propio registro.
+    """
+
+    def __init__(
+        self,
+        odoo: AsyncOdooAPIManager,
+    ) -> None:
+
+        # Instancia de conexión al API
+        self._odoo = odoo
+        # Solicitudes pendientes por modelo y conjunto de campos, y por ID
+        self._pending: dict[tuple[ModelName, tuple[ModelField, ...]], dict[RecordID, list[asyncio.Future]]] = {}
+        # Lecturas en curso. Se mantiene una referencia para que no se
+        # descarten antes de terminar
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(
+        self,
+        model: ModelName,
+        record_id: RecordID,
+        fields: list[ModelField],
+    ) -> asyncio.Future[RecordData | None]:
+        """
+        ### Solicitud de un registro
+        Este método retorna un future con el registro leído (`None` si el
+        registro no existe). Las lecturas se envían en la siguiente
+        iteración del event loop.
+        """
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = ( model, tuple(sorted(set(fields))) )
+
+        # La primera solicitud de la iteración programa el envío del lote
+        if not self._pending:
+            loop.call_soon(self._dispatch)
+
+        self._pending.setdefault(key, {}).setdefault(record_id, []).append(future)
+
+        return future
+
+    def _dispatch(
+        self,
+    ) -> None:
+
+        import asyncio
+
+        # Se toman las solicitudes pendientes para que las nuevas formen otro lote
+        ( pending, self._pending ) = ( self._pending, {} )
+
+        for ( key, futures ) in pending.items():
+            task = asyncio.ensure_future(self._read(key, futures))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _read(
+        self,
+        key: tuple[ModelName, tuple[ModelField, ...]],
+        futures: dict[RecordID, list[asyncio.Future]],
+    ) -> None:
+
+        ( model, fields ) = key
+
+        try:
+            response = await self._odoo.read(model, list(futures), list(fields), output= 'dict')
+        except Exception as error:
+            # El error se entrega a cada solicitud
+            for future in (future for group in futures.values() for future in group):
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        records = {record['id']: record for record in response}
+        for ( record_id, group ) in futures.items():
+            for future in group:
+                if not future.done():
+                    future.set_result(records.get(record_id))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from .._typing.aliases import RecordID
+from .._typing.literals import ModelName
+from .._typing.misc import (
+    ModelField,
+    RecordData,
+)
+
+if TYPE_CHECKING:
+    from .._main import OdooAPIManager
+
+class ReadBatch():
+    """
+    ## Lote de lecturas
+    Esta clase carga por adelantado los registros de los que se van a
+    obtener valores con `get_value` y `get_values`. La primera vez que se
+    solicita un conjunto de campos de un modelo, éstos se leen de todas las
+    IDs precargadas del modelo en una sola lectura, y las solicitudes
+    siguientes se sirven desde el lote sin consultar al API. Las IDs no
+    precargadas no pueden agruparse, ya que su valor se retorna al
+    solicitarse.
+
+    Se crea con `OdooAPIManager.batching()`:
+    >>> with odoo.batching(prefetch={'product.template': ids}):
+    >>>     prices = [odoo.get_value('product.template', id, 'list_price') for id in ids]
+    """
+
+    def __init__(
+        self,
+        odoo: OdooAPIManager,
+    ) -> None:
+
+        # Instancia de conexión al API
+        self._odoo = odoo
+        # IDs precargadas por modelo, en orden de registro
+        self._ids: dict[ModelName, dict[RecordID, None]] = {}
+        # Registros leídos por modelo y conjunto de campos, y por ID. Los
+        # registros inexistentes se guardan como `None`
+        self._loaded: dict[tuple[ModelName, tuple[ModelField, ...]], dict[RecordID, RecordData | None]] = {}
+
+    def prefetch(
+        self,
+        model: ModelName,
+        record_ids: list[RecordID],
+    ) -> None:
+        """
+        ### Registro de IDs a precargar
+        Las IDs se leen junto con las demás IDs del modelo la siguiente vez
+        que se solicite un conjunto de campos que aún no se ha leído de
+        ellas.
+        """
+
+        self._ids.setdefault(model, {}).update(dict.fromkeys(record_ids))
+
+    def get(
+        self,
+        model: ModelName,
+        record_id: RecordID,
+        fields: list[ModelField],
+    ) -> RecordData | None:
+        """
+        ### Obtención de un registro
+        Este método retorna el registro con los campos provistos (`None` si
+        el registro no existe). Si el registro aún no se ha leído con estos
+        campos, se leen en una sola lectura la ID provista y todas las IDs
+        precargadas del modelo que tampoco se han leído. Las IDs no
+        precargadas se registran al solicitarse, por lo que se vuelven a
+        servir desde el lote con otros conjuntos de campos.
+        """
+
+        # Las IDs solicitadas se añaden a las IDs del modelo
+        ids = self._ids.setdefault(model, {})
+        ids.setdefault(record_id)
+
+        key = ( model, tuple(sorted(set(fields))) )
+        loaded = self._loaded.setdefault(key, {})
+
+        if record_id not in loaded:
+            # Lectura de las IDs del modelo pendientes con estos campos
+            missing = [pending_id for pending_id in ids if pending_id not in loaded]
+            [ response ] = self._odoo._read_many([( model, missing, list(key[1]) )])
+            records = {record['id']: record for record in response}
+            for pending_id in missing:
+                loaded[pending_id] = records.get(pending_id)
+
+        return loaded[record_id]
+
+    def invalidate(
+        self,
+        model: ModelName,
+    ) -> None:
+        """
+        ### Descarte de registros leídos
+        Este método descarta los registros leídos del modelo para que se
+        vuelvan a leer en la siguiente solicitud. Las IDs precargadas se
+        conservan.
+        """
+
+        for key in [key for key in self._loaded if key[0] == model]:
+            del self._loaded[key]
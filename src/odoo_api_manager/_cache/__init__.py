@@ -0,0 +1,11 @@
+from ._files import (
+    dump_json,
+    load_json,
+)
+from ._paths import default_cache_dir
+from ._records import PersistentReadCache
+from ._response import (
+    CacheInfo,
+    ResponseCache,
+)
+from ._uid import UIDCache
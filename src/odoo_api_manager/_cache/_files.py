@@ -0,0 +1,45 @@
+import json
+import os
+from pathlib import Path
+
+def load_json(
+    path: Path,
+) -> dict:
+    """
+    ## Lectura de un archivo JSON de caché
+    Si el archivo no existe o está dañado se considera vacío.
+    """
+
+    try:
+        with open(path, encoding= 'utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+def dump_json(
+    path: Path,
+    data: dict,
+) -> None:
+    """
+    ## Escritura de un archivo JSON de caché
+    El archivo se escribe en un archivo temporal y se reemplaza de forma
+    atómica, por lo que puede compartirse entre procesos.
+    """
+
+    # Creación del directorio de caché
+    path.parent.mkdir(parents= True, exist_ok= True)
+
+    # Importación perezosa ya que sólo se usa al escribir la caché
+    import tempfile
+
+    # Escritura en un archivo temporal y reemplazo atómico del archivo
+    ( fd, temp_path ) = tempfile.mkstemp(dir= path.parent, prefix= f'.{path.stem}-')
+    try:
+        with os.fdopen(fd, 'w', encoding= 'utf-8') as file:
+            json.dump(data, file)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
@@ -0,0 +1,14 @@
+import os
+from pathlib import Path
+
+def default_cache_dir() -> Path:
+    """
+    ## Directorio de caché
+    Esta función retorna el directorio donde se guardan los archivos de
+    caché de la librería. Se respeta la variable de entorno
+    `XDG_CACHE_HOME` y de lo contrario se usa `~/.cache`.
+    """
+
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+
+    return Path(base) / 'odoo_api_manager'
@@ -0,0 +1,196 @@
+from __future__ import annotations
+import json
+import os
+import threading
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+)
+from ._paths import default_cache_dir
+
+if TYPE_CHECKING:
+    import sqlite3
+
+class PersistentReadCache():
+    """
+    ## Caché persistente de registros
+    Esta clase guarda en una base de datos SQLite los registros leídos desde
+    el API junto con su fecha de última modificación (`write_date`), de modo
+    que sobreviven al reinicio del proceso y pueden compartirse entre
+    procesos.
+
+    Cada registro se guarda bajo la base de datos, el modelo, la ID y una
+    llave de lectura que representa los campos y el contexto solicitados,
+    por lo que lecturas con campos distintos no se mezclan.
+    """
+
+    _SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS records ('
+        'db TEXT NOT NULL, '
+        'model TEXT NOT NULL, '
+        'read_key TEXT NOT NULL, '
+        'id INTEGER NOT NULL, '
+        'write_date TEXT, '
+        'data TEXT NOT NULL, '
+        'PRIMARY KEY (db, model, read_key, id))'
+    )
+
+    # Cantidad máxima de parámetros por consulta en SQLite
+    _MAX_VARIABLES = 900
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+    ) -> None:
+
+        # Ruta del archivo de caché
+        self.path = Path(path) if path else default_cache_dir() / 'records.sqlite3'
+        # Conexión a la base de datos. Se abre hasta su primer uso
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        db: str,
+        model: str,
+        read_key: str,
+        record_ids: Iterable[int],
+    ) -> dict[int, tuple[Any, dict]]:
+        """
+        ### Obtención de registros
+        Este método retorna un diccionario con la fecha de modificación y los
+        datos de cada registro guardado de las IDs provistas.
+        """
+
+        record_ids = list(record_ids)
+        found = {}
+
+        with self._lock:
+            connection = self._connect()
+            # Consulta por bloques para no exceder el límite de parámetros
+            for start in range(0, len(record_ids), self._MAX_VARIABLES):
+                chunk = record_ids[start:start + self._MAX_VARIABLES]
+                rows = connection.execute(
+                    'SELECT id, write_date, data FROM records '
+                    'WHERE db = ? AND model = ? AND read_key = ? '
+                    f'AND id IN ({", ".join("?" * len(chunk))})',
+                    [db, model, read_key, *chunk],
+                )
+                for ( record_id, write_date, data ) in rows:
+                    found[record_id] = ( json.loads(write_date), json.loads(data) )
+
+        return found
+
+    def set(
+        self,
+        db: str,
+        model: str,
+        read_key: str,
+        records: Iterable[tuple[Any, dict]],
+    ) -> None:
+        """
+        ### Guardado de registros
+        Este método recibe tuplas de fecha de modificación y datos del
+        registro, y reemplaza las versiones guardadas previamente.
+        """
+
+        rows = [
+            (db, model, read_key, record['id'], json.dumps(write_date), json.dumps(record))
+            for ( write_date, record ) in records
+        ]
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    'INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?)',
+                    rows,
+                )
+
+    def delete(
+        self,
+        db: str,
+        model: str,
+        record_ids: Iterable[int],
+    ) -> None:
+        """
+        ### Eliminación de registros
+        Este método elimina los registros provistos en todas sus llaves de
+        lectura.
+        """
+
+        record_ids = list(record_ids)
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for start in range(0, len(record_ids), self._MAX_VARIABLES):
+                    chunk = record_ids[start:start + self._MAX_VARIABLES]
+                    connection.execute(
+                        'DELETE FROM records WHERE db = ? AND model = ? '
+                        f'AND id IN ({", ".join("?" * len(chunk))})',
+                        [db, model, *chunk],
+                    )
+
+    def clear(
+        self,
+        db: str | None = None,
+        model: str | None = None,
+    ) -> None:
+        """
+        ### Limpieza de la caché
+        Este método elimina los registros de la base de datos y el modelo
+        provistos, o todos los registros si no se provee ninguno.
+        """
+
+        conditions = {'db': db, 'model': model}
+        conditions = {k: v for ( k, v ) in conditions.items() if v is not None}
+        where = ' AND '.join(f'{k} = ?' for k in conditions)
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    f'DELETE FROM records{" WHERE " + where if where else ""}',
+                    list(conditions.values()),
+                )
+
+    def close(
+        self,
+    ) -> None:
+        """
+        ### Cierre de la conexión
+        La conexión se vuelve a abrir automáticamente en el siguiente uso.
+        """
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(
+        self,
+    ) -> sqlite3.Connection:
+
+        # Si la conexión ya está abierta se reutiliza
+        if self._connection is not None:
+            return self._connection
+
+        # Importación perezosa ya que sólo se usa con la caché activa
+        import sqlite3
+
+        # Creación del directorio de caché
+        self.path.parent.mkdir(parents= True, exist_ok= True)
+
+        # Apertura de la conexión. El candado de la instancia serializa su
+        # uso entre hilos
+        connection = sqlite3.connect(self.path, timeout= 30, check_same_thread= False)
+        # Modo WAL para permitir lecturas mientras otro proceso escribe
+        connection.execute('PRAGMA journal_mode=WAL')
+        with connection:
+            connection.execute(self._SCHEMA)
+        self._connection = connection
+
+        return connection
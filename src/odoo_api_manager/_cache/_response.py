@@ -0,0 +1,207 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    NamedTuple,
+)
+
+class CacheInfo(NamedTuple):
+    """
+    ## Estadísticas de la caché de respuestas
+    """
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    ttl: float
+
+class _Entry(NamedTuple):
+    expires_at: float
+    model: str
+    value: Any
+
+class ResponseCache():
+    """
+    ## Caché de respuestas en memoria
+    Esta clase guarda respuestas del API con un tiempo de vida (`ttl`, en
+    segundos) y una cantidad máxima de entradas. Al alcanzarse el máximo se
+    descarta la entrada usada hace más tiempo (LRU).
+
+    Las llaves se construyen a partir de la base de datos, el modelo, el
+    método y los argumentos de la solicitud, normalizados para que
+    solicitudes equivalentes compartan la misma entrada. Las entradas se
+    pueden invalidar por modelo.
+
+    Las respuestas se copian al guardarse y al obtenerse, por lo que
+    modificar una respuesta retornada no altera la caché. Es segura para
+    usarse entre hilos.
+
+    Cada invalidación incrementa la generación del modelo. Una respuesta
+    solicitada antes de una invalidación y recibida después de ésta puede
+    ser anterior a la modificación que la causó, por lo que se descarta si
+    la generación capturada al iniciar la solicitud ya no es la vigente:
+    >>> generation = cache.generation(model)
+    >>> response = fetch()
+    >>> cache.set(key, model, response, generation)
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int,
+    ) -> None:
+
+        # Validación de parámetros
+        if ttl <= 0:
+            raise ValueError('El tiempo de vida de la caché debe ser mayor a 0.')
+        if maxsize < 1:
+            raise ValueError('El tamaño de la caché debe ser de al menos 1.')
+
+        # Se guardan los valores
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        # Entradas en orden de uso, de la menos a la más reciente
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # Llaves de las entradas de cada modelo
+        self._model_keys: dict[str, set[str]] = {}
+        # Generación de cada modelo y de la caché completa. Se incrementan en
+        # cada invalidación
+        self._generations: dict[str, int] = {}
+        self._generation = 0
+        # Contadores
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def build_key(
+        self,
+        db: str,
+        model: str,
+        method: str,
+        args: list,
+        kwargs: dict,
+    ) -> str:
+        """
+        ### Construcción de llave
+        Las tuplas y las listas se serializan igual y las llaves de los
+        diccionarios se ordenan, por lo que solicitudes equivalentes generan
+        la misma llave.
+        """
+
+        return json.dumps([db, model, method, args, kwargs], sort_keys= True, default= repr)
+
+    def get(
+        self,
+        key: str,
+    ) -> tuple[bool, Any]:
+        """
+        ### Obtención de una respuesta
+        Retorna una tupla que indica si se encontró una entrada vigente y la
+        respuesta guardada.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            # Si no existe la entrada o ésta venció...
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    self._discard(key)
+                self._misses += 1
+                return ( False, None )
+
+            # Se marca la entrada como la más reciente
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry.value
+
+        return ( True, copy.deepcopy(value) )
+
+    def generation(
+        self,
+        model: str,
+    ) -> tuple[int, int]:
+        """
+        ### Generación vigente de un modelo
+        Se captura antes de realizar la solicitud cuya respuesta se va a
+        guardar.
+        """
+
+        with self._lock:
+            return ( self._generation, self._generations.get(model, 0) )
+
+    def set(
+        self,
+        key: str,
+        model: str,
+        value: Any,
+        generation: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        ### Guardado de una respuesta
+        Si se provee la generación capturada al iniciar la solicitud y el
+        modelo se invalidó desde entonces, la respuesta no se guarda.
+        """
+
+        # Copia del valor fuera del candado
+        entry = _Entry(time.monotonic() + self.ttl, model, copy.deepcopy(value))
+
+        with self._lock:
+            # La respuesta pudo obtenerse antes de la invalidación
+            if generation is not None and generation != ( self._generation, self._generations.get(model, 0) ):
+                return
+
+            # Se guarda la entrada como la más reciente
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._model_keys.setdefault(model, set()).add(key)
+
+            # Se descartan las entradas usadas hace más tiempo
+            while len(self._entries) > self.maxsize:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate(
+        self,
+        model: str | None = None,
+    ) -> None:
+        """
+        ### Invalidación de entradas
+        Descarta las entradas del modelo provisto, o todas las entradas si no
+        se provee un modelo.
+        """
+
+        with self._lock:
+            if model is None:
+                self._generation += 1
+                self._entries.clear()
+                self._model_keys.clear()
+            else:
+                self._generations[model] = self._generations.get(model, 0) + 1
+                for key in self._model_keys.pop(model, ()):
+                    self._entries.pop(key, None)
+
+    def info(
+        self,
+    ) -> CacheInfo:
+        """
+        ### Estadísticas de la caché
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries), self.maxsize, self.ttl)
+
+    def _discard(
+        self,
+        key: str,
+    ) -> None:
+
+        # Eliminación de la entrada y de su referencia en el modelo
+        entry = self._entries.pop(key)
+        keys = self._model_keys.get(entry.model)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._model_keys[entry.model]
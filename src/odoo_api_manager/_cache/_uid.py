@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from ._files import (
+    dump_json,
+    load_json,
+)
+from ._paths import default_cache_dir
+
+class UIDCache():
+    """
+    ## Caché de IDs de usuario
+    Esta clase guarda en disco la ID de usuario obtenida en la autenticación
+    con el API para que otros procesos puedan reutilizarla sin realizar la
+    solicitud de autenticación.
+
+    Cada ID se guarda bajo una llave construida a partir de la URL, la base
+    de datos, el nombre de usuario y un hash del token, por lo que el token
+    nunca se escribe en disco y un cambio de token invalida la entrada.
+
+    El archivo se reemplaza de forma atómica en cada escritura, por lo que
+    puede compartirse entre procesos.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+    ) -> None:
+
+        # Ruta del archivo de caché
+        self.path = Path(path) if path else default_cache_dir() / 'uids.json'
+
+    def get(
+        self,
+        url: str,
+        db: str,
+        username: str,
+        token: str,
+    ) -> int | None:
+        """
+        ### Obtención de una ID de usuario
+        Este método retorna la ID de usuario guardada o `None` si no existe.
+        """
+
+        return self._load().get(self._build_key(url, db, username, token))
+
+    def set(
+        self,
+        url: str,
+        db: str,
+        username: str,
+        token: str,
+        uid: int,
+    ) -> None:
+        """
+        ### Guardado de una ID de usuario
+        """
+
+        # Lectura de las entradas existentes y adición de la nueva entrada
+        entries = self._load()
+        entries[self._build_key(url, db, username, token)] = uid
+        self._dump(entries)
+
+    def delete(
+        self,
+        url: str,
+        db: str,
+        username: str,
+        token: str,
+    ) -> None:
+        """
+        ### Eliminación de una ID de usuario
+        """
+
+        # Lectura de las entradas existentes y eliminación de la entrada
+        entries = self._load()
+        if entries.pop(self._build_key(url, db, username, token), None) is not None:
+            self._dump(entries)
+
+    def _build_key(
+        self,
+        url: str,
+        db: str,
+        username: str,
+        token: str,
+    ) -> str:
+
+        # Hash del token para no guardarlo en disco
+        token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+        return hashlib.sha256(
+            json.dumps([url, db, username, token_hash]).encode('utf-8')
+        ).hexdigest()
+
+    def _load(
+        self,
+    ) -> dict[str, int]:
+
+        return load_json(self.path)
+
+    def _dump(
+        self,
+        entries: dict[str, int],
+    ) -> None:
+
+        dump_json(self.path, entries)
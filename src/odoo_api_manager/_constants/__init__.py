@@ -1,3 +1,13 @@
+from ._fault_codes import ACCESS_FAULT_CODES
+from ._field_types import (
+    HEAVY_FIELD_TYPES,
+    X2MANY_FIELD_TYPES,
+)
+from ._methods import (
+    CACHEABLE_METHODS,
+    READ_ONLY_METHODS,
+    SEARCH_METHODS,
+)
 from ._variable_names import (
     VAR_PREFIX,
     VARIABLE_NAME,
@@ -0,0 +1,7 @@
+ACCESS_FAULT_CODES = (3,)
+"""
+Códigos de error XML-RPC de Odoo por acceso denegado (`AccessDenied`), que
+indican credenciales o una ID de usuario inválidas. Los errores de acceso a
+registros (`AccessError`, código 4) se deben a permisos del usuario y no se
+resuelven volviendo a autenticar.
+"""
@@ -0,0 +1,10 @@
+HEAVY_FIELD_TYPES = frozenset({'binary', 'html'})
+"""
+Tipos de campo cuyos valores suelen ser grandes (imágenes, adjuntos y
+cuerpos HTML) y que se omiten en la proyección ligera.
+"""
+
+X2MANY_FIELD_TYPES = frozenset({'one2many', 'many2many'})
+"""
+Tipos de campo cuyos valores son listas de IDs de registros relacionados.
+"""
@@ -0,0 +1,15 @@
+CACHEABLE_METHODS = frozenset({'read', 'search_read', 'search_count'})
+"""
+Métodos del API cuyas respuestas pueden guardarse en caché.
+"""
+
+READ_ONLY_METHODS = CACHEABLE_METHODS | {'search', 'check_access_rights'}
+"""
+Métodos del API que no modifican registros y por lo tanto no invalidan la
+caché del modelo.
+"""
+
+SEARCH_METHODS = frozenset({'search', 'search_read', 'search_count'})
+"""
+Métodos del API cuyo primer argumento es un criterio de búsqueda.
+"""
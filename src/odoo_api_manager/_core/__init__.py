@@ -1 +1 @@
-from ._env import env
+from ._env import get_env
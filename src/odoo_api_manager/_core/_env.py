@@ -1,5 +1,22 @@
-from dotenvironment import DotEnvironment
+from __future__ import annotations
+from functools import cache
+from typing import TYPE_CHECKING
 from .._constants import VAR_PREFIX
 
-# Inicialización de variables de entorno
-env = DotEnvironment(VAR_PREFIX)
+if TYPE_CHECKING:
+    from dotenvironment import DotEnvironment
+
+@cache
+def get_env() -> DotEnvironment:
+    """
+    ## Variables de entorno
+    Esta función retorna la instancia de variables de entorno de la librería.
+    La carga del archivo `.env` se realiza hasta el primer uso y no al
+    importar la librería.
+    """
+
+    # Importación perezosa ya que ésta carga el archivo `.env`
+    from dotenvironment import DotEnvironment
+
+    # Inicialización de variables de entorno
+    return DotEnvironment(VAR_PREFIX)
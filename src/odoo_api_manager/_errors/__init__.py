@@ -1 +1,4 @@
-from ._main import DatabaseNotDefinedError
+from ._main import (
+    DatabaseNotDefinedError,
+    InvalidCriteriaError,
+)
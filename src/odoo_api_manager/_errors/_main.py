@@ -1,2 +1,5 @@
 class DatabaseNotDefinedError(Exception):
     ...
+
+class InvalidCriteriaError(ValueError):
+    ...
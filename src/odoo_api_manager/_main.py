@@ -1,46 +1,100 @@
-import pandas as pd
+from __future__ import annotations
+import json
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from operator import itemgetter
 from xmlrpc import client
 from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterator,
     Literal,
-    Generic,
     Optional,
     overload,
 )
+from ._base import _OdooAPIBase
+from ._batching import ReadBatch
+from ._constants import (
+    ACCESS_FAULT_CODES,
+    CACHEABLE_METHODS,
+    READ_ONLY_METHODS,
+    X2MANY_FIELD_TYPES,
+)
+from ._cache import (
+    CacheInfo,
+    PersistentReadCache,
+    ResponseCache,
+    UIDCache,
+)
+from ._metadata import (
+    FieldCost,
+    measure_field_costs,
+    MetadataRegistry,
+)
+from ._output import (
+    build_columns,
+    build_frame,
+    explode_x2many,
+    extract_many2one,
+    merge_related,
+    open_writer,
+    Record,
+    RecordTable,
+    related_ids,
+    resolve_export_format,
+    take_columns,
+)
 from ._resources import (
-    Credentials,
+    and_criteria,
+    BatchFailure,
+    BulkResult,
     Params,
 )
 from ._settings import (
     PRESETS,
 )
 from ._templates import (
-    SESSION_INFO,
     XMLRPC_COMMON,
     XMLRPC_OBJECT,
 )
+from ._transport import (
+    create_proxy,
+    ProxyPool,
+)
 from ._typing.aliases import RecordID
-from ._typing.callables import SeriesApply
 from ._typing.criteria_structure import CriteriaStructure
 from ._typing.generics import (
     _O,
+    _R,
     _T,
 )
 from ._typing.literals import (
     AccessRights,
     APIMethods,
+    ExportFormat,
     FieldFields,
     ModelName,
     OutputOptions,
+    PaginationMode,
 )
 from ._typing.misc import (
+    ColumnData,
     RecordData,
     ListOrItem,
     ModelField,
-    NullableMany2One,
     SerializableValue,
 )
 
-class OdooAPIManager(Generic[_O]):
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor
+
+class OdooAPIManager(_OdooAPIBase[_O]):
     """
     # Conexión al API de Odoo
     Creador de una conexión con el sistema de Odoo a través del API. Puede ser
@@ -66,6 +120,85 @@ class OdooAPIManager(Generic[_O]):
     ODOO_API_DB = your-database-name
     ODOO_API_TEST_DB = your-database-name-test
     ```
+
+    Una misma instancia puede usarse desde varios hilos simultáneamente. Las
+    solicitudes se reparten en un pool de conexiones persistentes cuyo tamaño
+    se configura en el argumento `pool_size`:
+    >>> odoo = OdooAPIManager(pool_size=8)
+
+    Por defecto las solicitudes esperan indefinidamente, ya que lecturas
+    grandes o acciones lentas del servidor pueden tardar varios minutos. Con
+    el argumento `timeout` cada operación de red de una solicitud (conexión,
+    envío y lectura de la respuesta) espera como máximo los segundos
+    provistos antes de lanzar `TimeoutError`:
+    >>> odoo = OdooAPIManager(timeout=30)
+
+    Por defecto la autenticación se realiza al crear la instancia. Con el
+    argumento `lazy` ésta se pospone hasta la primera solicitud al API, por lo
+    que los procesos que terminan sin realizar solicitudes no pagan su costo:
+    >>> odoo = OdooAPIManager(lazy=True)
+
+    Con el argumento `uid_cache` la ID de usuario obtenida en la autenticación
+    se guarda en disco y se reutiliza en otros procesos, omitiendo la
+    solicitud de autenticación. Si una solicitud falla por acceso denegado
+    la ID se renueva automáticamente:
+    >>> odoo = OdooAPIManager(uid_cache=True)
+
+    Con el argumento `cache` las respuestas de `read`, `search_read` y
+    `search_count` se guardan en memoria durante `cache_ttl` segundos, hasta
+    un máximo de `cache_size` entradas. Cualquier solicitud que modifica
+    registros de un modelo descarta las respuestas guardadas de ese modelo:
+    >>> odoo = OdooAPIManager(cache=True, cache_ttl=300)
+
+    Con el argumento `read_cache` los registros obtenidos con `read` y
+    `search_read` se guardan en disco y sobreviven al reinicio del proceso.
+    Cada lectura se revalida con una sola búsqueda de la fecha de
+    modificación de los registros y sólo se leen los registros que
+    cambiaron:
+    >>> odoo = OdooAPIManager(read_cache=True)
+
+    Las definiciones de los campos de cada modelo se cargan una sola vez en
+    el registro de metadatos `odoo.metadata`. Con el argumento
+    `metadata_cache` éstas también se guardan en disco y se reutilizan
+    mientras la versión del servidor no cambie:
+    >>> odoo = OdooAPIManager(metadata_cache=True)
+
+    Con el argumento `typed` los DataFrames se construyen con tipos de datos
+    de Pandas a partir del tipo de cada campo en Odoo (fechas, categorías,
+    números y booleanos con nulos) en lugar de `object`:
+    >>> odoo = OdooAPIManager(typed=True)
+
+    Con el argumento `split_m2o` cada columna `many2one` de los DataFrames se
+    reemplaza por las columnas `<campo>_id` y `<campo>_name`:
+    >>> odoo = OdooAPIManager(split_m2o=True)
+
+    Con el argumento `lean` las lecturas sin campos especificados solicitan
+    sólo los campos almacenados del modelo, omitiendo los campos calculados
+    no almacenados y los campos `binary` y `html`. El costo de cada campo en
+    las respuestas puede consultarse con `field_costs`:
+    >>> odoo = OdooAPIManager(lean=True)
+
+    Con el argumento `normalize_criteria` los criterios de búsqueda se
+    validan y se convierten en su forma canónica antes de cada solicitud, por
+    lo que criterios equivalentes comparten la misma entrada de la caché de
+    respuestas:
+    >>> odoo = OdooAPIManager(normalize_criteria=True)
+
+    Con el formato de salida `columns` las lecturas retornan un diccionario
+    con los valores de cada campo, como arreglos de NumPy en las columnas
+    numéricas y booleanas o como listas en las demás columnas:
+    >>> odoo.read("sale.order", [52, 87], ["amount_total"], output='columns')
+    >>> # {'id': array([52, 87]), 'amount_total': array([1250. ,  830.5])}
+
+    Los formatos de salida `tuples` y `records` ocupan una fracción de la
+    memoria de una lista de diccionarios. `tuples` retorna una tabla con un
+    solo encabezado y una tupla por registro, y `records` retorna registros
+    de una clase con `__slots__` generada por modelo que se consultan como
+    diccionarios:
+    >>> odoo.read("sale.order", [52, 87], ["name"], output='tuples')[0, 'name']
+    >>> # 'S00052'
+    >>> odoo.read("sale.order", [52, 87], ["name"], output='records')[0]['name']
+    >>> # 'S00052'
     ----
     # Métodos disponibles
     ## Permisos de acceso
@@ -289,6 +422,19 @@ class OdooAPIManager(Generic[_O]):
         self: "OdooAPIManager[Literal['dataframe']]",
         alt_db: Optional[bool | str] = None,
         default_output: Optional[Literal['dataframe']] = 'dataframe',
+        pool_size: int = PRESETS.POOL_SIZE,
+        timeout: float | None = None,
+        lazy: bool = False,
+        uid_cache: bool | str = False,
+        cache: bool = False,
+        cache_ttl: float = PRESETS.CACHE_TTL,
+        cache_size: int = PRESETS.CACHE_SIZE,
+        read_cache: bool | str = False,
+        metadata_cache: bool | str = False,
+        typed: bool = False,
+        split_m2o: bool = False,
+        lean: bool = False,
+        normalize_criteria: bool = False,
     ) -> None:
         ...
     @overload
@@ -296,6 +442,79 @@ class OdooAPIManager(Generic[_O]):
         self: "OdooAPIManager[Literal['dict']]",
         alt_db: Optional[bool | str] = None,
         default_output: Literal['dict'] = 'dict',
+        pool_size: int = PRESETS.POOL_SIZE,
+        timeout: float | None = None,
+        lazy: bool = False,
+        uid_cache: bool | str = False,
+        cache: bool = False,
+        cache_ttl: float = PRESETS.CACHE_TTL,
+        cache_size: int = PRESETS.CACHE_SIZE,
+        read_cache: bool | str = False,
+        metadata_cache: bool | str = False,
+        typed: bool = False,
+        split_m2o: bool = False,
+        lean: bool = False,
+        normalize_criteria: bool = False,
+    ) -> None:
+        ...
+    @overload
+    def __init__(
+        self: "OdooAPIManager[Literal['columns']]",
+        alt_db: Optional[bool | str] = None,
+        default_output: Literal['columns'] = 'columns',
+        pool_size: int = PRESETS.POOL_SIZE,
+        timeout: float | None = None,
+        lazy: bool = False,
+        uid_cache: bool | str = False,
+        cache: bool = False,
+        cache_ttl: float = PRESETS.CACHE_TTL,
+        cache_size: int = PRESETS.CACHE_SIZE,
+        read_cache: bool | str = False,
+        metadata_cache: bool | str = False,
+        typed: bool = False,
+        split_m2o: bool = False,
+        lean: bool = False,
+        normalize_criteria: bool = False,
+    ) -> None:
+        ...
+    @overload
+    def __init__(
+        self: "OdooAPIManager[Literal['tuples']]",
+        alt_db: Optional[bool | str] = None,
+        default_output: Literal['tuples'] = 'tuples',
+        pool_size: int = PRESETS.POOL_SIZE,
+        timeout: float | None = None,
+        lazy: bool = False,
+        uid_cache: bool | str = False,
+        cache: bool = False,
+        cache_ttl: float = PRESETS.CACHE_TTL,
+        cache_size: int = PRESETS.CACHE_SIZE,
+        read_cache: bool | str = False,
+        metadata_cache: bool | str = False,
+        typed: bool = False,
+        split_m2o: bool = False,
+        lean: bool = False,
+        normalize_criteria: bool = False,
+    ) -> None:
+        ...
+    @overload
+    def __init__(
+        self: "OdooAPIManager[Literal['records']]",
+        alt_db: Optional[bool | str] = None,
+        default_output: Literal['records'] = 'records',
+        pool_size: int = PRESETS.POOL_SIZE,
+        timeout: float | None = None,
+        lazy: bool = False,
+        uid_cache: bool | str = False,
+        cache: bool = False,
+        cache_ttl: float = PRESETS.CACHE_TTL,
+        cache_size: int = PRESETS.CACHE_SIZE,
+        read_cache: bool | str = False,
+        metadata_cache: bool | str = False,
+        typed: bool = False,
+        split_m2o: bool = False,
+        lean: bool = False,
+        normalize_criteria: bool = False,
     ) -> None:
         ...
     @overload
@@ -305,6 +524,8 @@ class OdooAPIManager(Generic[_O]):
         record_ids: ListOrItem[RecordID],
         fields: Optional[list[ModelField]] = None,
         output: Optional[Literal['dataframe']] = None,
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ) -> pd.DataFrame:
         ...
     @overload
@@ -314,6 +535,8 @@ class OdooAPIManager(Generic[_O]):
         record_ids: ListOrItem[RecordID],
         fields: Optional[list[ModelField]] = None,
         output: Literal['dict'] = None,
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ) -> list[RecordData]:
         ...
     @overload
@@ -323,6 +546,8 @@ class OdooAPIManager(Generic[_O]):
         record_ids: ListOrItem[RecordID],
         fields: Optional[list[ModelField]] = None,
         output: Optional[Literal['dict']] = None,
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ) -> list[RecordData]:
         ...
     @overload
@@ -332,9 +557,99 @@ class OdooAPIManager(Generic[_O]):
         record_ids: ListOrItem[RecordID],
         fields: Optional[list[ModelField]] = None,
         output: Literal['dataframe'] = None,
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> pd.DataFrame:
+        ...
+    @overload
+    def read(
+        self: "OdooAPIManager[Literal['tuples']]",
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Optional[Literal['tuples']] = None,
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> RecordTable:
+        ...
+    @overload
+    def read(
+        self: "OdooAPIManager[Literal['records']]",
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Optional[Literal['records']] = None,
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> list[Record]:
+        ...
+    @overload
+    def read(
+        self,
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Literal['columns'] = 'columns',
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> ColumnData:
+        ...
+    @overload
+    def read(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Optional[Literal['columns']] = None,
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> ColumnData:
+        ...
+    @overload
+    def read(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Literal['dict'] = 'dict',
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> list[RecordData]:
+        ...
+    @overload
+    def read(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Literal['dataframe'] = 'dataframe',
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ) -> pd.DataFrame:
         ...
     @overload
+    def read(
+        self,
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Literal['tuples'] = 'tuples',
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> RecordTable:
+        ...
+    @overload
+    def read(
+        self,
+        model: ModelName,
+        record_ids: ListOrItem[RecordID],
+        fields: Optional[list[ModelField]] = None,
+        output: Literal['records'] = 'records',
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> list[Record]:
+        ...
+    @overload
     def search_read(
         self: "OdooAPIManager[Literal['dataframe']]",
         model: ModelName,
@@ -343,6 +658,8 @@ class OdooAPIManager(Generic[_O]):
         offset: Optional[int] = None,
         limit: Optional[int] = None,
         output: Optional[Literal['dataframe']] = None,
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ) -> pd.DataFrame:
         ...
     @overload
@@ -354,6 +671,8 @@ class OdooAPIManager(Generic[_O]):
         offset: Optional[int] = None,
         limit: Optional[int] = None,
         output: Literal['dict'] = 'dict',
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ) -> list[RecordData]:
         ...
     @overload
@@ -365,6 +684,8 @@ class OdooAPIManager(Generic[_O]):
         offset: Optional[int] = None,
         limit: Optional[int] = None,
         output: Optional[Literal['dict']] = None,
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ) -> list[RecordData]:
         ...
     @overload
@@ -376,9 +697,115 @@ class OdooAPIManager(Generic[_O]):
         offset: Optional[int] = None,
         limit: Optional[int] = None,
         output: Literal['dataframe'] = 'dataframe',
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> pd.DataFrame:
+        ...
+    @overload
+    def search_read(
+        self: "OdooAPIManager[Literal['tuples']]",
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: Optional[list[ModelField]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Optional[Literal['tuples']] = None,
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> RecordTable:
+        ...
+    @overload
+    def search_read(
+        self: "OdooAPIManager[Literal['records']]",
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: Optional[list[ModelField]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Optional[Literal['records']] = None,
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> list[Record]:
+        ...
+    @overload
+    def search_read(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: Optional[list[ModelField]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Literal['columns'] = 'columns',
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> ColumnData:
+        ...
+    @overload
+    def search_read(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: Optional[list[ModelField]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Optional[Literal['columns']] = None,
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> ColumnData:
+        ...
+    @overload
+    def search_read(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: Optional[list[ModelField]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Literal['dict'] = 'dict',
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> list[RecordData]:
+        ...
+    @overload
+    def search_read(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: Optional[list[ModelField]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Literal['dataframe'] = 'dataframe',
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ) -> pd.DataFrame:
         ...
     @overload
+    def search_read(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: Optional[list[ModelField]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Literal['tuples'] = 'tuples',
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> RecordTable:
+        ...
+    @overload
+    def search_read(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: Optional[list[ModelField]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        output: Literal['records'] = 'records',
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> list[Record]:
+        ...
+    @overload
     def model_fields(
         self: "OdooAPIManager[Literal['dataframe']]",
         model: ModelName,
@@ -415,6 +842,78 @@ class OdooAPIManager(Generic[_O]):
     ) -> pd.DataFrame:
         ...
     @overload
+    def model_fields(
+        self: "OdooAPIManager[Literal['tuples']]",
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: Optional[Literal['tuples']] = None,
+    ) -> RecordTable:
+        ...
+    @overload
+    def model_fields(
+        self: "OdooAPIManager[Literal['records']]",
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: Optional[Literal['records']] = None,
+    ) -> list[Record]:
+        ...
+    @overload
+    def model_fields(
+        self,
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: Literal['columns'] = 'columns',
+    ) -> ColumnData:
+        ...
+    @overload
+    def model_fields(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: Optional[Literal['columns']] = None,
+    ) -> ColumnData:
+        ...
+    @overload
+    def model_fields(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: Literal['dict'] = 'dict',
+    ) -> list[RecordData]:
+        ...
+    @overload
+    def model_fields(
+        self: "OdooAPIManager[Literal['columns']]",
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: Literal['dataframe'] = 'dataframe',
+    ) -> pd.DataFrame:
+        ...
+    @overload
+    def model_fields(
+        self,
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: Literal['tuples'] = 'tuples',
+    ) -> RecordTable:
+        ...
+    @overload
+    def model_fields(
+        self,
+        model: ModelName,
+        attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
+        fields: list[ModelField] | None = None,
+        output: Literal['records'] = 'records',
+    ) -> list[Record]:
+        ...
+    @overload
     def _request(
         self,
         /,
@@ -497,15 +996,75 @@ class OdooAPIManager(Generic[_O]):
         self,
         alt_db: bool | str | None = None,
         default_output: OutputOptions = 'dataframe',
+        pool_size: int = PRESETS.POOL_SIZE,
+        timeout: float | None = None,
+        lazy: bool = False,
+        uid_cache: bool | str = False,
+        cache: bool = False,
+        cache_ttl: float = PRESETS.CACHE_TTL,
+        cache_size: int = PRESETS.CACHE_SIZE,
+        read_cache: bool | str = False,
+        metadata_cache: bool | str = False,
+        typed: bool = False,
+        split_m2o: bool = False,
+        lean: bool = False,
+        normalize_criteria: bool = False,
     ) -> None:
 
-        # Obtención de las variables de entorno
-        self._credentials = Credentials(alt_db)
-        # Se configura el formato de salida de la información
-        self._default_output = default_output
-
-        # Inicialización de Proxy
-        self._initialize_proxy()
+        # Inicialización de la configuración compartida
+        super().__init__(alt_db, default_output, pool_size, timeout, normalize_criteria)
+        # Caché en disco de la ID de usuario
+        self._uid_cache = (
+            UIDCache(uid_cache if isinstance(uid_cache, str) else None)
+                if uid_cache
+                else None
+        )
+        # Caché en memoria de las respuestas de lectura
+        self._response_cache = (
+            ResponseCache(cache_ttl, cache_size)
+                if cache
+                else None
+        )
+        # Caché en disco de los registros leídos
+        self._read_cache = (
+            PersistentReadCache(read_cache if isinstance(read_cache, str) else None)
+                if read_cache
+                else None
+        )
+        # Construcción de DataFrames con tipos de datos a partir de los metadatos
+        self._typed = typed
+        # Separación de las columnas Many2One en columnas de ID y nombre
+        self._split_m2o = split_m2o
+        # Proyección ligera de campos en lecturas sin campos especificados
+        self._lean = lean
+        # Registro de metadatos de los modelos, opcionalmente en disco
+        self.metadata = MetadataRegistry(
+            self,
+            (
+                (metadata_cache if isinstance(metadata_cache, str) else MetadataRegistry.default_path())
+                    if metadata_cache
+                    else None
+            ),
+        )
+        # Lotes de lecturas agrupadas abiertos en cada hilo
+        self._batches = threading.local()
+        # Indicador de si la ID de usuario actual proviene de la caché
+        self._uid_from_cache = False
+        # Pool de hilos para solicitudes simultáneas. Se crea hasta su primer uso
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+        # Indicador de conexión inicializada
+        self._proxy_ready = False
+        # Candado para que la primera conexión se inicialice una sola vez
+        self._proxy_lock = threading.Lock()
+        # Candado de uso de la conexión common entre hilos
+        self._common_lock = threading.Lock()
+
+        # Inicialización de Proxy. En modo perezoso ésta se realiza en la
+        # primera solicitud al API
+        if not lazy:
+            self._initialize_proxy()
 
     @property
     def version(
@@ -515,8 +1074,12 @@ class OdooAPIManager(Generic[_O]):
         Versión del sistema Odoo con el que se tiene conexión.
         """
 
+        # Inicialización de Proxy en modo perezoso
+        self._ensure_proxy()
+
         # Obtención de los datos
-        v = self._common.version()
+        with self._common_lock:
+            v = self._common.version()
 
         return v
 
@@ -599,6 +1162,62 @@ class OdooAPIManager(Generic[_O]):
 
         return response
 
+    def bulk_create(
+        self,
+        model: ModelName,
+        records_data: list[RecordData],
+        batch_size: int = PRESETS.BATCH_SIZE,
+    ) -> BulkResult:
+        """
+        ## Creación masiva de registros
+        Este método crea una cantidad grande de registros dividiéndolos en
+        lotes de `batch_size` registros que se envían simultáneamente en el
+        pool de conexiones. De esta forma se evitan los límites de tamaño de
+        solicitud y de tiempo de ejecución del servidor de Odoo.
+
+        Ejemplo de uso:
+        >>> result = odoo.bulk_create('res.partner', [{'name': 'Cliente 1'}, {'name': 'Cliente 2'}, ...])
+        >>> result.ids
+        >>> # [32, 33, ...]
+
+        Las IDs se retornan en el mismo orden de los datos de entrada. Si un
+        lote falla, los demás lotes se completan de todas formas; las
+        posiciones del lote fallido contienen `None` y la falla se reporta en
+        `result.failures`:
+        >>> result.ok
+        >>> # False
+        >>> result.failures
+        >>> # [BatchFailure(batch=3, positions=500, error=Fault(...))]
+        >>> result.failures[0].positions
+        >>> # [1500, 1501, ...]
+        """
+
+        # Validación del tamaño de lote
+        if batch_size < 1:
+            raise ValueError('El tamaño de lote debe ser de al menos 1.')
+
+        # Posiciones de inicio de cada lote
+        starts = list(range(0, len(records_data), batch_size))
+
+        # Creación simultánea de los lotes
+        outcomes = self._run_batches(
+            lambda start: self.create(model, records_data[start : start + batch_size]),
+            starts,
+        )
+
+        # IDs en el orden de los datos de entrada y fallas por lote
+        ids: list[RecordID | None] = []
+        failures: list[BatchFailure] = []
+        for ( batch, ( start, ( response, error ) ) ) in enumerate(zip(starts, outcomes)):
+            positions = list(range(start, min(start + batch_size, len(records_data))))
+            if error is None:
+                ids.extend(response)
+            else:
+                ids.extend([None] * len(positions))
+                failures.append(BatchFailure(batch, error, positions= positions))
+
+        return BulkResult(ids, failures)
+
     def search(
         self,
         model: ModelName,
@@ -726,6 +1345,50 @@ class OdooAPIManager(Generic[_O]):
 
         return response
 
+    @contextmanager
+    def batching(
+        self,
+        prefetch: Optional[dict[ModelName, list[RecordID]]] = None,
+    ) -> Iterator[ReadBatch]:
+        """
+        ## Lecturas agrupadas
+        Dentro de este bloque, `get_value` y `get_values` retornan los mismos
+        valores que fuera de él, pero los registros de las IDs precargadas en
+        `prefetch` se leen en una sola lectura por cada modelo y conjunto de
+        campos solicitados, la primera vez que se solicita alguno de ellos.
+        Un ciclo existente no necesita modificarse:
+        >>> with odoo.batching(prefetch={'product.template': ids}):
+        >>>     for id in ids:
+        >>>         price = odoo.get_value('product.template', id, 'list_price')
+        >>>         ...
+
+        También pueden precargarse IDs dentro del bloque:
+        >>> with odoo.batching() as batch:
+        >>>     batch.prefetch('res.partner', partner_ids)
+
+        Sólo se agrupan las lecturas de las IDs precargadas. Como `get_value`
+        y `get_values` retornan el valor de inmediato, una ID no precargada se
+        lee al solicitarse (junto con las IDs precargadas del modelo que aún
+        no se han leído), por lo que un ciclo sobre IDs no precargadas realiza
+        una lectura por registro, igual que fuera del bloque. Los
+        registros leídos se conservan hasta terminar el bloque, excepto los de
+        un modelo en el que se realiza una solicitud que puede modificar
+        registros (`write`, `create`, `unlink`, `execute`, etc.), que se
+        vuelven a leer. El bloque sólo aplica al hilo en el que se abrió.
+        """
+
+        batch = ReadBatch(self)
+        for ( model, record_ids ) in (prefetch or {}).items():
+            batch.prefetch(model, record_ids)
+
+        previous = getattr(self._batches, 'active', None)
+        self._batches.active = batch
+
+        try:
+            yield batch
+        finally:
+            self._batches.active = previous
+
     def get_value(
         self,
         model: ModelName,
@@ -739,8 +1402,18 @@ class OdooAPIManager(Generic[_O]):
         Uso:
         >>> odoo.get_value('product.template', 53, 'list_price')
         >>> # 7.40
+
+        Dentro de un bloque `batching()` el registro se obtiene de las
+        lecturas agrupadas del bloque.
         """
 
+        # Dentro de un bloque de lecturas agrupadas el registro se obtiene
+        # del lote
+        batch = self._active_batch()
+        if batch is not None:
+            record = batch.get(model, record_id, [field])
+            return record[field] if record else None
+
         # Obtención del registro
         response = self.read(
             model,
@@ -784,8 +1457,21 @@ class OdooAPIManager(Generic[_O]):
         >>> # 'Café'
         >>> price
         >>> # 7.40
+
+        Dentro de un bloque `batching()` el registro se obtiene de las
+        lecturas agrupadas del bloque.
         """
 
+        # Dentro de un bloque de lecturas agrupadas el registro se obtiene
+        # del lote. Se acepta la ID dentro de una lista, igual que en `read`
+        batch = self._active_batch()
+        if batch is not None:
+            ids = self._convert_to_list(record_ids)
+            if len(ids) > 1:
+                raise ValueError('`get_values` obtiene los valores de un solo registro.')
+            record = batch.get(model, ids[0], fields) if ids else None
+            return tuple([record[field] for field in fields]) if record else None
+
         # Obtención del registro
         response = self.read(
             model,
@@ -810,7 +1496,9 @@ class OdooAPIManager(Generic[_O]):
         record_ids: ListOrItem[RecordID],
         fields: Optional[list[ModelField]] = None,
         output: Optional[OutputOptions] = None,
-    ) -> list[dict] | pd.DataFrame:
+        chunk_size: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> list[dict] | ColumnData | RecordTable | list[Record] | pd.DataFrame:
         """
         ## Lectura de registros
         Este método realiza una lectura de IDs en donde retorna una lista
@@ -867,27 +1555,63 @@ class OdooAPIManager(Generic[_O]):
 
         La ejecución del método entonces se vería así:
         >>> odoo.read("sale.order", [52, 87, 129, 132], fields)
+
+        ### Lectura de listas grandes de IDs
+        Las listas de IDs más grandes que `chunk_size` (por defecto `2000`) se
+        dividen en bloques que se leen simultáneamente en el pool de
+        conexiones. Los registros se retornan en el mismo orden de las IDs
+        provistas, en una sola lista o un solo DataFrame:
+        >>> odoo.read("account.move.line", ids, ['debit', 'credit'], chunk_size=5000)
+
+        ### Campos de registros relacionados
+        Con `related` se añaden columnas de los registros a los que hacen
+        referencia campos `many2one`, con una sola lectura adicional por
+        modelo relacionado:
+        >>> odoo.read("sale.order", ids, ['name'], related={'partner_id': ['country_id', 'vat']})
+        >>> #     id    name  partner_id  partner_id.country_id  partner_id.vat
         """
 
+        # Campos a leer
+        fields = self._projection(model, fields, related)
+
         # Se acondiciona el valor de datos
         record_ids = self._convert_to_list(record_ids)
 
-        # Construcción de parámetros
-        params = Params(
-            record_ids= record_ids,
-            fields= fields,
-        )
+        # Tamaño de bloque de lectura
+        chunk_size = chunk_size or PRESETS.CHUNK_SIZE
+        # División de las IDs en bloques
+        chunks = [
+            record_ids[i : i + chunk_size]
+            for i in range(0, len(record_ids), chunk_size)
+        ] or [record_ids]
+
+        # Función de lectura de un bloque
+        def read_chunk(chunk: list[RecordID]) -> list[RecordData]:
+            # Construcción de parámetros
+            params = Params(
+                record_ids= chunk,
+                fields= fields,
+            )
+            # Obtención de los datos a partir del método de solicitud al API
+            return self._request(
+                model= model,
+                method= 'read',
+                args= params.args,
+                kwargs= params.kwargs,
+            )
 
-        # Obtención de los datos a partir del método de solicitud al API
-        response = self._request(
-            model= model,
-            method= 'read',
-            args= params.args,
-            kwargs= params.kwargs,
-        )
+        # Lectura simultánea de los bloques y unión en el orden original
+        response = [
+            record
+            for chunk_response in self._map_concurrently(read_chunk, chunks)
+            for record in chunk_response
+        ]
+
+        # Unión de los campos de los registros relacionados
+        response = self._join_related(model, response, related)
 
         # Conversión en formato de salida configurado
-        converted_data = self._build_output(response, output)
+        converted_data = self._build_output(response, output, self._frame_types(model, output, related), self._split_m2o, model= model)
 
         return converted_data
 
@@ -899,6 +1623,8 @@ class OdooAPIManager(Generic[_O]):
         offset: Optional[int] = None,
         limit: Optional[int] = None,
         output: Optional[OutputOptions] = None,
+        partitions: Optional[int] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
     ):
         """
         ## Búsqueda y lectura de registros
@@ -1049,29 +1775,337 @@ class OdooAPIManager(Generic[_O]):
 
         La ejecución del método entonces se vería así:
         >>> odoo.search_read("sale.order", [(...)], fields)
+
+        ### Lectura particionada
+        Para extracciones completas de modelos grandes, la búsqueda puede
+        dividirse en `partitions` rangos de IDs que se leen simultáneamente en
+        el pool de conexiones, aprovechando varios workers del servidor de
+        Odoo a la vez:
+        >>> odoo.search_read("account.move.line", [("parent_state", "=", "posted")], fields, partitions=8)
+
+        Los registros de una lectura particionada se retornan ordenados por
+        ID. Este parámetro no puede usarse junto con `offset` o `limit`.
+
+
+        ### Campos de registros relacionados
+        Con `related` se añaden columnas planas `<campo>.<campo relacionado>`
+        con los campos de los registros a los que hacen referencia campos
+        `many2one`. Las IDs distintas de cada campo se leen en una sola
+        lectura por modelo relacionado, por lo que la cantidad de solicitudes
+        depende de la cantidad de modelos relacionados y no de la cantidad de
+        registros:
+        >>> odoo.search_read("sale.order", [("state", "=", "sale")], ['name'], related={'partner_id': ['country_id', 'vat']})
+        >>> #     id    name  partner_id  partner_id.country_id  partner_id.vat
         """
 
-        # Construcción de parámetros
-        params = Params(
-            search_criteria= search_criteria,
-            fields= fields,
-            offset= offset,
-            limit= limit,
-        )
+        # Campos a leer
+        fields = self._projection(model, fields, related)
 
-        # Obtención de los datos a partir del método de solicitud al API
-        response = self._request(
-            model= model,
-            method= 'search_read',
-            args= params.args,
-            kwargs= params.kwargs,
-        )
+        # Si se solicitó una lectura particionada...
+        if partitions:
+            # Validación de parámetros incompatibles
+            if offset is not None or limit is not None:
+                raise ValueError('La lectura particionada no admite los parámetros `offset` ni `limit`.')
+            # Obtención de los datos por rangos de IDs
+            response = self._partitioned_search_read(model, search_criteria, fields, partitions)
+
+        else:
+            # Construcción de parámetros
+            params = Params(
+                search_criteria= search_criteria,
+                fields= fields,
+                offset= offset,
+                limit= limit,
+            )
+
+            # Obtención de los datos a partir del método de solicitud al API
+            response = self._request(
+                model= model,
+                method= 'search_read',
+                args= params.args,
+                kwargs= params.kwargs,
+            )
+
+        # Unión de los campos de los registros relacionados
+        response = self._join_related(model, response, related)
 
         # Conversión en formato de salida configurado
-        converted_data = self._build_output(response, output)
+        converted_data = self._build_output(response, output, self._frame_types(model, output, related), self._split_m2o, model= model)
 
         return converted_data
 
+    def iter_search(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        page_size: int = PRESETS.PAGE_SIZE,
+        pagination: PaginationMode = 'keyset',
+    ) -> Iterator[list[int]]:
+        """
+        ## Búsqueda paginada de registros
+        Este método funciona igual que `OdooAPIManager.search` pero retorna un
+        generador que realiza una solicitud al API por cada página de IDs.
+
+        Ejemplo de uso:
+        >>> for ids in odoo.iter_search("account.move.line", [("parent_state", "=", "posted")], page_size=10000):
+        >>>     process(ids)
+
+        Por defecto las páginas se obtienen por cursor de ID (`keyset`), por
+        lo que las IDs se retornan en orden ascendente, igual que en
+        `iter_search_read` y `export`. Para saber más sobre los modos de
+        paginación, consulta `OdooAPIManager.iter_search_read`.
+        """
+
+        return self._iter_pages(model, 'search', search_criteria, None, page_size, pagination)
+
+    def iter_search_read(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        fields: list[ModelField] = None,
+        page_size: int = PRESETS.PAGE_SIZE,
+        output: Optional[OutputOptions] = None,
+        pagination: PaginationMode = 'keyset',
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> Iterator[list[dict] | ColumnData | RecordTable | list[Record] | pd.DataFrame]:
+        """
+        ## Búsqueda y lectura paginada de registros
+        Este método funciona igual que `OdooAPIManager.search_read` pero en
+        lugar de retornar todos los registros en una sola respuesta, retorna
+        un generador que realiza una solicitud al API por cada página de
+        registros. De esta forma el uso de memoria se mantiene constante sin
+        importar el tamaño del modelo.
+
+        Ejemplo de uso:
+        >>> for page in odoo.iter_search_read("account.move.line", [("parent_state", "=", "posted")], page_size=5000):
+        >>>     process(page)
+
+        Cada página se retorna en el formato de salida configurado, ya sea
+        Pandas DataFrame o lista de diccionarios.
+
+        ### Modos de paginación
+        El modo predeterminado es `keyset`, el mismo de `iter_search` y
+        `export`, por lo que los registros se retornan ordenados por ID y no
+        en el orden predeterminado del modelo.
+        - `offset`: Las páginas se obtienen por medio de los parámetros
+        `offset` y `limit` respetando el orden predeterminado del modelo. La
+        base de datos debe recorrer y descartar todos los registros previos a
+        cada página, por lo que las últimas páginas de modelos muy grandes son
+        cada vez más lentas. Si se crean o eliminan registros durante la
+        iteración algunos registros podrían omitirse o repetirse.
+        - `keyset`: Los registros se ordenan por ID y cada página continúa a
+        partir de la última ID obtenida, añadiendo la condición
+        `('id', '>', ultima_id)` al criterio de búsqueda. El costo de cada
+        página es constante y la iteración es correcta aunque se creen
+        registros durante ésta.
+        >>> odoo.iter_search_read("account.move.line", page_size=5000, pagination='offset')
+        """
+
+        # Campos a leer
+        fields = self._projection(model, fields, related)
+
+        # Tipos de campo de las columnas
+        field_types = self._frame_types(model, output, related)
+
+        for page in self._iter_pages(model, 'search_read', search_criteria, fields, page_size, pagination):
+            # Unión de los campos de los registros relacionados
+            page = self._join_related(model, page, related)
+            # Conversión en formato de salida configurado
+            yield self._build_output(page, output, field_types, self._split_m2o, model= model)
+
+    def export(
+        self,
+        model: ModelName,
+        path: str | os.PathLike,
+        search_criteria: CriteriaStructure = [],
+        fields: list[ModelField] = None,
+        file_format: Optional[ExportFormat] = None,
+        page_size: int = PRESETS.PAGE_SIZE,
+        pagination: PaginationMode = 'keyset',
+    ) -> int:
+        """
+        ## Exportación de registros a un archivo
+        Este método recorre por páginas los registros que cumplen el criterio
+        de búsqueda y añade cada página al archivo en cuanto se recibe, por lo
+        que el uso de memoria se limita a unas cuantas páginas sin importar el
+        tamaño del modelo. Retorna la cantidad de registros escritos.
+
+        Ejemplo de uso:
+        >>> odoo.export("account.move.line", "lines.csv", [("parent_state", "=", "posted")], ["date", "debit", "credit"])
+        >>> # 1250000
+
+        ### Formatos de archivo
+        El formato se determina por la extensión del archivo o se provee en
+        el parámetro `file_format`:
+        - `csv`: Los valores de tipo lista se escriben en formato JSON.
+        - `jsonl`: Un objeto JSON por línea.
+        - `parquet`: Requiere la librería `pyarrow`. Las columnas se tipan a
+        partir de los metadatos del modelo.
+
+        ### Obtención de páginas
+        En ambos modos los registros se escriben ordenados por ID. El modo
+        predeterminado es `keyset`, el mismo de `iter_search` e
+        `iter_search_read`.
+        - `keyset`: Los registros se ordenan por ID y cada página continúa a
+        partir de la última ID obtenida. La siguiente página se solicita
+        mientras se escribe la página actual.
+        - `offset`: Los registros se ordenan por ID y las páginas se obtienen
+        por desfase. Se solicitan hasta `pool_size` páginas simultáneamente
+        mientras se escriben las anteriores, en el orden original.
+        """
+
+        # Validación del tamaño de página
+        if page_size < 1:
+            raise ValueError('El tamaño de página debe ser de al menos 1.')
+        # Validación del modo de paginación
+        if pagination not in ('offset', 'keyset'):
+            raise ValueError(f'Modo de paginación no válido: {pagination!r}.')
+
+        # Campos a leer
+        fields = self._projection(model, fields)
+
+        # Formato del archivo
+        file_format = resolve_export_format(path, file_format)
+        # Tipos de campo para construir el esquema de Parquet
+        field_types = (
+            {name: definition['ttype'] for ( name, definition ) in self.metadata.fields(model).items()}
+                if file_format == 'parquet'
+                else None
+        )
+
+        # Obtención de las páginas
+        pages = (
+            self._prefetch_keyset_pages(model, search_criteria, fields, page_size)
+                if pagination == 'keyset'
+                else self._prefetch_offset_pages(model, search_criteria, fields, page_size)
+        )
+
+        # Escritura incremental de las páginas
+        with open_writer(path, file_format, field_types, fields) as writer:
+            for page in pages:
+                writer.write(page)
+
+        return writer.written
+
+    def expand_x2many(
+        self,
+        model: ModelName,
+        field: ModelField,
+        search_criteria: CriteriaStructure = [],
+        child_fields: Optional[list[ModelField]] = None,
+        output: Optional[OutputOptions] = None,
+        related: Optional[dict[ModelField, list[ModelField]]] = None,
+    ) -> list[dict] | ColumnData | RecordTable | list[Record] | pd.DataFrame:
+        """
+        ## Expansión de campos One2Many y Many2Many
+        Este método busca los registros que cumplen el criterio de búsqueda y
+        expande las listas de IDs de un campo `one2many` o `many2many` en
+        formato largo: una fila por cada relación, con la ID del registro
+        padre (`parent_id`) y la ID del registro hijo (`child_id`) en
+        columnas `int64`.
+
+        Ejemplo de uso:
+        >>> odoo.expand_x2many("sale.order", "order_line", [("state", "=", "sale")])
+        >>> #       parent_id  child_id
+        >>> # 0            52       101
+        >>> # 1            52       102
+        >>> # 2            89       130
+
+        ### Lectura de los registros hijos
+        Con `child_fields` también se leen los campos provistos de los
+        registros hijos y se añaden como columnas `<campo>.<campo hijo>`.
+        Cada hijo se lee una sola vez aunque pertenezca a varios registros
+        padre, en bloques simultáneos, y la unión con las relaciones se
+        realiza por posición con NumPy:
+        >>> odoo.expand_x2many("sale.order", "order_line", [("state", "=", "sale")], ["product_id", "price_subtotal"])
+        >>> #       parent_id  child_id  order_line.product_id  order_line.price_subtotal
+        >>> # 0            52       101   [7, 'Café molido']                    148.0
+
+        Con `related` se añaden a los registros hijos los campos de los
+        registros a los que hacen referencia sus campos `many2one`, como en
+        `OdooAPIManager.read`:
+        >>> odoo.expand_x2many("sale.order", "order_line", [], ["product_id"], related={'product_id': ['default_code']})
+        >>> #       parent_id  child_id  order_line.product_id  order_line.product_id.default_code
+
+        Los registros padre se obtienen por páginas de `keyset` y los hijos
+        en bloques de IDs, por lo que ninguna solicitud crece con el tamaño
+        del modelo. Las relaciones con registros hijos que no pudieron leerse
+        se omiten. En los formatos `tuples` y `records` las filas son
+        relaciones padre-hijo, por lo que la clase de registro no lleva el
+        nombre de ningún modelo.
+        """
+
+        import numpy as np
+
+        # Validación del campo
+        definition = self.metadata.fields(model).get(field)
+        if definition is None or definition['ttype'] not in X2MANY_FIELD_TYPES:
+            raise ValueError(f'El campo {field!r} del modelo {model!r} no es de tipo one2many ni many2many.')
+        relation = definition['relation']
+
+        # Obtención por páginas de las IDs de los registros hijos de cada
+        # registro padre
+        response = [
+            record
+            for page in self._iter_pages(model, 'search_read', search_criteria, [field], PRESETS.PAGE_SIZE, 'keyset')
+            for record in page
+        ]
+        ( parent_ids, child_ids ) = explode_x2many(response, field)
+        columns: ColumnData = {'parent_id': parent_ids, 'child_id': child_ids}
+
+        # Lectura en bloques de los registros hijos distintos
+        children: list[RecordData] = []
+        if child_fields is not None and len(child_ids):
+            fields = self._projection(relation, child_fields, related)
+            [ children ] = self._read_many([( relation, np.unique(child_ids).tolist(), fields )])
+            # Unión de los campos de los registros relacionados
+            children = self._join_related(relation, children, related)
+            children.sort(key= itemgetter('id'))
+            found_ids = np.fromiter(map(itemgetter('id'), children), dtype= np.int64, count= len(children))
+            # Se omiten las relaciones con hijos que no pudieron leerse
+            found = np.isin(child_ids, found_ids)
+            columns = {name: values[found] for ( name, values ) in columns.items()}
+            # Posición del registro hijo de cada relación
+            positions = np.searchsorted(found_ids, columns['child_id'])
+
+        # Formato de salida resultante
+        output = output or self._default_output
+
+        # Construcción de DataFrame
+        if output == 'dataframe':
+            import pandas as pd
+            frame = pd.DataFrame(columns, copy= False)
+            if children:
+                child_frame = (
+                    build_frame(children, self._frame_types(relation, output, related), self._split_m2o)
+                    .drop(columns= 'id')
+                    .take(positions)
+                    .reset_index(drop= True)
+                    .add_prefix(f'{field}.')
+                )
+                frame = pd.concat([frame, child_frame], axis= 1)
+            return frame
+
+        # Columnas de los registros hijos
+        if children:
+            child_columns = build_columns(children)
+            del child_columns['id']
+            columns.update({
+                f'{field}.{name}': values
+                for ( name, values ) in take_columns(child_columns, positions).items()
+            })
+
+        # Construcción de columnas
+        if output == 'columns':
+            return columns
+
+        # Demás formatos de salida a partir de registros. Las filas son
+        # relaciones padre-hijo y no registros del modelo hijo
+        names = list(columns)
+        rows = [dict(zip(names, values)) for values in zip(*(values.tolist() for values in columns.values()))]
+
+        return self._build_output(rows, output)
+
     def search_count(
         self,
         model: ModelName,
@@ -1214,6 +2248,78 @@ class OdooAPIManager(Generic[_O]):
 
         return response
 
+    def bulk_write(
+        self,
+        model: ModelName,
+        records: dict[RecordID, RecordData] | pd.DataFrame,
+        batch_size: int = PRESETS.BATCH_SIZE,
+    ) -> BulkResult:
+        """
+        ## Actualización masiva de registros
+        Este método actualiza muchos registros con valores distintos entre
+        sí. Los registros que comparten exactamente los mismos valores se
+        agrupan en una sola solicitud de `write`, y los grupos se envían
+        simultáneamente en el pool de conexiones:
+        >>> odoo.bulk_write('product.template', {
+        >>>     53: {'list_price': 7.40},
+        >>>     54: {'list_price': 7.40},
+        >>>     55: {'list_price': 9.90, 'active': False},
+        >>> })
+        >>> # BulkResult(ids=3, failures=[])
+
+        En este ejemplo se realizan sólo dos solicitudes al API: una para los
+        registros 53 y 54 y otra para el registro 55.
+
+        También puede proporcionarse un DataFrame. Las IDs se toman de la
+        columna `id` o, si ésta no existe, del índice. Los valores nulos se
+        envían como `False`:
+        >>> odoo.bulk_write('product.template', prices_df[['id', 'list_price']])
+
+        Los grupos de más de `batch_size` registros se dividen en lotes. Si un
+        lote falla, los demás se completan de todas formas y la falla se
+        reporta en `result.failures`, con las IDs de los registros del lote:
+        >>> result.failures[0].record_ids
+        >>> # [55]
+        """
+
+        # Validación del tamaño de lote
+        if batch_size < 1:
+            raise ValueError('El tamaño de lote debe ser de al menos 1.')
+
+        # Conversión de DataFrame a diccionario de valores por ID
+        if not isinstance(records, dict):
+            records = self._frame_to_records(records)
+
+        # Agrupación de IDs por valores idénticos
+        groups: dict[str, tuple[RecordData, list[RecordID]]] = {}
+        for ( record_id, record_data ) in records.items():
+            key = json.dumps(record_data, sort_keys= True, default= str)
+            groups.setdefault(key, (record_data, []))[1].append(record_id)
+
+        # Construcción de lotes de cada grupo
+        batches = [
+            ( record_data, record_ids[i : i + batch_size] )
+            for ( record_data, record_ids ) in groups.values()
+            for i in range(0, len(record_ids), batch_size)
+        ]
+
+        # Actualización simultánea de los lotes
+        outcomes = self._run_batches(
+            lambda batch: self.write(model, batch[1], batch[0]),
+            batches,
+        )
+
+        # IDs actualizadas y fallas por lote
+        ids: list[RecordID] = []
+        failures: list[BatchFailure] = []
+        for ( batch, ( ( _, record_ids ), ( _, error ) ) ) in enumerate(zip(batches, outcomes)):
+            if error is None:
+                ids.extend(record_ids)
+            else:
+                failures.append(BatchFailure(batch, error, record_ids= record_ids))
+
+        return BulkResult(ids, failures)
+
     def unlink(
         self,
         model: ModelName,
@@ -1308,7 +2414,7 @@ class OdooAPIManager(Generic[_O]):
         attributes: list[FieldFields] = PRESETS.FIELDS_ATTS,
         fields: list[ModelField] | None = None,
         output: OutputOptions | None = None,
-    ) -> pd.DataFrame | list[dict]:
+    ) -> pd.DataFrame | list[dict] | ColumnData | RecordTable | list[Record]:
         """
         ## Obtener información de los campos de un modelo
         Este método retorna la información más relevante de los campos, en 
@@ -1358,8 +2464,24 @@ class OdooAPIManager(Generic[_O]):
         >>> # 0  9989     id ...    integer     False
         >>> # 1  9933   name ...       char     False
         >>> # 2  9936  state ...  selection     False
+
+        ## Registro de metadatos
+        Si todos los atributos solicitados forman parte del registro de
+        metadatos de la instancia (`odoo.metadata`), la información se obtiene
+        desde éste y sólo la primera consulta de cada modelo realiza una
+        solicitud al API.
         """
 
+        # Si los atributos solicitados están en el registro de metadatos, la
+        # información se obtiene desde éste
+        if set(attributes) <= set(PRESETS.METADATA_ATTS):
+            response = [
+                {'id': definition['id'], **{att: definition[att] for att in attributes}}
+                for ( name, definition ) in self.metadata.fields(model).items()
+                if not fields or name in fields
+            ]
+            return self._build_output(response, output, model= 'ir.model.fields')
+
         # Criterio inicial de búsqueda
         search_criteria: CriteriaStructure = [('model_id', '=', model)]
 
@@ -1375,26 +2497,107 @@ class OdooAPIManager(Generic[_O]):
             model= 'ir.model.fields',
             search_criteria= search_criteria,
             fields= attributes,
+            output= 'dict',
         )
 
         # Conversión en formato de salida configurado
-        converted_data = self._build_output(response, output)
+        converted_data = self._build_output(response, output, model= 'ir.model.fields')
 
         return converted_data
 
-    def session_info(
+    def field_costs(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure = [],
+        sample_size: int = PRESETS.SAMPLE_SIZE,
+    ) -> list[FieldCost]:
+        """
+        ## Costo de los campos de un modelo
+        Este método lee una muestra de registros con todos sus campos y
+        retorna cuántos bytes ocupa cada campo en la respuesta XML-RPC del
+        API, ordenados del más costoso al menos costoso. Sirve para decidir
+        qué campos omitir en las lecturas.
+
+        Ejemplo de uso:
+        >>> odoo.field_costs("res.partner", sample_size=50)[:3]
+        >>> # [FieldCost(field='image_1920', ttype='binary', store=True, total_bytes=2841320, bytes_per_record=56826.4, share=71.2%),
+        >>> #  FieldCost(field='avatar_128', ttype='binary', store=False, total_bytes=512040, bytes_per_record=10240.8, share=12.8%),
+        >>> #  FieldCost(field='comment', ttype='html', store=True, total_bytes=98110, bytes_per_record=1962.2, share=2.5%)]
+        """
+
+        # Lectura de la muestra con todos los campos
+        params = Params(
+            search_criteria= search_criteria,
+            limit= sample_size,
+        )
+        response = self._request(model, 'search_read', params.args, params.kwargs)
+
+        return measure_field_costs(response, self.metadata.fields(model))
+
+    def close(
+        self,
+    ) -> None:
+        """
+        ## Cierre de conexiones
+        Este método cierra las conexiones persistentes abiertas hacia el API.
+        Las conexiones se vuelven a abrir automáticamente si se realiza una
+        nueva solicitud.
+        >>> odoo.close()
+        """
+
+        # Cierre del pool de hilos
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        # Cierre de la caché en disco de los registros
+        if self._read_cache is not None:
+            self._read_cache.close()
+        # Si la conexión no se ha inicializado no hay nada más que cerrar
+        if not self._proxy_ready:
+            return
+
+        # Cierre de las conexiones del pool
+        self._models.close()
+        # Cierre de la conexión common
+        with self._common_lock:
+            self._common('close')()
+
+    def cache_info(
+        self,
+    ) -> CacheInfo | None:
+        """
+        ## Estadísticas de la caché de respuestas
+        Este método retorna los aciertos, fallos, tamaño actual, tamaño máximo
+        y tiempo de vida de la caché de respuestas, o `None` si la caché no
+        está activa.
+        >>> odoo = OdooAPIManager(cache=True)
+        >>> odoo.cache_info()
+        >>> # CacheInfo(hits=12, misses=3, size=3, maxsize=1024, ttl=60.0)
+        """
+
+        if self._response_cache is None:
+            return None
+
+        return self._response_cache.info()
+
+    def cache_clear(
         self,
+        model: ModelName | None = None,
     ) -> None:
         """
-        ## Información de la sesión
-        Este método hace una impresión de la información de la sesión actual:
-        >>> odoo.session_info()
-        >>> # Base de datos: your-database-name
-        >>> # URL de origen: https://your-database-name.odoo.com
-        >>> # Usuario: username_api@example.com
-        >>> # Token de API: ****************************************
+        ## Limpieza de la caché de respuestas
+        Este método descarta las respuestas guardadas del modelo provisto, o
+        todas las respuestas si no se provee un modelo. Con la caché en disco
+        activa también se descartan los registros guardados de la base de
+        datos de la instancia.
+        >>> odoo.cache_clear('res.partner')
         """
-        print(self._info)
+
+        if self._response_cache is not None:
+            self._response_cache.invalidate(model)
+        if self._read_cache is not None:
+            self._read_cache.clear(self._credentials.db, model)
 
     @classmethod
     def extract_m2o_id(
@@ -1444,23 +2647,14 @@ class OdooAPIManager(Generic[_O]):
         >>> #    id                 name  user_id
         >>> # 0   1           Un cliente        1
         >>> # 1   2  Cliente distinguido        2
-        >>> # 2   3            Mostrador        0
-        >>> # 3   4         Otro cliente        0
-        """
+        >>> # 2   3            Mostrador       -1
+        >>> # 3   4         Otro cliente       -1
 
-        # Función para extraer el valor
-        fn: SeriesApply[NullableMany2One] = (
-            lambda m2o: (
-                m2o[0]
-                    if m2o
-                    else null_value
-            )
-        )
+        Los valores se extraen de forma vectorizada, sin ejecutar una función
+        de Python por cada elemento.
+        """
 
-        return (
-            s
-            .apply(fn)
-        )
+        return self._extract_m2o(s, 0, null_value)
 
     @classmethod
     def extract_m2o_name(
@@ -1512,60 +2706,452 @@ class OdooAPIManager(Generic[_O]):
         >>> # 1   2  Cliente distinguido        2
         >>> # 2   3            Mostrador     None
         >>> # 3   4         Otro cliente     None
+
+        Los valores se extraen de forma vectorizada, sin ejecutar una función
+        de Python por cada elemento.
         """
 
-        # Función para extraer el valor
-        fn: SeriesApply[NullableMany2One] = (
-            lambda m2o: (
-                m2o[1]
-                    if m2o
-                    else null_value
-            )
-        )
+        return self._extract_m2o(s, 1, null_value)
+
+    @classmethod
+    def _extract_m2o(
+        cls,
+        s: pd.Series,
+        position: int,
+        null_value: _T,
+    ) -> pd.Series:
+
+        import pandas as pd
+
+        # Extracción vectorizada de los valores
+        ( values, _ ) = extract_many2one(s, position, null_value)
 
+        # Se infiere el tipo de dato igual que en `Series.apply`: los valores
+        # mezclados con `False` se mantienen como `object` y una columna sin
+        # valores se convierte en `bool`
         return (
-            s
-            .apply(fn)
+            pd.Series(values, index= s.index, name= s.name)
+            .infer_objects()
         )
 
-    def _build_output(
+    def _frame_to_records(
         self,
-        response: list[RecordData],
+        data: pd.DataFrame,
+    ) -> dict[RecordID, RecordData]:
+
+        # Se toman las IDs desde la columna `id` o desde el índice
+        if 'id' in data.columns:
+            data = data.set_index('id')
+
+        # Los valores nulos se convierten en `False`, el valor nulo de Odoo
+        data = data.astype(object).where(data.notna(), False)
+
+        return {
+            int(record_id): record_data
+            for ( record_id, record_data ) in zip(data.index, data.to_dict('records'))
+        }
+
+    def _frame_types(
+        self,
+        model: ModelName,
         output: OutputOptions | None,
-    ) -> list[dict] | pd.DataFrame:
+        related: dict[ModelField, list[ModelField]] | None = None,
+    ) -> dict[ModelField, str] | None:
         """
-        ## Formateo de salida
-        Este método interno formatea la salida de las funciones de lectura
-        desde el API de Odoo. Si se estableció un formato de salida en la
-        inicialización de la instancia, éste se mantiene. De lo contrario se
-        utiliza el formateo especificado en la ejecución de la función de
-        lectura. En caso de no haberlo se utiliza el formato de salida por
-        defecto que es Pandas DataFrame.
+        ### Tipos de campo de las columnas
+        Este método interno retorna los tipos de campo de Odoo del modelo si
+        la instancia construye DataFrames con tipos de datos y el formato de
+        salida es DataFrame, incluyendo las columnas de los registros
+        relacionados. Si sólo se separan las columnas Many2One, se retornan
+        únicamente los campos de este tipo.
         """
 
-        # Si no se especificó formato de salida en la función...
-        if not output:
-            # Formato de salida en DataFrame
-            if self._default_output == 'dataframe':
-                return pd.DataFrame(response)
+        if not ( self._typed or self._split_m2o ) or (output or self._default_output) != 'dataframe':
+            return None
 
-        # Si el formato de salida por fecto es DataFrame...
-        if output == 'dataframe':
-                return pd.DataFrame(response)
+        definitions = self.metadata.fields(model)
+        field_types = {name: definition['ttype'] for ( name, definition ) in definitions.items()}
+
+        # Tipos de las columnas de los registros relacionados
+        for ( field, related_fields ) in (related or {}).items():
+            related_definitions = self.metadata.fields(definitions[field]['relation'])
+            for name in related_fields:
+                if name in related_definitions:
+                    field_types[f'{field}.{name}'] = related_definitions[name]['ttype']
+
+        return {
+            name: ttype
+            for ( name, ttype ) in field_types.items()
+            if self._typed or ttype == 'many2one'
+        }
+
+    def _join_related(
+        self,
+        model: ModelName,
+        response: list[RecordData],
+        related: dict[ModelField, list[ModelField]] | None,
+    ) -> list[RecordData]:
+        """
+        ### Unión de registros relacionados
+        Este método interno lee los campos solicitados de los registros a los
+        que hacen referencia los campos `many2one` provistos y los añade a la
+        respuesta como columnas `<campo>.<campo relacionado>`. Se realiza una
+        sola lectura por modelo relacionado, con las IDs distintas de todos
+        los campos que hacen referencia a éste.
+        """
+
+        if not related or not response:
+            return response
+
+        definitions = self.metadata.fields(model)
+
+        # IDs y campos a leer por modelo relacionado
+        reads: dict[ModelName, tuple[dict[RecordID, None], dict[ModelField, None]]] = {}
+        for ( field, related_fields ) in related.items():
+            definition = definitions.get(field)
+            if definition is None or definition['ttype'] != 'many2one':
+                raise ValueError(f'El campo {field!r} del modelo {model!r} no es de tipo many2one.')
+            ( ids, fields ) = reads.setdefault(definition['relation'], ( {}, {} ))
+            ids.update(dict.fromkeys(related_ids(response, field)))
+            fields.update(dict.fromkeys(related_fields))
+
+        # Lectura simultánea de los modelos relacionados
+        relations = list(reads)
+        responses = self._read_many([
+            ( relation, list(reads[relation][0]), list(reads[relation][1]) )
+            for relation in relations
+        ])
+        records = {
+            relation: {record['id']: record for record in relation_response}
+            for ( relation, relation_response ) in zip(relations, responses)
+        }
+
+        # Unión de los campos en cada registro
+        for ( field, related_fields ) in related.items():
+            merge_related(response, field, records[definitions[field]['relation']], related_fields)
 
-        # Retorno de información en lista de diccionarios
         return response
 
-    def _convert_to_list(
+    def _read_many(
+        self,
+        reads: list[tuple[ModelName, list[RecordID], list[ModelField]]],
+    ) -> list[list[RecordData]]:
+        """
+        ### Lecturas simultáneas de varios modelos
+        Este método interno divide las IDs de cada lectura en bloques y lee
+        todos los bloques en una sola ejecución simultánea, por lo que no
+        anida tareas en el pool de hilos. Retorna los registros de cada
+        lectura en el orden provisto.
+        """
+
+        # Bloques de todas las lecturas
+        chunks = [
+            ( position, model, ids[start:start + PRESETS.CHUNK_SIZE], fields )
+            for ( position, ( model, ids, fields ) ) in enumerate(reads)
+            for start in range(0, len(ids), PRESETS.CHUNK_SIZE)
+        ]
+
+        def read_chunk(chunk: tuple[int, ModelName, list[RecordID], list[ModelField]]) -> list[RecordData]:
+            ( _, model, ids, fields ) = chunk
+            params = Params(
+                record_ids= ids,
+                fields= fields,
+            )
+            return self._request(model, 'read', params.args, params.kwargs)
+
+        # Unión de los bloques de cada lectura
+        responses: list[list[RecordData]] = [[] for _ in reads]
+        for ( chunk, response ) in zip(chunks, self._map_concurrently(read_chunk, chunks)):
+            responses[chunk[0]].extend(response)
+
+        return responses
+
+    def _active_batch(
+        self,
+    ) -> ReadBatch | None:
+
+        return getattr(self._batches, 'active', None)
+
+    def _projection(
+        self,
+        model: ModelName,
+        fields: list[ModelField] | None,
+        related: dict[ModelField, list[ModelField]] | None = None,
+    ) -> list[ModelField] | None:
+        """
+        ### Campos a leer
+        Este método interno retorna los campos provistos o, si no se proveen
+        y la instancia usa proyección ligera, los campos almacenados del
+        modelo que no son `binary` ni `html`. Los campos `many2one` de los
+        registros relacionados a unir se añaden si no se incluyeron.
+        """
+
+        if fields is None:
+            return self.metadata.lean_fields(model) if self._lean else None
+
+        # Campos Many2One necesarios para la unión de registros relacionados
+        missing = [field for field in (related or {}) if field not in fields]
+
+        return [*fields, *missing] if missing else fields
+
+    def _map_concurrently(
+        self,
+        fn: Callable[[_T], _R],
+        items: list[_T],
+    ) -> list[_R]:
+        """
+        ### Ejecución simultánea
+        Este método interno ejecuta una función por cada elemento provisto en
+        el pool de hilos de la instancia y retorna los resultados en el mismo
+        orden de los elementos. Si ocurre un error en alguna ejecución, éste
+        se propaga.
+        """
+
+        # Con un solo elemento no es necesario usar el pool de hilos
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        return list(self._get_executor().map(fn, items))
+
+    def _run_batches(
+        self,
+        fn: Callable[[_T], _R],
+        batches: list[_T],
+    ) -> list[tuple[_R | None, Exception | None]]:
+        """
+        ### Ejecución simultánea de lotes
+        Este método interno funciona igual que `_map_concurrently` pero en
+        lugar de propagar los errores, retorna por cada lote una tupla con el
+        resultado y la excepción lanzada, para que la falla de un lote no
+        descarte los lotes que sí se completaron.
+        """
+
+        # Función que captura el error de un lote
+        def run(batch: _T) -> tuple[_R | None, Exception | None]:
+            try:
+                return ( fn(batch), None )
+            except Exception as error:
+                return ( None, error )
+
+        return self._map_concurrently(run, batches)
+
+    def _get_executor(
         self,
-        items: ListOrItem[_T]
-    ) -> list[_T]:
+    ) -> ThreadPoolExecutor:
 
-        # Revisión de si el elemento proporcionado no es una lista
-        if not isinstance(items, list):
-            items = [items]
+        # Creación del pool de hilos en su primer uso
+        with self._executor_lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(
+                    max_workers= self._pool_size,
+                    thread_name_prefix= 'odoo_api_manager',
+                )
 
-        return items
+        return self._executor
+
+    def _partitioned_search_read(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure,
+        fields: list[ModelField] | None,
+        partitions: int,
+    ) -> list[RecordData]:
+        """
+        ### Lectura particionada por rangos de IDs
+        Este método interno obtiene la ID mínima, la ID máxima y el conteo de
+        registros que cumplen el criterio de búsqueda, divide el espacio de
+        IDs en rangos y lee cada rango simultáneamente.
+        """
+
+        # Función de obtención de la ID de un extremo
+        def get_bound(order: str) -> list[RecordID]:
+            params = Params(search_criteria= search_criteria, limit= 1, order= order)
+            return self._request(model= model, method= 'search', args= params.args, kwargs= params.kwargs)
+
+        # Obtención simultánea de los extremos y del conteo
+        ( min_id, max_id, count ) = self._map_concurrently(
+            lambda task: task(),
+            [
+                partial(get_bound, 'id asc'),
+                partial(get_bound, 'id desc'),
+                partial(self.search_count, model, search_criteria),
+            ],
+        )
+
+        # Si no hay registros no es necesario continuar
+        if not count:
+            return []
+
+        # Cantidad de rangos, sin exceder la cantidad de registros
+        partitions = min(partitions, count)
+        # Tamaño de cada rango de IDs
+        ( [ lower ], [ upper ] ) = ( min_id, max_id )
+        step = -(-(upper - lower + 1) // partitions)
+
+        # Función de lectura de un rango
+        def read_range(start: RecordID) -> list[RecordData]:
+            params = Params(
+                search_criteria= and_criteria(
+                    search_criteria,
+                    ('id', '>=', start),
+                    ('id', '<', start + step),
+                ),
+                fields= fields,
+                order= 'id asc',
+            )
+            return self._request(model= model, method= 'search_read', args= params.args, kwargs= params.kwargs)
+
+        # Lectura simultánea de los rangos y unión en orden de ID
+        return [
+            record
+            for range_response in self._map_concurrently(read_range, list(range(lower, upper + 1, step)))
+            for record in range_response
+        ]
+
+    def _iter_pages(
+        self,
+        model: ModelName,
+        method: Literal['search', 'search_read'],
+        search_criteria: CriteriaStructure,
+        fields: list[ModelField] | None,
+        page_size: int,
+        pagination: PaginationMode,
+    ) -> Iterator[list]:
+
+        # Validación del tamaño de página
+        if page_size < 1:
+            raise ValueError('El tamaño de página debe ser de al menos 1.')
+        # Validación del modo de paginación
+        if pagination not in ('offset', 'keyset'):
+            raise ValueError(f'Modo de paginación no válido: {pagination!r}.')
+
+        # Desfase inicial
+        offset = 0
+        # Última ID obtenida
+        last_id = None
+
+        while True:
+            # Paginación por cursor de ID
+            if pagination == 'keyset':
+                page_criteria = (
+                    search_criteria
+                        if last_id is None
+                        else and_criteria(search_criteria, ('id', '>', last_id))
+                )
+                params = Params(
+                    search_criteria= page_criteria,
+                    fields= fields,
+                    limit= page_size,
+                    order= 'id asc',
+                )
+            # Paginación por desfase
+            else:
+                params = Params(
+                    search_criteria= search_criteria,
+                    fields= fields,
+                    offset= offset,
+                    limit= page_size,
+                )
+
+            # Obtención de la página a partir del método de solicitud al API
+            response = self._request(
+                model= model,
+                method= method,
+                args= params.args,
+                kwargs= params.kwargs,
+            )
+
+            # Si la página está vacía ya no hay más registros
+            if not response:
+                return
+
+            yield response
+
+            # Si la página está incompleta era la última
+            if len(response) < page_size:
+                return
+
+            # Posición de la siguiente página
+            offset += page_size
+            last_id = response[-1] if method == 'search' else response[-1]['id']
+
+    def _prefetch_keyset_pages(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure,
+        fields: list[ModelField] | None,
+        page_size: int,
+    ) -> Iterator[list[RecordData]]:
+
+        def fetch(last_id: RecordID | None) -> list[RecordData]:
+            params = Params(
+                search_criteria= (
+                    search_criteria
+                        if last_id is None
+                        else and_criteria(search_criteria, ('id', '>', last_id))
+                ),
+                fields= fields,
+                limit= page_size,
+                order= 'id asc',
+            )
+            return self._request(model, 'search_read', params.args, params.kwargs)
+
+        executor = self._get_executor()
+        future = executor.submit(fetch, None)
+
+        while True:
+            page = future.result()
+            if not page:
+                return
+
+            # La siguiente página se solicita antes de entregar la actual
+            last_page = len(page) < page_size
+            if not last_page:
+                future = executor.submit(fetch, page[-1]['id'])
+
+            yield page
+
+            if last_page:
+                return
+
+    def _prefetch_offset_pages(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure,
+        fields: list[ModelField] | None,
+        page_size: int,
+    ) -> Iterator[list[RecordData]]:
+
+        def fetch(offset: int) -> list[RecordData]:
+            params = Params(
+                search_criteria= search_criteria,
+                fields= fields,
+                offset= offset,
+                limit= page_size,
+                order= 'id asc',
+            )
+            return self._request(model, 'search_read', params.args, params.kwargs)
+
+        # Desfases de todas las páginas a partir del conteo de registros
+        count = self.search_count(model, search_criteria)
+        offsets = iter(range(0, count, page_size))
+
+        # Se mantienen hasta `pool_size` páginas en solicitud
+        executor = self._get_executor()
+        pending = deque(executor.submit(fetch, offset) for offset in islice(offsets, self._pool_size))
+
+        try:
+            while pending:
+                page = pending.popleft().result()
+                # Se solicita una nueva página por cada página entregada
+                for offset in islice(offsets, 1):
+                    pending.append(executor.submit(fetch, offset))
+                yield page
+        finally:
+            # Si la exportación se interrumpe se cancelan las solicitudes pendientes
+            for future in pending:
+                future.cancel()
 
     def _initialize_proxy(
         self,
@@ -1578,37 +3164,111 @@ class OdooAPIManager(Generic[_O]):
         xmlrpc_object = XMLRPC_OBJECT.format(**URL_PARAM)
 
         # Creación de la conexión common para autenticar el usuario
-        self._common = client.ServerProxy(xmlrpc_common)
-        # Token de autenticación
-        self._uid = (
-            self._common
-            .authenticate(
-                self._credentials.db,
-                self._credentials.username,
-                self._credentials.token,
-                {}
+        self._common = create_proxy(xmlrpc_common, self._timeout)
+        # Token de autenticación, desde la caché en disco si está disponible
+        self._uid = self._read_cached_uid()
+        self._uid_from_cache = self._uid is not None
+        if self._uid is None:
+            self._authenticate()
+        # Creación del pool de conexiones models para realizar solicitudes
+        self._models = ProxyPool(xmlrpc_object, self._pool_size, self._timeout)
+
+        # La conexión queda lista para usarse
+        self._proxy_ready = True
+
+    def _authenticate(
+        self,
+    ) -> None:
+
+        # Obtención del token de autenticación
+        with self._common_lock:
+            self._uid = (
+                self._common
+                .authenticate(
+                    self._credentials.db,
+                    self._credentials.username,
+                    self._credentials.token,
+                    {}
+                )
             )
-        )
-        # Creación de la conexión models para realizar solicitudes
-        self._models = client.ServerProxy(xmlrpc_object)
+        self._uid_from_cache = False
 
-        # Inicialización de la información de la sesión
-        self._initialize_session_info()
+        # Se guarda el token en la caché en disco
+        if self._uid_cache is not None and self._uid:
+            try:
+                self._uid_cache.set(*self._uid_cache_key(), self._uid)
+            except OSError:
+                pass
 
-    def _initialize_session_info(
+    def _read_cached_uid(
         self,
-    ) -> None:
+    ) -> int | None:
 
-        self._info =  (
-            SESSION_INFO
-            .format(**{
-                'api_db': self._credentials.db,
-                'url': self._credentials.url,
-                'username': self._credentials.username,
-                'token': len(self._credentials.token) * '*',
-            })
+        # Si no se usa caché en disco no hay token guardado
+        if self._uid_cache is None:
+            return None
+
+        return self._uid_cache.get(*self._uid_cache_key())
+
+    def _refresh_uid(
+        self,
+        stale_uid: int,
+    ) -> bool:
+        """
+        ### Renovación del token de autenticación
+        Este método interno se ejecuta cuando una solicitud falla por
+        acceso denegado. Si el token usado provenía de la caché en disco, éste
+        se descarta y se vuelve a autenticar. Retorna `True` si se obtuvo un
+        token distinto con el que vale la pena reintentar la solicitud.
+        """
+
+        with self._proxy_lock:
+            # Si otro hilo ya renovó el token se reintenta con el nuevo
+            if self._uid != stale_uid:
+                return True
+            # Si el token no provenía de la caché, el error es legítimo
+            if not self._uid_from_cache:
+                return False
+
+            # Se descarta la entrada de la caché y se vuelve a autenticar
+            try:
+                self._uid_cache.delete(*self._uid_cache_key())
+            except OSError:
+                pass
+            self._authenticate()
+
+            return self._uid != stale_uid
+
+    def _uid_cache_key(
+        self,
+    ) -> tuple[str, str, str, str]:
+
+        return (
+            self._credentials.url,
+            self._credentials.db,
+            self._credentials.username,
+            self._credentials.token,
         )
 
+    def _ensure_proxy(
+        self,
+    ) -> None:
+        """
+        ### Inicialización perezosa de la conexión
+        Este método interno inicializa la conexión si aún no se ha hecho. Si
+        varios hilos realizan su primera solicitud al mismo tiempo, sólo uno
+        de ellos realiza la autenticación y los demás esperan su resultado.
+        """
+
+        # Si la conexión ya está lista no se hace nada
+        if self._proxy_ready:
+            return
+
+        with self._proxy_lock:
+            # Se revisa de nuevo por si otro hilo la inicializó mientras se esperaba
+            if not self._proxy_ready:
+                self._initialize_proxy()
+
     def _request(
         self,
         /,
@@ -1618,20 +3278,181 @@ class OdooAPIManager(Generic[_O]):
         kwargs: dict = {},
     ):
 
-        # Se realiza la solicitud al API
-        return self._models.execute_kw(
-            # Base de datos de la API
-            self._credentials.db,
-            # ID del usuario
-            self._uid,
-            # Token del usuario
-            self._credentials.token,
-            # Modelo de Odoo
-            model,
-            # Método de solicitud
-            method,
-            # Args
-            args,
-            # Kwargs
-            kwargs
-        )
+        # Criterio de búsqueda en forma canónica, antes de usarse en la llave
+        # de la caché de respuestas
+        args = self._normalize_args(method, args)
+
+        # Las solicitudes que pueden modificar registros descartan los
+        # registros del modelo leídos en el bloque de lecturas agrupadas
+        if method not in READ_ONLY_METHODS:
+            batch = self._active_batch()
+            if batch is not None:
+                batch.invalidate(model)
+
+        # Si la caché de respuestas no está activa se realiza la solicitud
+        if self._response_cache is None:
+            return self._fetch(model, method, args, kwargs)
+
+        # Los métodos de lectura se sirven desde la caché
+        if method in CACHEABLE_METHODS:
+            key = self._response_cache.build_key(self._credentials.db, model, method, args, kwargs)
+            ( found, response ) = self._response_cache.get(key)
+            if not found:
+                # Generación del modelo antes de la solicitud, para no guardar
+                # una respuesta anterior a una modificación simultánea
+                generation = self._response_cache.generation(model)
+                response = self._fetch(model, method, args, kwargs)
+                self._response_cache.set(key, model, response, generation)
+            return response
+
+        # Cualquier otro método que puede modificar registros invalida las
+        # entradas del modelo, aún si la solicitud falla
+        try:
+            return self._call(model, method, args, kwargs)
+        finally:
+            if method not in READ_ONLY_METHODS:
+                self._response_cache.invalidate(model)
+
+    def _fetch(
+        self,
+        model: ModelName,
+        method: APIMethods,
+        args: list,
+        kwargs: dict,
+    ):
+
+        # Las lecturas de registros se sirven desde la caché en disco
+        if self._read_cache is not None and method in ('read', 'search_read'):
+            return self._revalidated_read(model, method, args, kwargs)
+
+        return self._call(model, method, args, kwargs)
+
+    def _revalidated_read(
+        self,
+        model: ModelName,
+        method: Literal['read', 'search_read'],
+        args: list,
+        kwargs: dict,
+    ) -> list[RecordData]:
+        """
+        ### Lectura revalidada desde la caché en disco
+        Este método interno obtiene la fecha de modificación (`write_date`) de
+        los registros solicitados y sólo lee los registros nuevos o
+        modificados, tomando los demás de la caché en disco.
+
+        `write_date` tiene una resolución de un segundo, por lo que un
+        registro modificado de nuevo dentro del mismo segundo en que se guardó
+        puede servirse desactualizado hasta su siguiente modificación. Los
+        modelos sin `write_date` se leen directamente del API.
+        """
+
+        # Los modelos sin campos de registro de acceso no pueden revalidarse
+        if 'write_date' not in self.metadata.fields(model):
+            return self._call(model, method, args, kwargs)
+
+        # Base de datos de la solicitud
+        db = self._credentials.db
+        # Campos y contexto solicitados
+        read_kwargs = {k: kwargs[k] for k in ('fields', 'context') if k in kwargs}
+        # Llave de lectura a partir de los campos y el contexto
+        read_key = json.dumps(read_kwargs, sort_keys= True, default= repr)
+
+        # Lectura de IDs: se revalidan las IDs provistas, incluyendo las de
+        # registros archivados ya que `read` también las retorna
+        if method == 'read':
+            record_ids = self._convert_to_list(args[0])
+            context = {**read_kwargs.get('context', {}), 'active_test': False}
+            versions = self._call(
+                model,
+                'search_read',
+                [[('id', 'in', record_ids)]],
+                {'fields': ['write_date'], 'context': context},
+            )
+        # Búsqueda y lectura: se realiza la misma búsqueda obteniendo sólo la
+        # fecha de modificación
+        else:
+            versions = self._call(model, 'search_read', args, {**kwargs, 'fields': ['write_date']})
+            record_ids = [record['id'] for record in versions]
+
+        # Fecha de modificación actual de cada registro
+        write_dates = {record['id']: record['write_date'] for record in versions}
+
+        # Registros guardados y vigentes
+        cached = self._read_cache.get(db, model, read_key, write_dates)
+        records = {
+            record_id: data
+            for ( record_id, ( write_date, data ) ) in cached.items()
+            if write_date == write_dates[record_id]
+        }
+
+        # Lectura de los registros nuevos o modificados
+        stale_ids = [record_id for record_id in write_dates if record_id not in records]
+        if stale_ids:
+            fresh = self._call(model, 'read', [stale_ids], read_kwargs)
+            self._read_cache.set(
+                db,
+                model,
+                read_key,
+                ( (write_dates[record['id']], record) for record in fresh ),
+            )
+            records.update({record['id']: record for record in fresh})
+
+        # Se descartan de la caché los registros que ya no existen
+        if method == 'read':
+            missing_ids = [record_id for record_id in record_ids if record_id not in write_dates]
+            if missing_ids:
+                self._read_cache.delete(db, model, missing_ids)
+
+        return [records[record_id] for record_id in record_ids if record_id in records]
+
+    def _call(
+        self,
+        model: ModelName,
+        method: APIMethods,
+        args: list,
+        kwargs: dict,
+    ):
+
+        # Inicialización de Proxy en modo perezoso
+        self._ensure_proxy()
+
+        # Token de autenticación usado en la solicitud
+        uid = self._uid
+
+        try:
+            return self._execute_kw(uid, model, method, args, kwargs)
+        except client.Fault as error:
+            # Si la solicitud falló por un token vencido de la caché en disco
+            # se renueva el token y se reintenta una única vez
+            if error.faultCode in ACCESS_FAULT_CODES and self._refresh_uid(uid):
+                return self._execute_kw(self._uid, model, method, args, kwargs)
+            raise
+
+    def _execute_kw(
+        self,
+        uid: int,
+        model: ModelName,
+        method: APIMethods,
+        args: list,
+        kwargs: dict,
+    ):
+
+        # Se toma prestada una conexión del pool
+        with self._models.connection() as models:
+            # Se realiza la solicitud al API
+            return models.execute_kw(
+                # Base de datos de la API
+                self._credentials.db,
+                # ID del usuario
+                uid,
+                # Token del usuario
+                self._credentials.token,
+                # Modelo de Odoo
+                model,
+                # Método de solicitud
+                method,
+                # Args
+                args,
+                # Kwargs
+                kwargs
+            )
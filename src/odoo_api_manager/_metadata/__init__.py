@@ -0,0 +1,5 @@
+from ._costs import (
+    FieldCost,
+    measure_field_costs,
+)
+from ._registry import MetadataRegistry
@@ -0,0 +1,92 @@
+from __future__ import annotations
+import xmlrpc.client
+from .._typing.misc import (
+    ModelField,
+    RecordData,
+)
+
+class FieldCost():
+    """
+    ## Costo de un campo
+    Tamaño que ocupa un campo en las respuestas XML-RPC del API, medido en
+    una muestra de registros.
+    - `field`: Nombre del campo.
+    - `ttype`: Tipo del campo en Odoo.
+    - `store`: Indica si el campo se almacena en la base de datos.
+    - `total_bytes`: Bytes del campo en toda la muestra.
+    - `bytes_per_record`: Promedio de bytes del campo por registro.
+    - `share`: Proporción del tamaño total de la muestra.
+    """
+
+    def __init__(
+        self,
+        field: ModelField,
+        ttype: str | None,
+        store: bool | None,
+        total_bytes: int,
+        bytes_per_record: float,
+        share: float,
+    ) -> None:
+
+        # Se guardan los valores
+        self.field = field
+        self.ttype = ttype
+        self.store = store
+        self.total_bytes = total_bytes
+        self.bytes_per_record = bytes_per_record
+        self.share = share
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        return (
+            f'FieldCost(field={self.field!r}, ttype={self.ttype!r}, store={self.store}, '
+            f'total_bytes={self.total_bytes}, bytes_per_record={self.bytes_per_record:.1f}, '
+            f'share={self.share:.1%})'
+        )
+
+def measure_field_costs(
+    response: list[RecordData],
+    definitions: dict[ModelField, RecordData],
+) -> list[FieldCost]:
+    """
+    ## Medición del costo de los campos
+    Esta función mide cuántos bytes ocupa cada campo de los registros
+    provistos al serializarse en XML-RPC, incluyendo el nombre del campo que
+    se repite en cada registro. Los campos se retornan ordenados del más
+    costoso al menos costoso.
+    """
+
+    if not response:
+        return []
+
+    # Tamaño de una estructura vacía, que se descuenta de cada medición
+    empty_size = _xmlrpc_size({})
+
+    # Bytes de cada campo en toda la muestra
+    totals = {
+        name: sum(_xmlrpc_size({name: record[name]}) - empty_size for record in response)
+        for name in response[0]
+    }
+    grand_total = sum(totals.values()) or 1
+
+    costs = [
+        FieldCost(
+            field= name,
+            ttype= definitions.get(name, {}).get('ttype'),
+            store= definitions.get(name, {}).get('store'),
+            total_bytes= total,
+            bytes_per_record= total / len(response),
+            share= total / grand_total,
+        )
+        for ( name, total ) in totals.items()
+    ]
+
+    return sorted(costs, key= lambda cost: cost.total_bytes, reverse= True)
+
+def _xmlrpc_size(
+    value: RecordData,
+) -> int:
+
+    return len(xmlrpc.client.dumps((value,), allow_none= True).encode('utf-8'))
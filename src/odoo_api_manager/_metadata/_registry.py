@@ -0,0 +1,233 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+)
+from .._cache import (
+    default_cache_dir,
+    dump_json,
+    load_json,
+)
+from .._constants import HEAVY_FIELD_TYPES
+from .._resources import Params
+from .._settings import PRESETS
+from .._typing.literals import ModelName
+from .._typing.misc import (
+    ModelField,
+    RecordData,
+)
+
+if TYPE_CHECKING:
+    from .._main import OdooAPIManager
+
+class MetadataRegistry():
+    """
+    ## Registro de metadatos de modelos
+    Esta clase carga una sola vez las definiciones de los campos de cada
+    modelo desde `ir.model.fields` y responde las consultas posteriores desde
+    memoria. Los atributos cargados de cada campo son los declarados en
+    `PRESETS.METADATA_ATTS`.
+
+    Las definiciones se invalidan cuando cambia la versión del servidor de
+    Odoo o con una actualización explícita:
+    >>> odoo.metadata.fields('sale.order')['partner_id']['relation']
+    >>> # 'res.partner'
+    >>> odoo.metadata.refresh('sale.order')
+
+    Con un archivo de caché las definiciones se guardan en disco y se
+    reutilizan en otros procesos mientras la versión del servidor no cambie.
+    """
+
+    def __init__(
+        self,
+        odoo: OdooAPIManager,
+        path: str | os.PathLike | None = None,
+    ) -> None:
+
+        # Instancia de conexión al API
+        self._odoo = odoo
+        # Ruta del archivo de caché. Sin ruta las definiciones sólo se
+        # guardan en memoria
+        self.path = Path(path) if path else None
+        # Versión del servidor con la que se cargaron las definiciones. Se
+        # obtiene hasta la primera consulta
+        self._server_version: str | None = None
+        # Definiciones de los campos por modelo
+        self._models: dict[str, dict[ModelField, RecordData]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default_path(
+        cls,
+    ) -> Path:
+        """
+        ### Ruta predeterminada del archivo de caché
+        """
+
+        return default_cache_dir() / 'metadata.json'
+
+    def fields(
+        self,
+        model: ModelName,
+    ) -> dict[ModelField, RecordData]:
+        """
+        ### Definiciones de los campos de un modelo
+        Este método retorna un diccionario con los atributos de cada campo
+        del modelo, con el nombre del campo como llave.
+        >>> odoo.metadata.fields('res.partner')['country_id']
+        >>> # {'id': 2101, 'name': 'country_id', 'ttype': 'many2one', 'relation': 'res.country', 'store': True, ...}
+        """
+
+        self.warm_up([model])
+
+        with self._lock:
+            return dict(self._models[model])
+
+    def lean_fields(
+        self,
+        model: ModelName,
+    ) -> list[ModelField]:
+        """
+        ### Proyección ligera de un modelo
+        Este método retorna los campos almacenados del modelo, escalares y
+        relacionales, omitiendo los campos calculados no almacenados y los
+        campos de tipo `binary` y `html`.
+        >>> odoo.metadata.lean_fields('res.partner')
+        >>> # ['id', 'name', 'vat', 'country_id', 'write_date', ...]
+        """
+
+        return [
+            name
+            for ( name, definition ) in self.fields(model).items()
+            if definition['store'] and definition['ttype'] not in HEAVY_FIELD_TYPES
+        ]
+
+    def warm_up(
+        self,
+        models: Iterable[ModelName],
+    ) -> None:
+        """
+        ### Precarga de modelos
+        Este método carga simultáneamente las definiciones de los modelos
+        provistos que aún no se han cargado.
+        >>> odoo.metadata.warm_up(['sale.order', 'sale.order.line', 'res.partner'])
+        """
+
+        # Validación de la versión del servidor
+        self._ensure_version()
+
+        # Modelos no cargados
+        with self._lock:
+            missing = [model for model in dict.fromkeys(models) if model not in self._models]
+
+        if missing:
+            self._load(missing)
+
+    def refresh(
+        self,
+        models: ModelName | Iterable[ModelName] | None = None,
+    ) -> None:
+        """
+        ### Actualización de definiciones
+        Este método descarta las definiciones de los modelos provistos y las
+        vuelve a cargar. Sin modelos se descartan todas las definiciones y se
+        vuelve a validar la versión del servidor en la siguiente consulta.
+        >>> odoo.metadata.refresh()
+        >>> odoo.metadata.refresh(['sale.order', 'res.partner'])
+        """
+
+        # Actualización completa
+        if models is None:
+            with self._lock:
+                self._models.clear()
+                self._server_version = None
+            self._save()
+            return
+
+        # Actualización de los modelos provistos
+        models = [models] if isinstance(models, str) else list(models)
+        with self._lock:
+            for model in models:
+                self._models.pop(model, None)
+        self.warm_up(models)
+
+    def _ensure_version(
+        self,
+    ) -> None:
+
+        # Si la versión ya se validó no es necesario obtenerla nuevamente
+        if self._server_version is not None:
+            return
+
+        # Versión actual del servidor
+        server_version = self._odoo.version['server_version']
+
+        with self._lock:
+            if self._server_version is not None:
+                return
+            # Se reutilizan las definiciones en disco de la misma versión
+            if self.path is not None:
+                entry = load_json(self.path).get(self._disk_key(), {})
+                if entry.get('server_version') == server_version:
+                    self._models.update(entry['models'])
+            self._server_version = server_version
+
+    def _load(
+        self,
+        models: list[ModelName],
+    ) -> None:
+
+        # Obtención simultánea de las definiciones
+        definitions = self._odoo._map_concurrently(self._fetch, models)
+
+        with self._lock:
+            self._models.update(zip(models, definitions))
+        self._save()
+
+    def _fetch(
+        self,
+        model: ModelName,
+    ) -> dict[ModelField, RecordData]:
+
+        # Construcción de parámetros
+        params = Params(
+            search_criteria= [('model_id', '=', model)],
+            fields= PRESETS.METADATA_ATTS,
+        )
+
+        # Solicitud directa al API para no obtener respuestas en caché
+        response = self._odoo._call('ir.model.fields', 'search_read', params.args, params.kwargs)
+
+        return {field['name']: field for field in response}
+
+    def _save(
+        self,
+    ) -> None:
+
+        # Sin archivo de caché las definiciones sólo se guardan en memoria
+        if self.path is None:
+            return
+
+        with self._lock:
+            entry = {'server_version': self._server_version, 'models': dict(self._models)}
+
+        # Se reemplaza la entrada de esta conexión manteniendo las demás
+        entries = load_json(self.path)
+        if entry['server_version'] is None:
+            entries.pop(self._disk_key(), None)
+        else:
+            entries[self._disk_key()] = entry
+        dump_json(self.path, entries)
+
+    def _disk_key(
+        self,
+    ) -> str:
+
+        return hashlib.sha256(
+            json.dumps([self._odoo._credentials.url, self._odoo._credentials.db]).encode('utf-8')
+        ).hexdigest()
@@ -0,0 +1,27 @@
+from ._columns import (
+    build_columns,
+    transpose_records,
+)
+from ._export import (
+    open_writer,
+    resolve_export_format,
+)
+from ._frames import build_frame
+from ._many2one import (
+    extract_many2one,
+    split_many2one,
+)
+from ._records import (
+    build_records,
+    build_table,
+    Record,
+    RecordTable,
+)
+from ._related import (
+    merge_related,
+    related_ids,
+)
+from ._x2many import (
+    explode_x2many,
+    take_columns,
+)
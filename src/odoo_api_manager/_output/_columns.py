@@ -0,0 +1,69 @@
+from __future__ import annotations
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+from .._typing.misc import (
+    ColumnData,
+    RecordData,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+def transpose_records(
+    response: list[RecordData],
+) -> dict[str, list[Any]]:
+    """
+    ## Transposición de registros
+    Esta función convierte la lista de registros retornada por el API en un
+    diccionario con una lista de valores por columna. Cada columna se
+    obtiene con iteradores nativos (`map` e `itemgetter`), sin ejecutar
+    código de Python por registro ni construir estructuras intermedias.
+    """
+
+    if not response:
+        return {}
+
+    # Nombres de las columnas tomados del primer registro
+    return {
+        name: list(map(itemgetter(name), response))
+        for name in response[0]
+    }
+
+def build_columns(
+    response: list[RecordData],
+) -> ColumnData:
+    """
+    ## Construcción de columnas
+    Esta función construye el formato de salida por columnas: un diccionario
+    con el nombre de cada campo como llave y sus valores como valor. Las
+    columnas cuyos valores son todos enteros, todos flotantes (o enteros y
+    flotantes) o todos booleanos se convierten en arreglos de NumPy
+    (`int64`, `float64` y `bool`). Las demás columnas se retornan como
+    listas de Python.
+    """
+
+    return {
+        name: _column_array(values)
+        for ( name, values ) in transpose_records(response).items()
+    }
+
+def _column_array(
+    values: list[Any],
+) -> np.ndarray | list:
+
+    import numpy as np
+
+    # Tipos de dato presentes en la columna
+    types = set(map(type, values))
+
+    if types == {int}:
+        return np.array(values, dtype= np.int64)
+    if types == {float} or types == {int, float}:
+        return np.array(values, dtype= np.float64)
+    if types == {bool}:
+        return np.array(values, dtype= bool)
+
+    return values
@@ -0,0 +1,342 @@
+from __future__ import annotations
+import csv
+import json
+import os
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+from .._typing.literals import ExportFormat
+from .._typing.misc import (
+    ModelField,
+    RecordData,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Formatos de exportación por extensión de archivo
+_SUFFIXES: dict[str, ExportFormat] = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.parquet': 'parquet',
+}
+
+def resolve_export_format(
+    path: str | os.PathLike,
+    file_format: ExportFormat | None,
+) -> ExportFormat:
+    """
+    ## Formato de exportación
+    Esta función retorna el formato provisto o, si no se provee, el formato
+    correspondiente a la extensión del archivo.
+    """
+
+    if file_format is None:
+        file_format = _SUFFIXES.get(Path(path).suffix.lower())
+        if file_format is None:
+            raise ValueError(
+                f'No se pudo determinar el formato de exportación de {str(path)!r}. '
+                f'Extensiones reconocidas: {", ".join(_SUFFIXES)}.'
+            )
+    elif file_format not in ('csv', 'jsonl', 'parquet'):
+        raise ValueError(f'Formato de exportación no válido: {file_format!r}.')
+
+    return file_format
+
+class RecordWriter(ABC):
+    """
+    ## Escritura incremental de registros
+    Clase base abstracta de los escritores de exportación. Cada página de
+    registros se añade al archivo en cuanto se recibe, por lo que sólo una
+    página se mantiene en memoria. Las subclases implementan `_write`.
+
+    Las columnas del archivo son la ID y los campos provistos o, si no se
+    proveen, los campos del primer registro.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        fields: list[ModelField] | None = None,
+    ) -> None:
+
+        # Ruta del archivo de salida
+        self.path = Path(path)
+        # Columnas del archivo. La ID se incluye en todas las respuestas
+        self.fields = (
+            ['id', *(name for name in fields if name != 'id')]
+                if fields is not None
+                else None
+        )
+        # Cantidad de registros escritos
+        self.written = 0
+
+    def write(
+        self,
+        page: list[RecordData],
+    ) -> None:
+        """
+        ### Escritura de una página
+        """
+
+        if page:
+            self._write(page)
+            self.written += len(page)
+
+    def close(
+        self,
+    ) -> None:
+        """
+        ### Cierre del archivo
+        """
+
+    @abstractmethod
+    def _write(
+        self,
+        page: list[RecordData],
+    ) -> None:
+        ...
+
+    def _columns(
+        self,
+        page: list[RecordData],
+    ) -> list[ModelField]:
+
+        return self.fields if self.fields is not None else list(page[0])
+
+    def __enter__(
+        self,
+    ):
+
+        return self
+
+    def __exit__(
+        self,
+        *_,
+    ) -> None:
+
+        self.close()
+
+class CSVWriter(RecordWriter):
+    """
+    ## Escritura de registros en CSV
+    Los encabezados son las columnas del archivo. Los campos ausentes en un
+    registro se escriben vacíos y los valores de tipo lista (`many2one`,
+    `one2many` y `many2many`) se escriben en formato JSON.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        fields: list[ModelField] | None = None,
+    ) -> None:
+
+        super().__init__(path, fields)
+        self._file = open(self.path, 'w', encoding= 'utf-8', newline= '')
+        self._writer: csv.DictWriter | None = None
+
+    def close(
+        self,
+    ) -> None:
+
+        self._file.close()
+
+    def _write(
+        self,
+        page: list[RecordData],
+    ) -> None:
+
+        # Escritura del encabezado con la primera página
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self._file,
+                self._columns(page),
+                restval= '',
+                extrasaction= 'ignore',
+            )
+            self._writer.writeheader()
+
+        self._writer.writerows(
+            {
+                name: json.dumps(value) if isinstance(value, list) else value
+                for ( name, value ) in record.items()
+            }
+            for record in page
+        )
+
+class JSONLinesWriter(RecordWriter):
+    """
+    ## Escritura de registros en JSON Lines
+    Cada registro se escribe como un objeto JSON en una línea.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+
+        super().__init__(path)
+        self._file = open(self.path, 'w', encoding= 'utf-8')
+
+    def close(
+        self,
+    ) -> None:
+
+        self._file.close()
+
+    def _write(
+        self,
+        page: list[RecordData],
+    ) -> None:
+
+        self._file.writelines(f'{json.dumps(record)}\n' for record in page)
+
+class ParquetWriter(RecordWriter):
+    """
+    ## Escritura de registros en Parquet
+    Requiere la librería `pyarrow`. El esquema del archivo se construye a
+    partir de los tipos de campo de Odoo:
+    - `integer`: `int64`
+    - `float` y `monetary`: `float64`
+    - `boolean`: `bool`
+    - `many2one`: columnas `<campo>_id` (`int64`) y `<campo>_name` (`string`)
+    - `one2many` y `many2many`: `list<int64>`
+    - Demás tipos, incluyendo fechas en formato ISO: `string`
+
+    En los campos que no son booleanos, el valor `False` con el que el API
+    representa los valores vacíos se escribe como nulo. Cada página se
+    escribe como un grupo de filas. Si no se escribe ningún registro, el
+    archivo se crea vacío con el esquema de los campos provistos o, si no se
+    proveen, de todos los campos de los tipos de campo.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        field_types: dict[str, str],
+        fields: list[ModelField] | None = None,
+    ) -> None:
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError(
+                'La exportación en formato Parquet requiere la librería `pyarrow`.'
+            ) from error
+
+        super().__init__(path, fields)
+        self._field_types = field_types
+        self._pq = pq
+        self._writer: pq.ParquetWriter | None = None
+        self._schema: pa.Schema | None = None
+
+    def close(
+        self,
+    ) -> None:
+
+        if self._writer is not None:
+            self._writer.close()
+            return
+
+        # Sin registros escritos se crea un archivo vacío con el esquema
+        columns = (
+            self.fields
+                if self.fields is not None
+                else ['id', *(name for name in self._field_types if name != 'id')]
+        )
+        self._pq.write_table(self._build_schema(columns).empty_table(), self.path)
+
+    def _write(
+        self,
+        page: list[RecordData],
+    ) -> None:
+
+        import pyarrow as pa
+
+        # Construcción del esquema y apertura del archivo con la primera página
+        if self._schema is None:
+            self._schema = self._build_schema(self._columns(page))
+            self._writer = self._pq.ParquetWriter(self.path, self._schema)
+
+        # Conversión de los registros a los tipos del esquema
+        rows = [self._normalize(record) for record in page]
+        self._writer.write_table(pa.Table.from_pylist(rows, schema= self._schema))
+
+    def _build_schema(
+        self,
+        names: list[str],
+    ) -> pa.Schema:
+
+        import pyarrow as pa
+
+        types = {
+            'integer': pa.int64(),
+            'float': pa.float64(),
+            'monetary': pa.float64(),
+            'boolean': pa.bool_(),
+            'one2many': pa.list_(pa.int64()),
+            'many2many': pa.list_(pa.int64()),
+        }
+
+        schema = []
+        for name in names:
+            ttype = 'integer' if name == 'id' else self._field_types.get(name)
+            if ttype == 'many2one':
+                schema.append((f'{name}_id', pa.int64()))
+                schema.append((f'{name}_name', pa.string()))
+            else:
+                schema.append((name, types.get(ttype, pa.string())))
+
+        return pa.schema(schema)
+
+    def _normalize(
+        self,
+        record: RecordData,
+    ) -> dict[str, Any]:
+
+        row = {}
+        for ( name, value ) in record.items():
+            ttype = 'integer' if name == 'id' else self._field_types.get(name)
+
+            # Valores booleanos y listas de IDs sin conversión
+            if ttype in ('boolean', 'one2many', 'many2many'):
+                row[name] = value
+            # Separación de valores Many2One
+            elif ttype == 'many2one':
+                row[f'{name}_id'] = value[0] if value else None
+                row[f'{name}_name'] = value[1] if value else None
+            # Valores vacíos
+            elif value is False:
+                row[name] = None
+            # Números
+            elif ttype in ('integer', 'float', 'monetary'):
+                row[name] = value
+            # Texto
+            else:
+                row[name] = value if isinstance(value, str) else json.dumps(value)
+
+        return row
+
+def open_writer(
+    path: str | os.PathLike,
+    file_format: ExportFormat,
+    field_types: dict[str, str] | None = None,
+    fields: list[ModelField] | None = None,
+) -> RecordWriter:
+    """
+    ## Apertura de escritor de exportación
+    """
+
+    if file_format == 'csv':
+        return CSVWriter(path, fields)
+    if file_format == 'jsonl':
+        return JSONLinesWriter(path)
+
+    return ParquetWriter(path, field_types or {}, fields)
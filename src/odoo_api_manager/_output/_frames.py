@@ -0,0 +1,104 @@
+from __future__ import annotations
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+from ._columns import (
+    build_columns,
+    transpose_records,
+)
+from ._many2one import split_many2one
+from .._typing.misc import RecordData
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Formatos de fecha con los que el API retorna los valores
+_DATE_FORMATS = {
+    'date': '%Y-%m-%d',
+    'datetime': '%Y-%m-%d %H:%M:%S',
+}
+
+# Tipos de dato de Pandas de los campos numéricos
+_NUMERIC_DTYPES = {
+    'integer': 'Int64',
+    'float': 'Float64',
+    'monetary': 'Float64',
+}
+
+def build_frame(
+    response: list[RecordData],
+    field_types: dict[str, str] | None = None,
+    split_m2o: bool = False,
+) -> pd.DataFrame:
+    """
+    ## Construcción de DataFrame
+    Esta función construye un DataFrame a partir de la respuesta del API. Si
+    se proveen los tipos de campo de Odoo (`ttype`) de las columnas, cada
+    columna se construye con el tipo de dato correspondiente en lugar de
+    `object`:
+    - `date` y `datetime`: `datetime64`
+    - `selection`: `category`
+    - `integer`: `Int64`
+    - `float` y `monetary`: `Float64`
+    - `boolean`: `boolean`
+
+    En los campos que no son booleanos, el valor `False` con el que el API
+    representa los valores vacíos se convierte en nulo.
+
+    Con `split_m2o` cada columna de tipo `many2one` se reemplaza por las
+    columnas `<campo>_id` (`Int64`) y `<campo>_name` (`category`).
+    """
+
+    import pandas as pd
+
+    # Sin registros no hay columnas
+    if not response:
+        return pd.DataFrame()
+
+    # Sin tipos de campo el DataFrame se construye a partir de las columnas
+    if not field_types:
+        return pd.DataFrame(build_columns(response), copy= False)
+
+    # Construcción de cada columna con su tipo de dato
+    columns = {}
+    for ( name, values ) in transpose_records(response).items():
+        ttype = field_types.get(name)
+
+        # Separación de valores Many2One
+        if split_m2o and ttype == 'many2one':
+            ( ids, names, mask ) = split_many2one(values)
+            columns[f'{name}_id'] = pd.arrays.IntegerArray(ids, ~mask)
+            columns[f'{name}_name'] = pd.Categorical(names)
+        else:
+            columns[name] = _typed_column(values, ttype)
+
+    return pd.DataFrame(columns, copy= False)
+
+def _typed_column(
+    values: list[Any],
+    ttype: str | None,
+) -> Any:
+
+    import pandas as pd
+
+    # Los valores booleanos se conservan tal cual
+    if ttype == 'boolean':
+        return pd.array(values, dtype= 'boolean')
+
+    # Tipos sin conversión
+    if ttype not in _DATE_FORMATS and ttype not in _NUMERIC_DTYPES and ttype != 'selection':
+        return values
+
+    # Conversión de `False` en nulo
+    values = [None if value is False else value for value in values]
+
+    # Fechas
+    if ttype in _DATE_FORMATS:
+        return pd.to_datetime(values, format= _DATE_FORMATS[ttype])
+    # Selecciones
+    if ttype == 'selection':
+        return pd.Categorical(values)
+
+    # Números
+    return pd.array(values, dtype= _NUMERIC_DTYPES[ttype])
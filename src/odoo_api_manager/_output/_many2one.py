@@ -0,0 +1,73 @@
+from __future__ import annotations
+from itertools import compress
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+def split_many2one(
+    values: Iterable[Any],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ## Separación de valores Many2One
+    Esta función separa los valores `[id, nombre]` de un campo `many2one` en
+    un arreglo de IDs (`int64`) y un arreglo de nombres (`object`). También
+    retorna la máscara de los valores no vacíos; las posiciones de los
+    valores vacíos (`False`) contienen `0` y `None` respectivamente.
+    """
+
+    import numpy as np
+
+    ( mask, pairs ) = _non_empty_pairs(values)
+    count = len(pairs)
+
+    ids = np.zeros(len(mask), dtype= np.int64)
+    ids[mask] = np.fromiter(map(itemgetter(0), pairs), dtype= np.int64, count= count)
+    names = np.full(len(mask), None, dtype= object)
+    names[mask] = np.fromiter(map(itemgetter(1), pairs), dtype= object, count= count)
+
+    return ( ids, names, mask )
+
+def extract_many2one(
+    values: Iterable[Any],
+    position: int,
+    null_value: Any,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ## Extracción de un elemento de valores Many2One
+    Esta función retorna un arreglo `object` con el elemento de la posición
+    provista (`0` para la ID y `1` para el nombre) de cada valor `many2one`,
+    con `null_value` en las posiciones de los valores vacíos, junto con la
+    máscara de los valores no vacíos.
+    """
+
+    import numpy as np
+
+    ( mask, pairs ) = _non_empty_pairs(values)
+
+    result = np.full(len(mask), null_value, dtype= object)
+    result[mask] = np.fromiter(map(itemgetter(position), pairs), dtype= object, count= len(pairs))
+
+    return ( result, mask )
+
+def _non_empty_pairs(
+    values: Iterable[Any],
+) -> tuple[np.ndarray, list[list]]:
+
+    import numpy as np
+
+    # Los valores se recorren con funciones nativas (`map`, `compress`,
+    # `itemgetter`) en lugar de ejecutar una función de Python por cada
+    # elemento como en `Series.apply`
+    values = values.to_numpy(dtype= object) if hasattr(values, 'to_numpy') else list(values)
+
+    # Máscara de valores no vacíos y pares de éstos
+    mask = np.fromiter(map(bool, values), dtype= bool, count= len(values))
+    pairs = list(compress(values, mask))
+
+    return ( mask, pairs )
@@ -0,0 +1,263 @@
+from __future__ import annotations
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    Iterator,
+)
+from .._typing.literals import ModelName
+from .._typing.misc import (
+    ModelField,
+    RecordData,
+)
+
+class RecordTable():
+    """
+    ## Tabla de registros
+    Formato de salida compacto: una sola tupla de nombres de campo como
+    encabezado y una tupla de valores por registro. A diferencia de una
+    lista de diccionarios, los nombres de los campos no se repiten en cada
+    registro.
+
+    Los valores se consultan por posición de registro y nombre de campo:
+    >>> table = odoo.search_read('sale.order', fields=['name', 'amount_total'], output='tuples')
+    >>> table.fields
+    >>> # ('id', 'name', 'amount_total')
+    >>> table[0]
+    >>> # (52, 'S00052', 1250.0)
+    >>> table[0, 'name']
+    >>> # 'S00052'
+    >>> table.column('amount_total')
+    >>> # [1250.0, 830.5, ...]
+    """
+
+    __slots__ = ('fields', 'rows', '_index')
+
+    def __init__(
+        self,
+        fields: tuple[ModelField, ...],
+        rows: list[tuple],
+    ) -> None:
+
+        # Nombres de los campos
+        self.fields = fields
+        # Valores de los registros
+        self.rows = rows
+        # Posición de cada campo en las tuplas
+        self._index = {name: position for ( position, name ) in enumerate(fields)}
+
+    def column(
+        self,
+        name: ModelField,
+    ) -> list[Any]:
+        """
+        ### Valores de un campo
+        """
+
+        return list(map(itemgetter(self._index[name]), self.rows))
+
+    def to_dicts(
+        self,
+    ) -> list[RecordData]:
+        """
+        ### Conversión a lista de diccionarios
+        """
+
+        return [dict(zip(self.fields, row)) for row in self.rows]
+
+    def __getitem__(
+        self,
+        key: int | slice | tuple[int, ModelField],
+    ) -> Any:
+
+        # Valor de un campo de un registro
+        if isinstance(key, tuple):
+            ( row, name ) = key
+            return self.rows[row][self._index[name]]
+
+        return self.rows[key]
+
+    def __len__(
+        self,
+    ) -> int:
+
+        return len(self.rows)
+
+    def __iter__(
+        self,
+    ) -> Iterator[tuple]:
+
+        return iter(self.rows)
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        return f'RecordTable(fields={self.fields!r}, rows={len(self.rows)})'
+
+class Record(Mapping):
+    """
+    ## Registro compacto
+    Clase base de los registros del formato de salida `records`. Por cada
+    modelo y conjunto de campos se genera una subclase con `__slots__`, por
+    lo que cada registro ocupa una fracción de la memoria de un diccionario.
+
+    Los registros se consultan como diccionarios de sólo lectura o por
+    atributo:
+    >>> record = odoo.read('res.partner', 7, ['name', 'vat'], output='records')[0]
+    >>> record['name']
+    >>> # 'Un cliente'
+    >>> record.vat
+    >>> # 'XAXX010101000'
+    >>> record.to_dict()
+    >>> # {'id': 7, 'name': 'Un cliente', 'vat': 'XAXX010101000'}
+    """
+
+    __slots__ = ()
+
+    # Nombres de los campos
+    _fields: tuple[ModelField, ...] = ()
+    # Atributo en el que se guarda cada campo
+    _attributes: dict[ModelField, str] = {}
+
+    def to_dict(
+        self,
+    ) -> RecordData:
+        """
+        ### Conversión a diccionario
+        """
+
+        return dict(self.items())
+
+    def __getitem__(
+        self,
+        key: ModelField,
+    ) -> Any:
+
+        try:
+            attribute = self._attributes[key]
+        except KeyError:
+            raise KeyError(key) from None
+
+        return getattr(self, attribute)
+
+    def __iter__(
+        self,
+    ) -> Iterator[ModelField]:
+
+        return iter(self._fields)
+
+    def __len__(
+        self,
+    ) -> int:
+
+        return len(self._fields)
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        values = ', '.join(f'{name}={value!r}' for ( name, value ) in self.items())
+
+        return f'{type(self).__name__}({values})'
+
+@lru_cache(maxsize= 256)
+def record_class(
+    model: ModelName | None,
+    fields: tuple[ModelField, ...],
+) -> type[Record]:
+    """
+    ## Clase de registro compacto
+    Esta función genera, una sola vez por modelo y conjunto de campos, la
+    subclase de `Record` con un atributo en `__slots__` por campo. El nombre
+    de la clase se construye a partir del nombre del modelo:
+    >>> record_class('sale.order', ('id', 'name'))
+    >>> # <class 'SaleOrderRecord'>
+    """
+
+    # Los campos cuyo nombre no es un atributo válido (como `__last_update`,
+    # que se alteraría con el prefijo de la clase) se guardan en un atributo
+    # por posición
+    attributes = {
+        name: (
+            name
+                if name.isidentifier() and not name.startswith('__') and not hasattr(Record, name)
+                else f'_field_{position}'
+        )
+        for ( position, name ) in enumerate(fields)
+    }
+
+    # Nombre de la clase
+    name = ''.join(
+        part.capitalize()
+        for part in (model or '').replace('_', '.').split('.')
+    )
+
+    return type(
+        f'{name}Record',
+        (Record,),
+        {
+            '__slots__': tuple(attributes.values()),
+            '_fields': fields,
+            '_attributes': attributes,
+        },
+    )
+
+def build_table(
+    response: list[RecordData],
+) -> RecordTable:
+    """
+    ## Construcción de tabla de registros
+    Esta función construye el formato de salida `tuples` a partir de la
+    respuesta del API. Los nombres de los campos se toman del primer
+    registro.
+    """
+
+    fields = tuple(response[0]) if response else ()
+
+    return RecordTable(fields, _value_tuples(response, fields))
+
+def build_records(
+    response: list[RecordData],
+    model: ModelName | None = None,
+) -> list[Record]:
+    """
+    ## Construcción de registros compactos
+    Esta función construye el formato de salida `records` a partir de la
+    respuesta del API, con la clase de registro del modelo y los campos
+    retornados.
+    """
+
+    if not response:
+        return []
+
+    fields = tuple(response[0])
+    cls = record_class(model, fields)
+
+    # Los valores se asignan directamente en los descriptores de `__slots__`
+    setters = [getattr(cls, attribute).__set__ for attribute in cls._attributes.values()]
+    new = object.__new__
+
+    def build(values: tuple) -> Record:
+        record = new(cls)
+        for ( setter, value ) in zip(setters, values):
+            setter(record, value)
+        return record
+
+    return list(map(build, _value_tuples(response, fields)))
+
+def _value_tuples(
+    response: list[RecordData],
+    fields: tuple[ModelField, ...],
+) -> list[tuple]:
+
+    # Sin campos no hay valores
+    if not fields:
+        return [() for _ in response]
+
+    # `itemgetter` con un solo campo retorna el valor en lugar de una tupla
+    if len(fields) == 1:
+        return [(value,) for value in map(itemgetter(fields[0]), response)]
+
+    return list(map(itemgetter(*fields), response))
@@ -0,0 +1,50 @@
+from __future__ import annotations
+from operator import itemgetter
+from .._typing.aliases import RecordID
+from .._typing.misc import (
+    ModelField,
+    RecordData,
+)
+
+def related_ids(
+    response: list[RecordData],
+    field: ModelField,
+) -> list[RecordID]:
+    """
+    ## IDs referenciadas por un campo Many2One
+    Esta función retorna las IDs distintas a las que hacen referencia los
+    valores `[id, nombre]` de un campo `many2one`, en orden de aparición y
+    omitiendo los valores vacíos.
+    """
+
+    return list(dict.fromkeys(value[0] for value in map(itemgetter(field), response) if value))
+
+def merge_related(
+    response: list[RecordData],
+    field: ModelField,
+    records: dict[RecordID, RecordData],
+    fields: list[ModelField],
+) -> None:
+    """
+    ## Unión de campos de registros relacionados
+    Esta función añade a cada registro de la respuesta los campos provistos
+    del registro al que hace referencia su campo `many2one`, como columnas
+    planas `<campo>.<campo relacionado>`. Los registros sin referencia, o
+    cuya referencia no pudo leerse, reciben `False` como el API en los
+    valores vacíos.
+    """
+
+    # Nombres de las columnas planas
+    columns = [( f'{field}.{name}', name ) for name in fields]
+    # Valores de un registro sin referencia
+    empty = dict.fromkeys((column for ( column, _ ) in columns), False)
+
+    for record in response:
+        value = record[field]
+        related = records.get(value[0]) if value else None
+
+        if related is None:
+            record.update(empty)
+        else:
+            for ( column, name ) in columns:
+                record[column] = related[name]
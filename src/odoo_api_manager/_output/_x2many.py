@@ -0,0 +1,60 @@
+from __future__ import annotations
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING
+from .._typing.misc import (
+    ColumnData,
+    ModelField,
+    RecordData,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+def explode_x2many(
+    response: list[RecordData],
+    field: ModelField,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ## Expansión de valores One2Many y Many2Many
+    Esta función convierte las listas de IDs de un campo `one2many` o
+    `many2many` en dos arreglos `int64` alineados: la ID del registro padre
+    y la ID del registro hijo de cada relación (formato largo).
+    """
+
+    import numpy as np
+
+    values = list(map(itemgetter(field), response))
+    # Cantidad de hijos de cada registro
+    lengths = np.fromiter(map(len, values), dtype= np.int64, count= len(values))
+
+    # La ID del padre se repite una vez por cada hijo
+    parent_ids = np.repeat(
+        np.fromiter(map(itemgetter('id'), response), dtype= np.int64, count= len(response)),
+        lengths,
+    )
+    child_ids = np.fromiter(chain.from_iterable(values), dtype= np.int64, count= int(lengths.sum()))
+
+    return ( parent_ids, child_ids )
+
+def take_columns(
+    columns: ColumnData,
+    positions: np.ndarray,
+) -> ColumnData:
+    """
+    ## Selección de filas de columnas
+    Esta función retorna las columnas provistas con los valores de las
+    posiciones indicadas, como arreglos de NumPy. Las columnas que son
+    listas se convierten en arreglos `object`.
+    """
+
+    import numpy as np
+
+    return {
+        name: (
+            values
+                if isinstance(values, np.ndarray)
+                else np.fromiter(values, dtype= object, count= len(values))
+        )[positions]
+        for ( name, values ) in columns.items()
+    }
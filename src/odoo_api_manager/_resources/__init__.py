@@ -1,2 +1,8 @@
+from ._bulk import (
+    BatchFailure,
+    BulkResult,
+)
 from ._credentials import Credentials
+from ._criteria import and_criteria
+from ._normalizer import normalize_criteria
 from ._params import Params
@@ -0,0 +1,81 @@
+from .._typing.aliases import RecordID
+
+class BatchFailure():
+    """
+    ## Falla de un lote
+    Información de un lote de una operación masiva que no pudo completarse.
+    - `batch`: Número de lote, en el orden en el que fueron construidos.
+    - `error`: Excepción lanzada por la solicitud al API.
+    - `positions`: En creaciones, posiciones de los registros del lote en
+    la lista de datos de entrada. En actualizaciones es `None`.
+    - `record_ids`: En actualizaciones, IDs de los registros del lote. En
+    creaciones es `None`, ya que los registros no llegaron a crearse.
+    """
+
+    def __init__(
+        self,
+        batch: int,
+        error: Exception,
+        positions: list[int] | None = None,
+        record_ids: list[RecordID] | None = None,
+    ) -> None:
+
+        # Se guardan los valores
+        self.batch = batch
+        self.error = error
+        self.positions = positions
+        self.record_ids = record_ids
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        if self.positions is not None:
+            records = f'positions={len(self.positions)}'
+        else:
+            records = f'record_ids={len(self.record_ids or [])}'
+
+        return f'BatchFailure(batch={self.batch}, {records}, error={self.error!r})'
+
+class BulkResult():
+    """
+    ## Resultado de una operación masiva
+    Resultado de las operaciones masivas de creación y actualización. Los
+    lotes que fallaron no afectan a los lotes que se completaron.
+    - `ids`: IDs de los registros. En creaciones se retornan en el mismo
+    orden de los datos de entrada, con `None` en las posiciones de los lotes
+    que fallaron. En actualizaciones se retornan las IDs actualizadas.
+    - `failures`: Lista de lotes que fallaron.
+
+    Uso:
+    >>> result = odoo.bulk_create('res.partner', partners)
+    >>> if not result.ok:
+    >>>     for failure in result.failures:
+    >>>         print(failure.batch, failure.error)
+    """
+
+    def __init__(
+        self,
+        ids: list[RecordID | None],
+        failures: list[BatchFailure],
+    ) -> None:
+
+        # Se guardan los valores
+        self.ids = ids
+        self.failures = failures
+
+    @property
+    def ok(
+        self,
+    ) -> bool:
+        """
+        Indica si todos los lotes se completaron.
+        """
+
+        return not self.failures
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        return f'BulkResult(ids={len(self.ids)}, failures={self.failures!r})'
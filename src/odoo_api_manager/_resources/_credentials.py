@@ -3,7 +3,7 @@ from typing import (
     Optional,
 )
 from .._constants import VARIABLE_NAME
-from .._core import env
+from .._core import get_env
 from .._errors import DatabaseNotDefinedError
 from .._settings import CREDENTIALS_CONFIG
 from .._typing.misc import AltDatabaseArg
@@ -61,4 +61,4 @@ class Credentials():
         # Construcción del nombre de variable
         build_name = f'{VARIABLE_NAME.ALT_DB}_{suffix}'
         # Obtención del nombre de la base de datos
-        self.db = env.variable(build_name, str, ...)
+        self.db = get_env().variable(build_name, str, ...)
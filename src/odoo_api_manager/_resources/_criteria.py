@@ -0,0 +1,21 @@
+from .._typing.criteria_structure import CriteriaStructure
+from .._typing.misc import Triplet
+
+def and_criteria(
+    search_criteria: CriteriaStructure,
+    *conditions: Triplet,
+) -> CriteriaStructure:
+    """
+    ## Adición de condiciones a un criterio de búsqueda
+    Esta función retorna un nuevo criterio de búsqueda en el que las
+    condiciones provistas deben cumplirse además del criterio original. El
+    criterio original no se modifica.
+    >>> and_criteria([('state', '=', 'sale')], ('id', '>', 50))
+    >>> # [('id', '>', 50), ('state', '=', 'sale')]
+
+    Odoo une con `&` implícitos todas las expresiones del nivel superior de
+    un criterio, por lo que basta con anteponer las condiciones, incluso si
+    el criterio original contiene operadores `|`.
+    """
+
+    return [*conditions, *search_criteria]
@@ -0,0 +1,287 @@
+from __future__ import annotations
+import json
+from typing import Any
+from .._errors import InvalidCriteriaError
+from .._typing.criteria_structure import CriteriaStructure
+
+# Expresiones de Odoo que siempre se cumplen o nunca se cumplen
+TRUE_LEAF = (1, '=', 1)
+FALSE_LEAF = (0, '=', 1)
+
+# Nodos del árbol de expresiones. Los operadores `&` y `|` se representan
+# con todos sus operandos (n-arios) y las condiciones como `('leaf', tupla)`
+_TRUE = ('true', None)
+_FALSE = ('false', None)
+
+def normalize_criteria(
+    search_criteria: CriteriaStructure,
+) -> CriteriaStructure:
+    """
+    ## Normalización de criterios de búsqueda
+    Esta función valida la notación polaca (prefija) de un criterio de
+    búsqueda y retorna un criterio equivalente, simplificado y en forma
+    canónica:
+    - Los operadores `&` y `|` anidados se aplanan.
+    - Las condiciones `=` e `in` sobre un mismo campo unidas por `|` se
+    combinan en una sola condición `in`.
+    - Las listas de las condiciones `in` y `not in` se depuran de valores
+    repetidos y se ordenan, y las condiciones `in` de un solo valor se
+    convierten en condiciones `=`.
+    - Las condiciones repetidas se eliminan.
+    - Las condiciones que siempre se cumplen (como `(1, '=', 1)` o
+    `('id', 'not in', [])`) se eliminan y las que nunca se cumplen anulan a
+    su grupo.
+    - Los operandos de `&` y `|` se ordenan, por lo que criterios
+    equivalentes construidos en distinto orden producen el mismo criterio y
+    pueden usarse como llave de caché.
+
+    >>> normalize_criteria(['|', '|', ('state', '=', 'sale'), ('state', '=', 'done'), ('state', '=', 'sale')])
+    >>> # [('state', 'in', ['done', 'sale'])]
+
+    Si el criterio no es válido se lanza `InvalidCriteriaError`.
+    """
+
+    node = _optimize(_parse(search_criteria))
+
+    # Criterio que siempre se cumple
+    if node == _TRUE:
+        return []
+
+    # Las expresiones de un `&` de nivel superior se unen implícitamente
+    if node[0] == '&':
+        return [term for child in node[1] for term in _serialize(child)]
+
+    return _serialize(node)
+
+def _parse(
+    search_criteria: CriteriaStructure,
+) -> tuple:
+
+    if not isinstance(search_criteria, (list, tuple)):
+        raise InvalidCriteriaError(f'El criterio de búsqueda debe ser una lista: {search_criteria!r}.')
+
+    # Los términos se recorren de derecha a izquierda, por lo que cada
+    # operador encuentra sus operandos en la pila
+    stack: list[tuple] = []
+    for term in reversed(search_criteria):
+        if term in ('&', '|'):
+            if len(stack) < 2:
+                raise InvalidCriteriaError(f'El operador {term!r} requiere dos expresiones.')
+            operands = [stack.pop(), stack.pop()]
+            stack.append(_group(term, operands))
+        elif term == '!':
+            if not stack:
+                raise InvalidCriteriaError("El operador '!' requiere una expresión.")
+            stack.append(('!', [stack.pop()]))
+        else:
+            stack.append(('leaf', _leaf(term)))
+
+    # Las expresiones del nivel superior se unen con un `&` implícito
+    stack.reverse()
+
+    return _group('&', stack)
+
+def _leaf(
+    term: Any,
+) -> tuple:
+
+    # Validación de la estructura de la condición
+    if (
+        not isinstance(term, (list, tuple))
+        or len(term) != 3
+        or not isinstance(term[1], str)
+        or not ( isinstance(term[0], str) or tuple(term) in ( TRUE_LEAF, FALSE_LEAF ) )
+    ):
+        raise InvalidCriteriaError(f'Condición no válida en el criterio de búsqueda: {term!r}.')
+
+    ( field, operator, value ) = term
+    # Copia de las listas de valores para no modificar el criterio original
+    if isinstance(value, (list, tuple)):
+        value = list(value)
+
+    return ( field, operator, value )
+
+def _group(
+    operator: str,
+    operands: list[tuple],
+) -> tuple:
+
+    # Los operandos con el mismo operador se integran al grupo
+    children = []
+    for operand in operands:
+        if operand[0] == operator:
+            children.extend(operand[1])
+        else:
+            children.append(operand)
+
+    return ( operator, children )
+
+def _optimize(
+    node: tuple,
+) -> tuple:
+
+    kind = node[0]
+
+    if kind == 'leaf':
+        return _optimize_leaf(node[1])
+
+    if kind == '!':
+        child = _optimize(node[1][0])
+        if child == _TRUE:
+            return _FALSE
+        if child == _FALSE:
+            return _TRUE
+        return ( '!', [child] )
+
+    # Expresiones que anulan al grupo y expresiones que no lo afectan
+    ( absorbing, neutral ) = ( _FALSE, _TRUE ) if kind == '&' else ( _TRUE, _FALSE )
+
+    children = []
+    for child in _group(kind, [_optimize(child) for child in node[1]])[1]:
+        if child == absorbing:
+            return absorbing
+        if child != neutral:
+            children.append(child)
+
+    # Combinación de condiciones de igualdad en condiciones `in`
+    if kind == '|':
+        children = _fold_equalities(children)
+
+    # Eliminación de expresiones repetidas y orden canónico
+    unique = {_key(child): child for child in children}
+    children = [unique[key] for key in sorted(unique)]
+
+    if not children:
+        return neutral
+    if len(children) == 1:
+        return children[0]
+
+    return ( kind, children )
+
+def _optimize_leaf(
+    leaf: tuple,
+) -> tuple:
+
+    # Condiciones constantes
+    if leaf == TRUE_LEAF:
+        return _TRUE
+    if leaf == FALSE_LEAF:
+        return _FALSE
+
+    ( field, operator, value ) = leaf
+
+    if operator in ('in', 'not in') and isinstance(value, list):
+        # Una lista vacía nunca se cumple con `in` y siempre con `not in`
+        if not value:
+            return _FALSE if operator == 'in' else _TRUE
+        if operator == 'in':
+            return _membership(field, _canonical_values(value))
+        return ( 'leaf', ( field, operator, _canonical_values(value) ) )
+
+    # Todos los registros tienen ID
+    if field == 'id' and operator == '!=' and value is False:
+        return _TRUE
+
+    return ( 'leaf', leaf )
+
+def _fold_equalities(
+    children: list[tuple],
+) -> list[tuple]:
+
+    # Condiciones `=` e `in` por campo
+    equalities: dict[str, list[tuple]] = {}
+    for child in children:
+        if _is_equality(child):
+            equalities.setdefault(child[1][0], []).append(child)
+
+    # Cada campo con varias condiciones se reemplaza por una sola condición
+    # `in` en la posición de su primera condición
+    folded = []
+    for child in children:
+        if _is_equality(child):
+            group = equalities.pop(child[1][0], None)
+            # Condición ya combinada
+            if group is None:
+                continue
+            if len(group) > 1:
+                values = [
+                    value
+                    for ( _, ( _, operator, value ) ) in group
+                    for value in (value if operator == 'in' else [value])
+                ]
+                child = _membership(child[1][0], _canonical_values(values))
+        folded.append(child)
+
+    return folded
+
+def _membership(
+    field: str,
+    values: list,
+) -> tuple:
+
+    # Una condición `in` de un solo valor equivale a una condición `=`
+    if len(values) == 1 and _is_scalar(values[0]):
+        return ( 'leaf', ( field, '=', values[0] ) )
+
+    return ( 'leaf', ( field, 'in', values ) )
+
+def _is_equality(
+    node: tuple,
+) -> bool:
+
+    if node[0] != 'leaf':
+        return False
+
+    ( _, operator, value ) = node[1]
+
+    if operator == '=':
+        return _is_scalar(value)
+    if operator == 'in':
+        return isinstance(value, list) and all(map(_is_scalar, value))
+
+    return False
+
+def _is_scalar(
+    value: Any,
+) -> bool:
+
+    # Los valores booleanos y nulos tienen un significado especial en Odoo
+    # (campos vacíos), por lo que no se combinan
+    return type(value) in (int, float, str)
+
+def _canonical_values(
+    values: list,
+) -> list:
+
+    # Sólo se depuran y ordenan las listas de un solo tipo de dato para no
+    # mezclar valores como `1` y `True`
+    if values and len(set(map(type, values))) == 1 and type(values[0]) in (int, float, str):
+        return sorted(set(values))
+
+    return values
+
+def _key(
+    node: tuple,
+) -> str:
+
+    return json.dumps(_serialize(node), default= repr)
+
+def _serialize(
+    node: tuple,
+) -> CriteriaStructure:
+
+    kind = node[0]
+
+    if kind == 'leaf':
+        return [node[1]]
+    if node == _TRUE:
+        return [TRUE_LEAF]
+    if node == _FALSE:
+        return [FALSE_LEAF]
+    if kind == '!':
+        return ['!', *_serialize(node[1][0])]
+
+    # Un operador binario por cada operando adicional, seguido de los operandos
+    operators = [kind] * (len(node[1]) - 1)
+
+    return [*operators, *(term for child in node[1] for term in _serialize(child))]
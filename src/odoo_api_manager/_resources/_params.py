@@ -20,6 +20,7 @@ class Params:
         fields: Optional[list[ModelField]] = None,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        order: Optional[str] = None,
         raise_exception: Optional[bool] = None,
         right_type: Optional[AccessRights] = None,
         kwargs: dict[str, SerializableValue] = None,
@@ -33,6 +34,7 @@ class Params:
             'fields': fields,
             'offset': offset,
             'limit': limit,
+            'order': order,
             'raise_exception': raise_exception,
             'kwargs': kwargs,
         }
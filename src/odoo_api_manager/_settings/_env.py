@@ -1,10 +1,32 @@
+from functools import cached_property
 from .._constants import VARIABLE_NAME
-from .._core import env
-
-class CREDENTIALS_CONFIG:
-    USERNAME = env.variable(VARIABLE_NAME.USERNAME, str, ...)
-    TOKEN = env.variable(VARIABLE_NAME.TOKEN, str, ...)
-    TOKEN = env.variable(VARIABLE_NAME.TOKEN, str, ...)
-    URL = env.variable(VARIABLE_NAME.URL, str, ...)
-    DB = env.variable(VARIABLE_NAME.DB, str, ...)
-    ALT_DB = env.variable(VARIABLE_NAME.ALT_DB, str, ...)
+from .._core import get_env
+
+class _CredentialsConfig:
+    """
+    ## Credenciales desde el entorno
+    Las variables de entorno se leen hasta su primer uso y se conservan para
+    los usos siguientes.
+    """
+
+    @cached_property
+    def USERNAME(self) -> str:
+        return get_env().variable(VARIABLE_NAME.USERNAME, str, ...)
+
+    @cached_property
+    def TOKEN(self) -> str:
+        return get_env().variable(VARIABLE_NAME.TOKEN, str, ...)
+
+    @cached_property
+    def URL(self) -> str:
+        return get_env().variable(VARIABLE_NAME.URL, str, ...)
+
+    @cached_property
+    def DB(self) -> str:
+        return get_env().variable(VARIABLE_NAME.DB, str, ...)
+
+    @cached_property
+    def ALT_DB(self) -> str | None:
+        return get_env().variable(VARIABLE_NAME.ALT_DB, str, None)
+
+CREDENTIALS_CONFIG = _CredentialsConfig()
@@ -10,3 +10,68 @@ class PRESETS:
         'state',
         'relation'
     ]
+
+    METADATA_ATTS: list[FieldFields] = [
+        'name',
+        'field_description',
+        'model_id',
+        'ttype',
+        'state',
+        'relation',
+        'store',
+        'required',
+        'readonly',
+    ]
+    """
+    Atributos de los campos cargados en el registro de metadatos.
+    """
+
+    POOL_SIZE: int = 4
+    """
+    Cantidad predeterminada de conexiones simultáneas al API por instancia.
+    """
+
+    TIMEOUT: float = 120.0
+    """
+    Tiempo máximo predeterminado, en segundos, de espera de cada operación
+    de red (conexión, envío o lectura de la respuesta) en las solicitudes
+    del cliente asíncrono. El cliente síncrono espera indefinidamente a
+    menos que se provea un tiempo.
+    """
+
+    PAGE_SIZE: int = 1000
+    """
+    Cantidad predeterminada de registros por página en lecturas paginadas.
+    """
+
+    CHUNK_SIZE: int = 2000
+    """
+    Cantidad predeterminada de IDs por bloque en lecturas simultáneas.
+    """
+
+    BATCH_SIZE: int = 500
+    """
+    Cantidad predeterminada de registros por lote en operaciones masivas.
+    """
+
+    SYNC_OVERLAP: float = 300.0
+    """
+    Ventana predeterminada, en segundos, que cada sincronización incremental
+    vuelve a consultar antes de la marca de agua.
+    """
+
+    SAMPLE_SIZE: int = 100
+    """
+    Cantidad predeterminada de registros de muestra en el reporte de costo
+    de los campos.
+    """
+
+    CACHE_TTL: float = 60.0
+    """
+    Tiempo de vida predeterminado, en segundos, de las respuestas en caché.
+    """
+
+    CACHE_SIZE: int = 1024
+    """
+    Cantidad máxima predeterminada de respuestas en caché.
+    """
@@ -0,0 +1,3 @@
+from ._engine import SyncEngine
+from ._result import SyncResult
+from ._store import SyncStore
@@ -0,0 +1,287 @@
+from __future__ import annotations
+import json
+import os
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+from ._result import SyncResult
+from ._store import SyncStore
+from .._resources import (
+    and_criteria,
+    normalize_criteria,
+    Params,
+)
+from .._output import (
+    Record,
+    RecordTable,
+)
+from .._settings import PRESETS
+from .._typing.aliases import RecordID
+from .._typing.criteria_structure import CriteriaStructure
+from .._typing.literals import (
+    ModelName,
+    OutputOptions,
+)
+from .._typing.misc import (
+    ColumnData,
+    ModelField,
+    RecordData,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .._main import OdooAPIManager
+
+# Formato de las fechas de modificación del API
+_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+class SyncEngine():
+    """
+    # Sincronización incremental de modelos
+    Esta clase mantiene una réplica local en SQLite de los modelos de Odoo y,
+    en cada sincronización, obtiene sólo los registros creados o modificados
+    desde la sincronización anterior. El tiempo de sincronización depende de
+    la cantidad de cambios y no del tamaño del modelo.
+
+    Forma de uso:
+    >>> odoo = OdooAPIManager()
+    >>> sync = SyncEngine(odoo)
+    >>> sync.sync('res.partner', fields=['name', 'vat', 'country_id'])
+    >>> # SyncResult(model='res.partner', upserted=15230, deleted=0)
+    >>> sync.sync('res.partner', fields=['name', 'vat', 'country_id'])
+    >>> # SyncResult(model='res.partner', upserted=12, deleted=1)
+
+    ### Marca de agua
+    Por cada modelo se guarda la fecha de modificación (`write_date`) y la
+    ID del último registro sincronizado. Los registros se obtienen en
+    páginas ordenadas por `write_date` e `id`, continuando a partir de la
+    marca de agua, la cual se guarda junto con cada página. Si la
+    sincronización se interrumpe, la siguiente continúa desde la última
+    página guardada.
+
+    Cada sincronización vuelve a obtener los registros modificados en los
+    `overlap` segundos previos a la marca de agua. Odoo asigna `write_date`
+    al iniciar la transacción y no al confirmarla, por lo que una
+    transacción larga puede confirmar un registro con una fecha anterior a
+    una marca de agua ya guardada por una sincronización simultánea. Los
+    registros se insertan o reemplazan, así que volver a obtenerlos no
+    altera la réplica. La ventana también cubre la precisión de segundos de
+    `write_date`.
+
+    ### Eliminaciones
+    Los registros eliminados en Odoo no aparecen en las búsquedas por fecha
+    de modificación, por lo que se detectan comparando las IDs de la réplica
+    con las IDs existentes en Odoo, en bloques de `chunk_size` IDs. Los
+    registros archivados se mantienen en la réplica.
+
+    ### Alcance
+    Si los campos o el criterio de búsqueda de un modelo cambian respecto a
+    la sincronización anterior, la réplica del modelo se reconstruye.
+    """
+
+    def __init__(
+        self,
+        odoo: OdooAPIManager,
+        path: str | os.PathLike | None = None,
+        page_size: int = PRESETS.PAGE_SIZE,
+        chunk_size: int = PRESETS.CHUNK_SIZE,
+        overlap: float = PRESETS.SYNC_OVERLAP,
+    ) -> None:
+
+        # Validación de parámetros
+        if page_size < 1:
+            raise ValueError('El tamaño de página debe ser de al menos 1 registro.')
+        if chunk_size < 1:
+            raise ValueError('El tamaño de bloque debe ser de al menos 1 ID.')
+        if overlap < 0:
+            raise ValueError('La ventana de traslape no puede ser negativa.')
+
+        # Se guardan los valores
+        self._odoo = odoo
+        self._page_size = page_size
+        self._chunk_size = chunk_size
+        self._overlap = timedelta(seconds= overlap)
+        # Réplica local. Por defecto en `~/.cache/odoo_api_manager/mirror.sqlite3`
+        self.store = SyncStore(path)
+
+    def sync(
+        self,
+        model: ModelName,
+        fields: list[ModelField] = None,
+        search_criteria: CriteriaStructure = [],
+        detect_deletions: bool = True,
+    ) -> SyncResult:
+        """
+        ## Sincronización de un modelo
+        Este método obtiene los registros del modelo creados o modificados
+        desde la sincronización anterior y los inserta o reemplaza en la
+        réplica local. Con `detect_deletions` también se eliminan de la
+        réplica los registros que ya no existen en Odoo o que ya no cumplen
+        el criterio de búsqueda.
+        >>> sync.sync('sale.order', ['name', 'state', 'amount_total'], [('state', '!=', 'cancel')])
+        """
+
+        # Campos a sincronizar
+        fields = self._odoo._projection(model, fields)
+
+        # El campo de fecha de modificación es necesario para la marca de agua
+        if fields is not None and 'write_date' not in fields:
+            fields = [*fields, 'write_date']
+
+        # Alcance de la sincronización
+        scope = json.dumps({'fields': fields, 'search_criteria': normalize_criteria(search_criteria)}, default= repr)
+        # Marca de agua de la sincronización anterior
+        watermark = self.store.get_watermark(model, scope)
+        # Si el modelo no se ha sincronizado con este alcance se reconstruye
+        if watermark is None:
+            self.store.reset(model)
+
+        # Obtención y guardado de los registros modificados
+        upserted = 0
+        for page in self._iter_changes(model, fields, search_criteria, watermark):
+            self.store.upsert(model, scope, page)
+            upserted += len(page)
+
+        # Detección de registros eliminados
+        deleted = (
+            self._delete_missing(model, search_criteria)
+                if detect_deletions and watermark is not None
+                else 0
+        )
+
+        return SyncResult(model, upserted, deleted)
+
+    def reset(
+        self,
+        model: ModelName,
+    ) -> None:
+        """
+        ## Reinicio de un modelo
+        Este método elimina la réplica y la marca de agua del modelo, por lo
+        que la siguiente sincronización obtiene todos sus registros.
+        """
+
+        self.store.reset(model)
+
+    def records(
+        self,
+        model: ModelName,
+        output: Optional[OutputOptions] = None,
+    ) -> list[RecordData] | ColumnData | RecordTable | list[Record] | pd.DataFrame:
+        """
+        ## Registros de la réplica
+        Este método retorna los registros guardados del modelo en el formato
+        de salida de la instancia de `OdooAPIManager`.
+        >>> sync.records('res.partner')
+        """
+
+        return self._odoo._build_output(
+            list(self.store.records(model)),
+            output,
+            self._odoo._frame_types(model, output),
+            model= model,
+        )
+
+    def close(
+        self,
+    ) -> None:
+        """
+        ## Cierre de la réplica
+        """
+
+        self.store.close()
+
+    def _iter_changes(
+        self,
+        model: ModelName,
+        fields: list[ModelField] | None,
+        search_criteria: CriteriaStructure,
+        watermark: tuple[str, RecordID] | None,
+    ):
+
+        # Primera página: se incluyen los registros modificados en la ventana
+        # de traslape previa a la marca de agua
+        page_criteria = (
+            search_criteria
+                if watermark is None
+                else and_criteria(search_criteria, ('write_date', '>=', self._since(watermark[0])))
+        )
+
+        while True:
+            params = Params(
+                search_criteria= page_criteria,
+                fields= fields,
+                limit= self._page_size,
+                order= 'write_date asc, id asc',
+                kwargs= {'context': {'active_test': False}},
+            )
+            # Solicitud directa al API para no obtener respuestas en caché
+            page = self._odoo._call(model, 'search_read', params.args, params.kwargs)
+
+            if not page:
+                return
+
+            yield page
+
+            # Si la página está incompleta ya no hay más registros
+            if len(page) < self._page_size:
+                return
+
+            # Siguientes páginas: registros posteriores al último obtenido en
+            # el orden de (`write_date`, `id`)
+            ( write_date, last_id ) = ( page[-1]['write_date'], page[-1]['id'] )
+            page_criteria = and_criteria(
+                search_criteria,
+                '|',
+                ('write_date', '>', write_date),
+                '&',
+                ('write_date', '=', write_date),
+                ('id', '>', last_id),
+            )
+
+    def _since(
+        self,
+        write_date: str,
+    ) -> str:
+
+        # Fecha de modificación de la marca de agua menos la ventana de
+        # traslape, en el formato de fechas del API
+        since = datetime.strptime(write_date, _DATETIME_FORMAT) - self._overlap
+
+        return since.strftime(_DATETIME_FORMAT)
+
+    def _delete_missing(
+        self,
+        model: ModelName,
+        search_criteria: CriteriaStructure,
+    ) -> int:
+
+        # IDs de la réplica en bloques
+        local_ids = self.store.ids(model)
+        chunks = [
+            local_ids[start:start + self._chunk_size]
+            for start in range(0, len(local_ids), self._chunk_size)
+        ]
+
+        def find_missing(chunk: list[RecordID]) -> list[RecordID]:
+            params = Params(
+                search_criteria= and_criteria(search_criteria, ('id', 'in', chunk)),
+                kwargs= {'context': {'active_test': False}},
+            )
+            existing = set(self._odoo._call(model, 'search', params.args, params.kwargs))
+            return [record_id for record_id in chunk if record_id not in existing]
+
+        # Comparación simultánea de los bloques
+        missing = [
+            record_id
+            for chunk_missing in self._odoo._map_concurrently(find_missing, chunks)
+            for record_id in chunk_missing
+        ]
+        self.store.delete(model, missing)
+
+        return len(missing)
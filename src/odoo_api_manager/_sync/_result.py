@@ -0,0 +1,26 @@
+class SyncResult():
+    """
+    ## Resultado de una sincronización
+    - `model`: Modelo sincronizado.
+    - `upserted`: Cantidad de registros insertados o reemplazados en la
+    réplica.
+    - `deleted`: Cantidad de registros eliminados de la réplica.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        upserted: int,
+        deleted: int,
+    ) -> None:
+
+        # Se guardan los valores
+        self.model = model
+        self.upserted = upserted
+        self.deleted = deleted
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        return f'SyncResult(model={self.model!r}, upserted={self.upserted}, deleted={self.deleted})'
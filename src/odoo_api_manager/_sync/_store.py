@@ -0,0 +1,224 @@
+from __future__ import annotations
+import json
+import os
+import threading
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    Iterator,
+)
+from .._cache import default_cache_dir
+
+if TYPE_CHECKING:
+    import sqlite3
+
+class SyncStore():
+    """
+    ## Réplica local de modelos
+    Esta clase guarda en una base de datos SQLite los registros sincronizados
+    de cada modelo y la marca de agua de la última sincronización.
+
+    Los datos de cada registro se guardan en formato JSON en la columna
+    `data` de la tabla `records`, por lo que pueden consultarse directamente
+    con las funciones JSON de SQLite:
+    ```sql
+    SELECT id, json_extract(data, '$.name') FROM records WHERE model = 'res.partner';
+    ```
+    """
+
+    _SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS records ('
+        'model TEXT NOT NULL, '
+        'id INTEGER NOT NULL, '
+        'write_date TEXT, '
+        'data TEXT NOT NULL, '
+        'PRIMARY KEY (model, id)); '
+        'CREATE TABLE IF NOT EXISTS watermarks ('
+        'model TEXT PRIMARY KEY, '
+        'scope TEXT NOT NULL, '
+        'write_date TEXT NOT NULL, '
+        'last_id INTEGER NOT NULL)'
+    )
+
+    # Cantidad máxima de parámetros por consulta en SQLite
+    _MAX_VARIABLES = 900
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+    ) -> None:
+
+        # Ruta de la base de datos
+        self.path = Path(path) if path else default_cache_dir() / 'mirror.sqlite3'
+        # Conexión a la base de datos. Se abre hasta su primer uso
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def get_watermark(
+        self,
+        model: str,
+        scope: str,
+    ) -> tuple[str, int] | None:
+        """
+        ### Obtención de la marca de agua
+        Este método retorna la fecha de modificación y la ID del último
+        registro sincronizado del modelo, o `None` si el modelo no se ha
+        sincronizado con el alcance provisto.
+        """
+
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT scope, write_date, last_id FROM watermarks WHERE model = ?',
+                [model],
+            ).fetchone()
+
+        if row is None or row[0] != scope:
+            return None
+
+        return ( row[1], row[2] )
+
+    def upsert(
+        self,
+        model: str,
+        scope: str,
+        records: list[dict],
+    ) -> None:
+        """
+        ### Guardado de registros
+        Este método inserta o reemplaza los registros provistos y avanza la
+        marca de agua al último de éstos en la misma transacción, por lo que
+        una sincronización interrumpida continúa desde la última página
+        guardada.
+        """
+
+        if not records:
+            return
+
+        rows = [
+            (model, record['id'], record['write_date'], json.dumps(record))
+            for record in records
+        ]
+        last = records[-1]
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    'INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)',
+                    rows,
+                )
+                connection.execute(
+                    'INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)',
+                    [model, scope, last['write_date'], last['id']],
+                )
+
+    def delete(
+        self,
+        model: str,
+        record_ids: Iterable[int],
+    ) -> None:
+        """
+        ### Eliminación de registros
+        """
+
+        record_ids = list(record_ids)
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for start in range(0, len(record_ids), self._MAX_VARIABLES):
+                    chunk = record_ids[start:start + self._MAX_VARIABLES]
+                    connection.execute(
+                        'DELETE FROM records WHERE model = ? '
+                        f'AND id IN ({", ".join("?" * len(chunk))})',
+                        [model, *chunk],
+                    )
+
+    def reset(
+        self,
+        model: str,
+    ) -> None:
+        """
+        ### Reinicio de un modelo
+        Este método elimina los registros y la marca de agua del modelo.
+        """
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute('DELETE FROM records WHERE model = ?', [model])
+                connection.execute('DELETE FROM watermarks WHERE model = ?', [model])
+
+    def ids(
+        self,
+        model: str,
+    ) -> list[int]:
+        """
+        ### IDs guardadas
+        Este método retorna las IDs guardadas del modelo en orden ascendente.
+        """
+
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT id FROM records WHERE model = ? ORDER BY id',
+                [model],
+            ).fetchall()
+
+        return [row[0] for row in rows]
+
+    def records(
+        self,
+        model: str,
+    ) -> Iterator[dict]:
+        """
+        ### Registros guardados
+        Este método retorna un generador de los registros guardados del
+        modelo en orden de ID.
+        """
+
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT data FROM records WHERE model = ? ORDER BY id',
+                [model],
+            ).fetchall()
+
+        for ( data, ) in rows:
+            yield json.loads(data)
+
+    def close(
+        self,
+    ) -> None:
+        """
+        ### Cierre de la conexión
+        La conexión se vuelve a abrir automáticamente en el siguiente uso.
+        """
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(
+        self,
+    ) -> sqlite3.Connection:
+
+        # Si la conexión ya está abierta se reutiliza
+        if self._connection is not None:
+            return self._connection
+
+        # Importación perezosa ya que sólo se usa al sincronizar
+        import sqlite3
+
+        # Creación del directorio de la base de datos
+        self.path.parent.mkdir(parents= True, exist_ok= True)
+
+        # Apertura de la conexión. El candado de la instancia serializa su
+        # uso entre hilos
+        connection = sqlite3.connect(self.path, timeout= 30, check_same_thread= False)
+        # Modo WAL para permitir lecturas mientras se sincroniza
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.executescript(self._SCHEMA)
+        self._connection = connection
+
+        return connection
@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING
+from ._pool import (
+    create_proxy,
+    ProxyPool,
+)
+
+if TYPE_CHECKING:
+    from ._async_pool import AsyncProxyPool
+
+def __getattr__(name: str):
+
+    # El pool asíncrono se importa hasta que se solicita para no cargar
+    # `asyncio` en aplicaciones síncronas
+    if name == 'AsyncProxyPool':
+        from ._async_pool import AsyncProxyPool
+        return AsyncProxyPool
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,256 @@
+import asyncio
+import gzip
+import ssl
+from urllib.parse import urlsplit
+from xmlrpc import client
+from .._settings import PRESETS
+
+class _AsyncConnection():
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+
+        # Se guardan los flujos de la conexión
+        self.reader = reader
+        self.writer = writer
+        # Indicador de si la conexión puede reutilizarse
+        self.reusable = True
+
+    async def close(
+        self,
+    ) -> None:
+
+        # Cierre del flujo de escritura
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, ssl.SSLError):
+            pass
+
+class AsyncProxyPool():
+    """
+    ## Pool asíncrono de conexiones XML-RPC
+    Esta clase realiza llamadas XML-RPC directamente sobre `asyncio`, sin
+    bloquear el event loop ni depender de hilos. Mantiene un conjunto de
+    conexiones HTTP(S) persistentes hacia un mismo endpoint y limita la
+    cantidad de llamadas simultáneas al tamaño del pool:
+    >>> pool = AsyncProxyPool('https://your-database-name.odoo.com/xmlrpc/2/object', 4)
+    >>> await pool.call('execute_kw', db, uid, token, 'res.partner', 'search', [[]])
+
+    La serialización y deserialización de los mensajes se realiza con
+    `xmlrpc.client`, por lo que los valores y errores (`Fault`,
+    `ProtocolError`) son los mismos que en la versión síncrona.
+
+    Cada operación de red (conexión, envío y lectura de la respuesta) espera
+    como máximo `timeout` segundos, tras los cuales se lanza `TimeoutError`,
+    se cierra la conexión y se libera su lugar en el pool. Las respuestas
+    comprimidas con `gzip` se descomprimen y cualquier otra codificación de
+    contenido se rechaza con `ProtocolError`.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int,
+        timeout: float | None = PRESETS.TIMEOUT,
+    ) -> None:
+
+        # Validación del tamaño del pool
+        if size < 1:
+            raise ValueError('El tamaño del pool de conexiones debe ser de al menos 1.')
+
+        # Desglose de la URL
+        parts = urlsplit(url)
+        self._url = url
+        self._host = parts.hostname
+        self._secure = parts.scheme == 'https'
+        self._port = parts.port or (443 if self._secure else 80)
+        self._path = parts.path or '/'
+        self._host_header = parts.netloc
+        self.size = size
+        self.timeout = timeout
+
+        # Conexiones disponibles
+        self._idle: list[_AsyncConnection] = []
+        # Límite de llamadas simultáneas
+        self._slots = asyncio.Semaphore(size)
+
+    async def call(
+        self,
+        method: str,
+        *params,
+    ):
+        """
+        ### Llamada a un método remoto
+        Este método serializa la llamada, la envía por una conexión del pool y
+        retorna el valor deserializado de la respuesta.
+        """
+
+        # Construcción del cuerpo de la solicitud
+        body = client.dumps(params, method).encode('utf-8')
+
+        async with self._slots:
+            # Si la conexión reutilizada fue cerrada por el servidor se
+            # reintenta una única vez con una conexión nueva
+            for retry in (True, False):
+                ( connection, reused ) = await self._acquire()
+                try:
+                    data = await self._send(connection, body)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    await connection.close()
+                    if reused and retry:
+                        continue
+                    raise
+                except BaseException:
+                    await connection.close()
+                    raise
+                else:
+                    await self._release(connection)
+                    break
+
+        # Deserialización de la respuesta
+        ( response, ) = client.loads(data)[0]
+
+        return response
+
+    async def close(
+        self,
+    ) -> None:
+        """
+        ### Cierre de conexiones
+        Este método cierra todas las conexiones disponibles en el pool.
+        """
+
+        while self._idle:
+            await self._idle.pop().close()
+
+    async def _acquire(
+        self,
+    ) -> tuple[_AsyncConnection, bool]:
+
+        # Se reutiliza la conexión más reciente
+        if self._idle:
+            return ( self._idle.pop(), True )
+
+        # Se abre una conexión nueva
+        ( reader, writer ) = await self._wait(
+            asyncio.open_connection(
+                self._host,
+                self._port,
+                ssl= ssl.create_default_context() if self._secure else None,
+            )
+        )
+
+        return ( _AsyncConnection(reader, writer), False )
+
+    async def _release(
+        self,
+        connection: _AsyncConnection,
+    ) -> None:
+
+        # Si el servidor indicó cierre de la conexión, ésta se descarta
+        if connection.reusable:
+            self._idle.append(connection)
+        else:
+            await connection.close()
+
+    async def _send(
+        self,
+        connection: _AsyncConnection,
+        body: bytes,
+    ) -> bytes:
+
+        # Encabezados de la solicitud
+        head = (
+            f'POST {self._path} HTTP/1.1\r\n'
+            f'Host: {self._host_header}\r\n'
+            f'User-Agent: {client.Transport.user_agent}\r\n'
+            'Content-Type: text/xml\r\n'
+            'Accept-Encoding: gzip\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            '\r\n'
+        )
+        # Envío de la solicitud
+        connection.writer.write(head.encode('latin-1') + body)
+        await self._wait(connection.writer.drain())
+
+        # Lectura de la línea de estado
+        status_line = await self._wait(connection.reader.readline())
+        if not status_line:
+            raise ConnectionResetError('El servidor cerró la conexión.')
+        ( version, status, *reason ) = status_line.decode('latin-1').split(' ', 2)
+        status = int(status)
+        reason = reason[0].strip() if reason else ''
+
+        # Lectura de encabezados
+        headers: dict[str, str] = {}
+        while True:
+            line = await self._wait(connection.reader.readline())
+            if line in (b'\r\n', b'\n', b''):
+                break
+            ( key, _, value ) = line.decode('latin-1').partition(':')
+            headers[key.strip().lower()] = value.strip()
+
+        # Se determina si la conexión puede reutilizarse
+        connection_header = headers.get('connection', '').lower()
+        if connection_header == 'close' or (version == 'HTTP/1.0' and connection_header != 'keep-alive'):
+            connection.reusable = False
+
+        # Lectura del cuerpo de la respuesta
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            data = await self._read_chunked(connection.reader)
+        elif 'content-length' in headers:
+            data = await self._wait(connection.reader.readexactly(int(headers['content-length'])))
+        else:
+            data = await self._wait(connection.reader.read())
+            connection.reusable = False
+
+        # Validación del estado de la respuesta
+        if status != 200:
+            raise client.ProtocolError(self._url, status, reason, headers)
+
+        # Decodificación del contenido
+        encoding = headers.get('content-encoding', 'identity').lower()
+        if encoding in ('gzip', 'x-gzip'):
+            data = gzip.decompress(data)
+        elif encoding != 'identity':
+            raise client.ProtocolError(
+                self._url,
+                status,
+                f'Codificación de contenido no soportada: {encoding}',
+                headers,
+            )
+
+        return data
+
+    async def _read_chunked(
+        self,
+        reader: asyncio.StreamReader,
+    ) -> bytes:
+
+        # Lectura de los fragmentos hasta encontrar el fragmento final
+        chunks: list[bytes] = []
+        while True:
+            size_line = await self._wait(reader.readline())
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                # Se descartan los encabezados finales
+                while (await self._wait(reader.readline())) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            chunks.append(await self._wait(reader.readexactly(size)))
+            # Se descarta el salto de línea del fragmento
+            await self._wait(reader.readexactly(2))
+
+        return b''.join(chunks)
+
+    async def _wait(
+        self,
+        awaitable,
+    ):
+
+        # Cada operación de red espera como máximo el tiempo configurado
+        return await asyncio.wait_for(awaitable, self.timeout)
@@ -0,0 +1,138 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+from xmlrpc import client
+
+class _TimeoutMixin():
+
+    # Tiempo máximo de espera de cada operación de red
+    timeout: float | None = None
+
+    def make_connection(
+        self,
+        host,
+    ):
+
+        # Se aplica el tiempo máximo de espera al socket de la conexión
+        connection = super().make_connection(host)
+        connection.timeout = self.timeout
+
+        return connection
+
+class _TimeoutTransport(_TimeoutMixin, client.Transport):
+    pass
+
+class _SafeTimeoutTransport(_TimeoutMixin, client.SafeTransport):
+    pass
+
+def create_proxy(
+    url: str,
+    timeout: float | None,
+) -> client.ServerProxy:
+    """
+    ## Creación de una conexión XML-RPC
+    Esta función crea una instancia `xmlrpc.client.ServerProxy` cuyas
+    operaciones de red (conexión, envío y lectura de la respuesta) esperan
+    como máximo `timeout` segundos antes de lanzar `TimeoutError`. Con
+    `None` se espera indefinidamente.
+    """
+
+    transport = (
+        _SafeTimeoutTransport()
+            if url.startswith('https')
+            else _TimeoutTransport()
+    )
+    transport.timeout = timeout
+
+    return client.ServerProxy(url, transport= transport)
+
+class ProxyPool():
+    """
+    ## Pool de conexiones XML-RPC
+    Esta clase administra un conjunto de instancias `xmlrpc.client.ServerProxy`
+    hacia un mismo endpoint. Cada instancia conserva su propia conexión HTTP(S)
+    persistente, por lo que una vez abierta no se repite el handshake TCP/TLS.
+
+    `ServerProxy` no es seguro para compartirse entre hilos, así que cada hilo
+    toma prestada una instancia exclusiva durante la solicitud:
+    >>> pool = ProxyPool('https://your-database-name.odoo.com/xmlrpc/2/object', 4)
+    >>> with pool.connection() as proxy:
+    >>>     proxy.execute_kw(...)
+
+    Las instancias se crean bajo demanda hasta alcanzar el tamaño máximo del
+    pool. Si todas están en uso, los hilos adicionales esperan a que alguna
+    sea devuelta.
+
+    Con `timeout` cada operación de red espera como máximo los segundos
+    provistos, tras los cuales se lanza `TimeoutError` y la conexión se
+    cierra. Por defecto se espera indefinidamente.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int,
+        timeout: float | None = None,
+    ) -> None:
+
+        # Validación del tamaño del pool
+        if size < 1:
+            raise ValueError('El tamaño del pool de conexiones debe ser de al menos 1.')
+
+        # Se guardan los valores
+        self._url = url
+        self.size = size
+        self.timeout = timeout
+
+        # Instancias disponibles. Se usa LIFO para reutilizar primero las
+        # conexiones más recientes, que son las que tienen menos probabilidad
+        # de haber sido cerradas por el servidor
+        self._idle: queue.LifoQueue[client.ServerProxy] = queue.LifoQueue()
+        # Límite de instancias en uso simultáneo
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def connection(
+        self,
+    ) -> Iterator[client.ServerProxy]:
+        """
+        ### Préstamo de una conexión
+        Este método toma una instancia disponible del pool (o crea una nueva si
+        aún no se alcanza el tamaño máximo) y la devuelve al terminar su uso.
+        """
+
+        # Se espera a que haya un lugar disponible
+        self._slots.acquire()
+
+        try:
+            # Se reutiliza una instancia existente
+            proxy = self._idle.get_nowait()
+        except queue.Empty:
+            # Se crea una nueva instancia
+            proxy = create_proxy(self._url, self.timeout)
+
+        try:
+            yield proxy
+        finally:
+            # Se devuelve la instancia al pool. Si la conexión falló, el
+            # transporte la cierra por su cuenta y la reabre en el siguiente uso
+            self._idle.put(proxy)
+            self._slots.release()
+
+    def close(
+        self,
+    ) -> None:
+        """
+        ### Cierre de conexiones
+        Este método cierra las conexiones de todas las instancias disponibles
+        en el pool.
+        """
+
+        while True:
+            try:
+                proxy = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            # Cierre del transporte de la instancia
+            proxy('close')()
@@ -2,3 +2,4 @@ from typing import TypeVar
 
 _T = TypeVar('_T')
 _O = TypeVar('_O')
+_R = TypeVar('_R')
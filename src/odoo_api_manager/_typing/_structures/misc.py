@@ -1,15 +1,17 @@
 from typing import (
+    TYPE_CHECKING,
     Union,
     Literal,
 )
 from .._base.aliases import RecordID
 from .._base.generics import _T
-from .._base.literals import (
-    ComparisonOperator,
-    MostCommonFields,
-)
+from .._base.literals import ComparisonOperator
+from ..catalogs import MostCommonFields
 from .._interfaces.many2one import Many2One
 
+if TYPE_CHECKING:
+    import numpy as np
+
 ListOrItem = _T | list[_T]
 
 AltDatabaseArg = Union[str, bool]
@@ -39,3 +41,8 @@ RecordData = dict[ModelField, SerializableValue]
 """
 Datos de registro.
 """
+
+ColumnData = dict[ModelField, Union[list, 'np.ndarray']]
+"""
+Datos de registros por columna.
+"""
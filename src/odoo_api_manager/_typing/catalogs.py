@@ -0,0 +1,14 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._base.catalogs import (
+        FieldFields,
+        ModelName,
+        MostCommonFields,
+    )
+else:
+    # Los catálogos de nombres de modelos y campos son `Literal` de cientos de
+    # valores que sólo son útiles para el tipado estático y el autocompletado.
+    # En tiempo de ejecución se sustituyen por `str` para no pagar su costo de
+    # importación.
+    FieldFields = ModelName = MostCommonFields = str
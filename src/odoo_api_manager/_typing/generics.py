@@ -1,4 +1,5 @@
 from ._base.generics import (
     _O,
+    _R,
     _T,
 )
@@ -1,8 +1,12 @@
 from ._base.literals import (
     AccessRights,
     APIMethods,
+    ExportFormat,
+    OutputOptions,
+    PaginationMode,
+)
+from .catalogs import (
     FieldFields,
     ModelName,
     MostCommonFields,
-    OutputOptions,
-)
\ No newline at end of file
+)
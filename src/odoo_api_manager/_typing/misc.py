@@ -1,8 +1,10 @@
 from ._structures.misc import (
+    ColumnData,
     RecordData,
     AltDatabaseArg,
     ListOrItem,
     ModelField,
     NullableMany2One,
     SerializableValue,
+    Triplet,
 )
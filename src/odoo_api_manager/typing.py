@@ -1,7 +1,34 @@
+from typing import TYPE_CHECKING
 from ._typing.criteria_structure import CriteriaStructure
 from ._typing.literals import (
     APIMethods,
     AccessRights,
-    MostCommonFields,
-    ModelName,
+    ExportFormat,
+    PaginationMode,
 )
+from ._cache import CacheInfo
+from ._metadata import FieldCost
+from ._output import (
+    Record,
+    RecordTable,
+)
+from ._resources import (
+    BatchFailure,
+    BulkResult,
+)
+from ._sync import SyncResult
+
+if TYPE_CHECKING:
+    from ._typing._base.catalogs import (
+        MostCommonFields,
+        ModelName,
+    )
+
+def __getattr__(name: str):
+
+    # Los catálogos de nombres se importan hasta que se solicitan
+    if name in ('MostCommonFields', 'ModelName'):
+        from ._typing._base import catalogs
+        return getattr(catalogs, name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
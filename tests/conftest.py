@@ -0,0 +1,29 @@
+import os
+import tempfile
+import pytest
+from stand_in_odoo import (
+    DB,
+    StandInOdoo,
+    TOKEN,
+    USERNAME,
+)
+
+# Servidor compartido por todas las pruebas. Las credenciales se leen del
+# entorno una sola vez, por lo que se configuran antes de cualquier prueba
+_STAND_IN = StandInOdoo()
+os.environ.update({
+    'ODOO_API_USERNAME': USERNAME,
+    'ODOO_API_TOKEN': TOKEN,
+    'ODOO_API_URL': _STAND_IN.url,
+    'ODOO_API_DB': DB,
+    'XDG_CACHE_HOME': tempfile.mkdtemp(),
+})
+
+@pytest.fixture
+def odoo_server() -> StandInOdoo:
+
+    _STAND_IN.reset()
+
+    yield _STAND_IN
+
+    _STAND_IN.reset()
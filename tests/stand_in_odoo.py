@@ -0,0 +1,377 @@
+"""
+Servidor XML-RPC local que imita el API de Odoo para las pruebas. Atiende
+los endpoints `common` y `object` sobre HTTP/1.1 con conexiones persistentes
+y permite simular respuestas por fragmentos, contenido comprimido, demoras y
+cierres de conexión del servidor.
+"""
+import gzip
+import threading
+import time
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from xmlrpc import client
+
+USERNAME = 'admin'
+TOKEN = 'secret'
+DB = 'odoo'
+UID = 2
+
+class StandInOdoo():
+
+    def __init__(
+        self,
+    ) -> None:
+
+        self._lock = threading.Lock()
+        self.reset()
+
+        # Servidor HTTP en un puerto libre
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.stand_in = self
+        threading.Thread(target= self._server.serve_forever, daemon= True).start()
+
+    @property
+    def url(
+        self,
+    ) -> str:
+
+        ( host, port ) = self._server.server_address
+
+        return f'http://{host}:{port}'
+
+    def reset(
+        self,
+    ) -> None:
+        """
+        ### Reinicio del estado
+        """
+
+        # Registros por modelo y por ID
+        self.records: dict[str, dict[int, dict]] = {}
+        # Llamadas recibidas en `execute_kw` como `( modelo, método, args, kwargs )`
+        self.calls: list[tuple] = []
+        # Autenticaciones recibidas en el endpoint `common`
+        self.authentications = 0
+        # Conexiones abiertas por los clientes
+        self.connections = 0
+        # Solicitudes en curso y máximo de solicitudes simultáneas
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        # Versión reportada por el servidor
+        self.server_version = '17.0'
+
+        # Comportamiento de las respuestas
+        self.chunked = False
+        self.content_encoding: str | None = None
+        self.delay = 0.0
+        self.drop_connections = False
+        # Funciones ejecutadas antes y después de calcular cada respuesta de
+        # `execute_kw`. La primera puede lanzar un `Fault` para simular un
+        # error del servidor
+        self.before_call = None
+        self.after_call = None
+
+    def add(
+        self,
+        model: str,
+        *records: dict,
+    ) -> None:
+        """
+        ### Registro de datos de un modelo
+        """
+
+        table = self.records.setdefault(model, {})
+        for record in records:
+            table[record['id']] = dict(record)
+
+    def add_fields(
+        self,
+        model: str,
+        *definitions: tuple,
+    ) -> None:
+        """
+        ### Registro de campos de un modelo en `ir.model.fields`
+        Cada definición es una tupla `( nombre, tipo, relación )`, con un
+        cuarto elemento opcional que indica si el campo se almacena.
+        """
+
+        start = len(self.records.get('ir.model.fields', {})) + 1
+        self.add('ir.model.fields', *[
+            {
+                'id': start + position, 'name': name, 'field_description': name, 'model_id': model,
+                'ttype': ttype, 'state': 'base', 'relation': relation, 'store': store[0] if store else True,
+                'required': False, 'readonly': False,
+            }
+            for ( position, ( name, ttype, relation, *store ) ) in enumerate(definitions)
+        ])
+
+    def methods(
+        self,
+        model: str | None = None,
+    ) -> list[str]:
+        """
+        ### Métodos llamados, opcionalmente de un modelo
+        """
+
+        return [method for ( name, method, *_ ) in self.calls if model in ( None, name )]
+
+    def close(
+        self,
+    ) -> None:
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _dispatch(
+        self,
+        path: str,
+        method: str,
+        params: tuple,
+    ):
+
+        if path.endswith('/common'):
+            if method == 'version':
+                return {'server_version': self.server_version}
+            if method == 'authenticate':
+                ( db, username, token, _ ) = params
+                with self._lock:
+                    self.authentications += 1
+                return UID if ( db, username, token ) == ( DB, USERNAME, TOKEN ) else False
+            raise client.Fault(1, f'Método desconocido: {method}')
+
+        ( db, uid, token, model, method, args, *rest ) = params
+        kwargs = rest[0] if rest else {}
+        if ( db, uid, token ) != ( DB, UID, TOKEN ):
+            raise client.Fault(3, 'Access Denied')
+
+        with self._lock:
+            self.calls.append(( model, method, args, kwargs ))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if self.before_call is not None:
+                self.before_call(model, method, args)
+            result = self._execute(model, method, args, kwargs)
+            if self.after_call is not None:
+                self.after_call(model, method)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        return result
+
+    def _execute(
+        self,
+        model: str,
+        method: str,
+        args: list,
+        kwargs: dict,
+    ):
+
+        table = self.records.setdefault(model, {})
+
+        if method in ( 'search', 'search_read', 'search_count' ):
+            found = _search(table, args[0], kwargs)
+            if method == 'search':
+                return [record['id'] for record in found]
+            if method == 'search_count':
+                return len(found)
+            return [_project(record, kwargs.get('fields')) for record in found]
+
+        if method == 'read':
+            return [_project(table[record_id], kwargs.get('fields')) for record_id in args[0] if record_id in table]
+
+        if method == 'create':
+            created = []
+            for values in args[0]:
+                record_id = max(table, default= 0) + 1
+                table[record_id] = {'id': record_id, **values}
+                created.append(record_id)
+            return created
+
+        if method == 'write':
+            for record_id in args[0]:
+                table[record_id].update(args[1])
+            return True
+
+        if method == 'unlink':
+            for record_id in args[0]:
+                table.pop(record_id, None)
+            return True
+
+        raise client.Fault(2, f'Método desconocido: {method}')
+
+class _Server(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def handle_error(
+        self,
+        request,
+        client_address,
+    ) -> None:
+
+        # Los clientes que abandonan la conexión por tiempo de espera no son
+        # un error del servidor
+        pass
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(
+        self,
+    ) -> None:
+
+        super().setup()
+        stand_in = self.server.stand_in
+        with stand_in._lock:
+            stand_in.connections += 1
+
+    def log_message(
+        self,
+        *args,
+    ) -> None:
+
+        pass
+
+    def do_POST(
+        self,
+    ) -> None:
+
+        stand_in: StandInOdoo = self.server.stand_in
+
+        # Lectura y despacho de la llamada
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        ( params, method ) = client.loads(body)
+        try:
+            payload = client.dumps(( stand_in._dispatch(self.path, method, params), ), methodresponse= True, allow_none= True)
+        except client.Fault as fault:
+            payload = client.dumps(fault, allow_none= True)
+        data = payload.encode('utf-8')
+
+        # Codificación del contenido
+        if stand_in.content_encoding == 'gzip':
+            data = gzip.compress(data)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        if stand_in.content_encoding is not None:
+            self.send_header('Content-Encoding', stand_in.content_encoding)
+
+        if stand_in.chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for start in range(0, len(data), 64):
+                chunk = data[start:start + 64]
+                self.wfile.write(f'{len(chunk):x}\r\n'.encode('latin-1') + chunk + b'\r\n')
+            self.wfile.write(b'0\r\n\r\n')
+        else:
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        # El servidor cierra la conexión sin avisarlo al cliente, como al
+        # vencer el tiempo de inactividad de una conexión persistente
+        if stand_in.drop_connections:
+            self.close_connection = True
+
+def _search(
+    table: dict[int, dict],
+    domain: list,
+    kwargs: dict,
+) -> list[dict]:
+
+    context = kwargs.get('context') or {}
+    found = [
+        record
+        for record in table.values()
+        if evaluate(record, domain)
+            and ( not context.get('active_test', True) or record.get('active', True) )
+    ]
+
+    # Orden de los registros
+    found.sort(key= lambda record: record['id'])
+    for part in reversed((kwargs.get('order') or '').split(',')):
+        if part.strip():
+            ( name, *direction ) = part.split()
+            found.sort(key= lambda record: record[name], reverse= direction[:1] == ['desc'])
+
+    offset = kwargs.get('offset') or 0
+    limit = kwargs.get('limit')
+
+    return found[offset:offset + limit if limit else None]
+
+def evaluate(
+    record: dict,
+    domain: list,
+) -> bool:
+
+    def parse(position: int) -> tuple[bool, int]:
+        token = domain[position]
+        if token == '!':
+            ( value, position ) = parse(position + 1)
+            return ( not value, position )
+        if token in ( '&', '|' ):
+            ( left, position ) = parse(position + 1)
+            ( right, position ) = parse(position)
+            return ( left and right if token == '&' else left or right, position )
+        return ( _leaf(record, token), position + 1 )
+
+    ( result, position ) = ( True, 0 )
+    while position < len(domain):
+        ( value, position ) = parse(position)
+        result = result and value
+
+    return result
+
+def _leaf(
+    record: dict,
+    term: list,
+) -> bool:
+
+    ( field, operator, value ) = term
+    if field in ( 0, 1 ):
+        return field == value
+
+    current = record.get(field, False)
+    # Los valores Many2One se comparan por ID
+    if isinstance(current, list) and len(current) == 2 and isinstance(current[0], int):
+        current = current[0]
+
+    if operator == '=':
+        return current == value
+    if operator == '!=':
+        return current != value
+    if operator == 'in':
+        return current in value
+    if operator == 'not in':
+        return current not in value
+    if current is False:
+        return False
+    if operator == '>':
+        return current > value
+    if operator == '>=':
+        return current >= value
+    if operator == '<':
+        return current < value
+    if operator == '<=':
+        return current <= value
+
+    raise client.Fault(2, f'Operador desconocido: {operator}')
+
+def _project(
+    record: dict,
+    fields: list[str] | None,
+) -> dict:
+
+    if not fields:
+        return dict(record)
+
+    return {'id': record['id'], **{field: record.get(field, False) for field in fields}}
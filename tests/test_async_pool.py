@@ -0,0 +1,145 @@
+import asyncio
+from xmlrpc import client
+import pytest
+from odoo_api_manager import AsyncOdooAPIManager
+from odoo_api_manager._transport import AsyncProxyPool
+from stand_in_odoo import (
+    DB,
+    TOKEN,
+    UID,
+)
+
+PARTNERS = [{'id': i, 'name': f'Contacto {i}'} for i in range(1, 6)]
+
+def _pool(odoo_server, size= 4, timeout= 5.0) -> AsyncProxyPool:
+
+    return AsyncProxyPool(f'{odoo_server.url}/xmlrpc/2/object', size, timeout)
+
+async def _read(pool: AsyncProxyPool, record_ids: list[int]) -> list[dict]:
+
+    return await pool.call('execute_kw', DB, UID, TOKEN, 'res.partner', 'read', [record_ids], {'fields': ['name']})
+
+def test_keep_alive_reuses_connection(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+
+    async def main():
+        pool = _pool(odoo_server)
+        try:
+            return [await _read(pool, [i]) for i in range(1, 6)]
+        finally:
+            await pool.close()
+
+    responses = asyncio.run(main())
+
+    assert [response[0]['name'] for response in responses] == [f'Contacto {i}' for i in range(1, 6)]
+    assert odoo_server.connections == 1
+
+def test_chunked_body(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo_server.chunked = True
+
+    async def main():
+        pool = _pool(odoo_server)
+        try:
+            return ( await _read(pool, [1, 2, 3, 4, 5]), await _read(pool, [1]) )
+        finally:
+            await pool.close()
+
+    ( first, second ) = asyncio.run(main())
+
+    assert first == [{'id': i, 'name': f'Contacto {i}'} for i in range(1, 6)]
+    assert second == [{'id': 1, 'name': 'Contacto 1'}]
+    # La conexión se reutiliza después de una respuesta por fragmentos
+    assert odoo_server.connections == 1
+
+def test_gzip_body(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo_server.content_encoding = 'gzip'
+
+    async def main():
+        pool = _pool(odoo_server)
+        try:
+            return await _read(pool, [1, 2])
+        finally:
+            await pool.close()
+
+    assert asyncio.run(main()) == [{'id': 1, 'name': 'Contacto 1'}, {'id': 2, 'name': 'Contacto 2'}]
+
+def test_unsupported_encoding_is_rejected(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo_server.content_encoding = 'br'
+
+    async def main():
+        pool = _pool(odoo_server)
+        try:
+            await _read(pool, [1])
+        finally:
+            await pool.close()
+
+    with pytest.raises(client.ProtocolError):
+        asyncio.run(main())
+
+def test_retry_on_stale_pooled_connection(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    # El servidor cierra cada conexión después de responder sin avisarlo
+    odoo_server.drop_connections = True
+
+    async def main():
+        pool = _pool(odoo_server)
+        try:
+            first = await _read(pool, [1])
+            # Se espera a que el cierre del servidor llegue al cliente
+            await asyncio.sleep(0.05)
+            second = await _read(pool, [2])
+            return ( first, second )
+        finally:
+            await pool.close()
+
+    ( first, second ) = asyncio.run(main())
+
+    assert first[0]['name'] == 'Contacto 1'
+    assert second[0]['name'] == 'Contacto 2'
+    # La conexión reutilizada falló y se reintentó con una nueva
+    assert odoo_server.connections == 2
+    assert odoo_server.methods('res.partner') == ['read', 'read']
+
+def test_timeout_frees_the_slot(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo_server.delay = 1.0
+
+    async def main():
+        pool = _pool(odoo_server, size= 1, timeout= 0.2)
+        try:
+            with pytest.raises(TimeoutError):
+                await _read(pool, [1])
+            # El único lugar del pool quedó libre para la siguiente llamada
+            odoo_server.delay = 0.0
+            return await asyncio.wait_for(_read(pool, [2]), 2.0)
+        finally:
+            await pool.close()
+
+    assert asyncio.run(main())[0]['name'] == 'Contacto 2'
+
+def test_max_concurrency_limits_simultaneous_calls(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo_server.delay = 0.05
+
+    async def main():
+        async with AsyncOdooAPIManager(default_output= 'dict', max_concurrency= 3) as odoo:
+            return await asyncio.gather(*[
+                odoo.read('res.partner', [i % 5 + 1], ['name']) for i in range(20)
+            ])
+
+    responses = asyncio.run(main())
+
+    assert len(responses) == 20
+    assert odoo_server.max_in_flight == 3
+    # Una conexión de autenticación y como máximo una por lugar del pool
+    assert odoo_server.connections <= 4
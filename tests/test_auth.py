@@ -0,0 +1,91 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from xmlrpc import client
+import pytest
+from odoo_api_manager import OdooAPIManager
+from odoo_api_manager._cache import UIDCache
+from stand_in_odoo import (
+    DB,
+    TOKEN,
+    UID,
+    USERNAME,
+)
+
+def test_authentication_on_init(odoo_server):
+
+    OdooAPIManager()
+
+    assert odoo_server.authentications == 1
+
+def test_lazy_authentication_waits_for_first_request(odoo_server):
+
+    odoo_server.add('res.partner', {'id': 1, 'name': 'Contacto 1'})
+    odoo = OdooAPIManager(lazy= True)
+
+    # No se realiza ninguna solicitud al crear la instancia
+    assert odoo_server.authentications == 0
+    assert odoo_server.connections == 0
+
+    assert odoo.search('res.partner') == [1]
+    assert odoo.search('res.partner') == [1]
+    assert odoo_server.authentications == 1
+
+def test_lazy_authentication_is_shared_between_threads(odoo_server):
+
+    odoo_server.add('res.partner', {'id': 1, 'name': 'Contacto 1'})
+    odoo_server.delay = 0.05
+    odoo = OdooAPIManager(lazy= True, pool_size= 4)
+
+    with ThreadPoolExecutor(4) as executor:
+        responses = list(executor.map(lambda _: odoo.search('res.partner'), range(4)))
+
+    assert responses == [[1]] * 4
+    assert odoo_server.authentications == 1
+
+def _cache_uid(path, uid: int) -> None:
+
+    UIDCache(path).set(os.environ['ODOO_API_URL'], DB, USERNAME, TOKEN, uid)
+
+def test_cached_uid_skips_authentication(odoo_server, tmp_path):
+
+    path = str(tmp_path / 'uids.json')
+    OdooAPIManager(uid_cache= path)
+    assert odoo_server.authentications == 1
+
+    odoo_server.add('res.partner', {'id': 1, 'name': 'Contacto 1'})
+    odoo = OdooAPIManager(uid_cache= path)
+
+    assert odoo.search('res.partner') == [1]
+    assert odoo_server.authentications == 1
+
+def test_stale_cached_uid_is_refreshed(odoo_server, tmp_path):
+
+    path = str(tmp_path / 'uids.json')
+    _cache_uid(path, UID + 1)
+    odoo_server.add('res.partner', {'id': 1, 'name': 'Contacto 1'})
+    odoo = OdooAPIManager(uid_cache= path)
+    assert odoo_server.authentications == 0
+
+    # La solicitud falla por acceso denegado, se autentica y se reintenta
+    assert odoo.search('res.partner') == [1]
+    assert odoo_server.authentications == 1
+    assert UIDCache(path).get(os.environ['ODOO_API_URL'], DB, USERNAME, TOKEN) == UID
+
+def test_access_error_does_not_authenticate(odoo_server, tmp_path):
+
+    path = str(tmp_path / 'uids.json')
+    _cache_uid(path, UID)
+
+    def before_call(model, method, args):
+        raise client.Fault(4, 'AccessError')
+
+    odoo_server.before_call = before_call
+    odoo = OdooAPIManager(uid_cache= path)
+
+    with pytest.raises(client.Fault) as error:
+        odoo.search('res.partner')
+
+    assert error.value.faultCode == 4
+    assert odoo_server.authentications == 0
+    assert odoo_server.methods('res.partner') == ['search']
+    assert UIDCache(path).get(os.environ['ODOO_API_URL'], DB, USERNAME, TOKEN) == UID
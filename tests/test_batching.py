@@ -0,0 +1,121 @@
+import asyncio
+import pytest
+from odoo_api_manager import (
+    AsyncOdooAPIManager,
+    OdooAPIManager,
+)
+
+PARTNERS = [{'id': i, 'name': f'Contacto {i}', 'vat': f'VAT{i}'} for i in range(1, 11)]
+
+def test_unmodified_loop_makes_one_read_per_field_set(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo = OdooAPIManager(default_output= 'dict')
+    ids = [partner['id'] for partner in PARTNERS]
+
+    names = []
+    pairs = []
+    with odoo.batching(prefetch={'res.partner': ids}):
+        # Mismo ciclo que fuera del bloque
+        for id in ids:
+            name = odoo.get_value('res.partner', id, 'name')
+            names.append(name.upper())
+            ( name, vat ) = odoo.get_values('res.partner', id, ['name', 'vat'])
+            pairs.append(( name, vat ))
+
+    assert names == [f'CONTACTO {i}' for i in ids]
+    assert pairs == [( f'Contacto {i}', f'VAT{i}' ) for i in ids]
+    # Una lectura por conjunto de campos: `['name']` y `['name', 'vat']`
+    assert odoo_server.methods('res.partner') == ['read', 'read']
+
+def test_values_match_the_unbatched_calls(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    expected = [
+        odoo.get_value('res.partner', 3, 'name'),
+        odoo.get_values('res.partner', 4, ['vat', 'name']),
+        odoo.get_value('res.partner', 999, 'name'),
+        odoo.get_values('res.partner', 999, ['name']),
+    ]
+    with odoo.batching(prefetch={'res.partner': [3, 4, 999]}):
+        values = [
+            odoo.get_value('res.partner', 3, 'name'),
+            odoo.get_values('res.partner', 4, ['vat', 'name']),
+            odoo.get_value('res.partner', 999, 'name'),
+            odoo.get_values('res.partner', 999, ['name']),
+        ]
+
+    assert values == expected == ['Contacto 3', ( 'VAT4', 'Contacto 4' ), None, None]
+
+def test_writes_inside_the_block_are_read_again(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    with odoo.batching() as batch:
+        batch.prefetch('res.partner', [1, 2])
+        assert odoo.get_value('res.partner', 1, 'name') == 'Contacto 1'
+        odoo.write('res.partner', [1], {'name': 'Modificado'})
+        assert odoo.get_value('res.partner', 1, 'name') == 'Modificado'
+        assert odoo.get_value('res.partner', 2, 'name') == 'Contacto 2'
+
+    assert odoo_server.methods('res.partner') == ['read', 'write', 'read']
+
+def test_loop_without_prefetch_reads_each_record_once(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo = OdooAPIManager(default_output= 'dict')
+    ids = [partner['id'] for partner in PARTNERS]
+
+    with odoo.batching():
+        names = [odoo.get_value('res.partner', id, 'name') for id in ids]
+        # Las IDs ya leídas se sirven desde el lote
+        again = [odoo.get_value('res.partner', id, 'name') for id in ids]
+
+    assert names == again == [f'Contacto {i}' for i in ids]
+    # Sin precarga cada ID se lee al solicitarse
+    assert odoo_server.methods('res.partner') == ['read'] * len(ids)
+
+def test_prefetch_inside_the_block_reads_pending_ids_together(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    with odoo.batching() as batch:
+        assert odoo.get_value('res.partner', 1, 'name') == 'Contacto 1'
+        batch.prefetch('res.partner', [2, 3, 4])
+        assert [odoo.get_value('res.partner', id, 'name') for id in ( 4, 3, 2, 1 )] == [f'Contacto {i}' for i in ( 4, 3, 2, 1 )]
+
+    assert [args[0] for ( model, method, args, kwargs ) in odoo_server.calls] == [[1], [2, 3, 4]]
+
+def test_get_values_accepts_a_single_id_list(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    with odoo.batching(prefetch={'res.partner': [1, 2]}):
+        assert odoo.get_values('res.partner', [2], ['name', 'vat']) == odoo.get_values('res.partner', 2, ['name', 'vat'])
+        assert odoo.get_values('res.partner', [], ['name']) is None
+        with pytest.raises(ValueError):
+            odoo.get_values('res.partner', [1, 2], ['name'])
+
+    assert odoo_server.methods('res.partner') == ['read']
+
+def test_async_get_values_accepts_a_single_id_list(odoo_server):
+
+    odoo_server.add('res.partner', *PARTNERS)
+
+    async def main():
+        async with AsyncOdooAPIManager(default_output= 'dict') as odoo:
+            values = await asyncio.gather(
+                odoo.get_values('res.partner', [2], ['name']),
+                odoo.get_values('res.partner', 3, ['name']),
+            )
+            with pytest.raises(ValueError):
+                await odoo.get_values('res.partner', [1, 2], ['name'])
+            return values
+
+    assert asyncio.run(main()) == [( 'Contacto 2', ), ( 'Contacto 3', )]
+    assert odoo_server.methods('res.partner') == ['read']
@@ -0,0 +1,106 @@
+from xmlrpc import client
+import pandas as pd
+from odoo_api_manager import OdooAPIManager
+
+def _fail_on(name: str):
+
+    # Se rechaza la creación de cualquier lote que contenga el nombre
+    def before_call(model, method, args):
+        if method == 'create' and any(values.get('name') == name for values in args[0]):
+            raise client.Fault(2, f'Nombre inválido: {name}')
+
+    return before_call
+
+def test_bulk_create_preserves_input_order(odoo_server):
+
+    odoo = OdooAPIManager(pool_size= 4)
+    records_data = [{'name': f'Contacto {i}'} for i in range(10)]
+
+    result = odoo.bulk_create('res.partner', records_data, batch_size= 3)
+
+    assert result.ok
+    assert len(odoo_server.methods('res.partner')) == 4
+    created = odoo_server.records['res.partner']
+    assert [created[record_id]['name'] for record_id in result.ids] == [values['name'] for values in records_data]
+
+def test_bulk_create_isolates_failing_batch(odoo_server):
+
+    odoo_server.before_call = _fail_on('FAIL')
+    odoo = OdooAPIManager(pool_size= 4)
+    records_data = [{'name': f'Contacto {i}'} for i in range(10)]
+    records_data[4] = {'name': 'FAIL'}
+
+    result = odoo.bulk_create('res.partner', records_data, batch_size= 3)
+
+    assert not result.ok
+    # El segundo lote (posiciones 3 a 5) falló y los demás se completaron
+    assert [record_id is None for record_id in result.ids] == [False] * 3 + [True] * 3 + [False] * 4
+    assert len(odoo_server.records['res.partner']) == 7
+    ( failure, ) = result.failures
+    assert failure.batch == 1
+    assert failure.positions == [3, 4, 5]
+    assert failure.record_ids is None
+    assert isinstance(failure.error, client.Fault)
+    assert 'positions=3' in repr(failure)
+
+def test_bulk_write_groups_identical_values(odoo_server):
+
+    odoo_server.add('product.template', *[{'id': i, 'list_price': 1.0, 'active': True} for i in range(1, 8)])
+    odoo = OdooAPIManager(pool_size= 4)
+
+    result = odoo.bulk_write('product.template', {
+        1: {'list_price': 7.4},
+        2: {'list_price': 7.4},
+        3: {'list_price': 7.4},
+        4: {'list_price': 9.9, 'active': False},
+        5: {'active': False, 'list_price': 9.9},
+        6: {'list_price': 3.0},
+    }, batch_size= 2)
+
+    assert result.ok
+    assert sorted(result.ids) == [1, 2, 3, 4, 5, 6]
+    # Un grupo de tres registros en dos lotes y dos grupos de un lote
+    writes = sorted(( sorted(args[0]), args[1] ) for ( model, method, args, kwargs ) in odoo_server.calls if method == 'write')
+    assert writes == [
+        ( [1, 2], {'list_price': 7.4} ),
+        ( [3], {'list_price': 7.4} ),
+        ( [4, 5], {'list_price': 9.9, 'active': False} ),
+        ( [6], {'list_price': 3.0} ),
+    ]
+    table = odoo_server.records['product.template']
+    assert [table[i]['list_price'] for i in range(1, 8)] == [7.4, 7.4, 7.4, 9.9, 9.9, 3.0, 1.0]
+
+def test_bulk_write_reports_failing_record_ids(odoo_server):
+
+    odoo_server.add('product.template', *[{'id': i, 'list_price': 1.0} for i in range(1, 4)])
+
+    def before_call(model, method, args):
+        if method == 'write' and args[1]['list_price'] < 0:
+            raise client.Fault(2, 'Precio inválido')
+
+    odoo_server.before_call = before_call
+    odoo = OdooAPIManager(pool_size= 4)
+
+    result = odoo.bulk_write('product.template', {1: {'list_price': 5.0}, 2: {'list_price': -1.0}, 3: {'list_price': -1.0}})
+
+    assert not result.ok
+    assert result.ids == [1]
+    ( failure, ) = result.failures
+    assert failure.record_ids == [2, 3]
+    assert failure.positions is None
+    assert 'record_ids=2' in repr(failure)
+    assert odoo_server.records['product.template'][2]['list_price'] == 1.0
+
+def test_bulk_write_from_dataframe(odoo_server):
+
+    odoo_server.add('product.template', *[{'id': i, 'list_price': 1.0, 'default_code': 'X'} for i in range(1, 4)])
+    odoo = OdooAPIManager(pool_size= 4)
+    data = pd.DataFrame({'id': [1, 2, 3], 'list_price': [2.5, 2.5, 4.0], 'default_code': ['A', 'A', None]})
+
+    result = odoo.bulk_write('product.template', data)
+
+    assert sorted(result.ids) == [1, 2, 3]
+    assert len(odoo_server.methods('product.template')) == 2
+    # Los valores nulos se envían como `False`
+    assert odoo_server.records['product.template'][3] == {'id': 3, 'list_price': 4.0, 'default_code': False}
+    assert odoo_server.records['product.template'][1] == {'id': 1, 'list_price': 2.5, 'default_code': 'A'}
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+from odoo_api_manager import OdooAPIManager
+
+ORDERS = [
+    {'id': 52, 'name': 'S00052', 'amount_total': 1250, 'discount': 0.5, 'locked': True, 'note': False},
+    {'id': 87, 'name': 'S00087', 'amount_total': 830.5, 'discount': False, 'locked': False, 'note': 'Urgente'},
+]
+
+def test_columns_output(odoo_server):
+
+    odoo_server.add('sale.order', *ORDERS)
+    odoo = OdooAPIManager(default_output= 'columns')
+
+    columns = odoo.read('sale.order', [52, 87], ['name', 'amount_total', 'discount', 'locked', 'note'])
+
+    assert list(columns) == ['id', 'name', 'amount_total', 'discount', 'locked', 'note']
+    # Columnas numéricas y booleanas sin valores vacíos como arreglos de NumPy
+    assert columns['id'].dtype == np.int64
+    assert columns['id'].tolist() == [52, 87]
+    assert columns['amount_total'].dtype == np.float64
+    assert columns['amount_total'].tolist() == [1250.0, 830.5]
+    assert columns['locked'].dtype == bool
+    # Las demás columnas se retornan como listas
+    assert columns['name'] == ['S00052', 'S00087']
+    assert columns['discount'] == [0.5, False]
+    assert columns['note'] == [False, 'Urgente']
+
+def test_columns_output_without_records(odoo_server):
+
+    odoo = OdooAPIManager()
+
+    assert odoo.search_read('sale.order', fields= ['name'], output= 'columns') == {}
+
+def test_dataframe_is_built_from_columns(odoo_server):
+
+    odoo_server.add('sale.order', *ORDERS)
+    odoo = OdooAPIManager()
+
+    data = odoo.read('sale.order', [52, 87], ['name', 'amount_total', 'discount', 'locked', 'note'])
+
+    pd.testing.assert_frame_equal(data, pd.DataFrame(ORDERS))
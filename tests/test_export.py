@@ -0,0 +1,58 @@
+import csv
+import pytest
+from odoo_api_manager import OdooAPIManager
+from odoo_api_manager._output._export import (
+    CSVWriter,
+    RecordWriter,
+)
+
+def test_incomplete_writer_fails_on_instantiation(tmp_path):
+
+    class IncompleteWriter(RecordWriter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteWriter(tmp_path / 'records.txt')
+
+def test_csv_header_uses_the_requested_fields(tmp_path):
+
+    path = tmp_path / 'records.csv'
+    with CSVWriter(path, ['name', 'tag_ids']) as writer:
+        writer.write([{'id': 1, 'name': 'Uno'}])
+        writer.write([{'id': 2, 'name': 'Dos', 'tag_ids': [3, 4], 'extra': True}])
+
+    with open(path, encoding= 'utf-8', newline= '') as file:
+        rows = list(csv.reader(file))
+
+    assert rows == [
+        ['id', 'name', 'tag_ids'],
+        ['1', 'Uno', ''],
+        ['2', 'Dos', '[3, 4]'],
+    ]
+
+def test_export_csv(odoo_server, tmp_path):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}', 'vat': False} for i in range(1, 6)])
+    odoo = OdooAPIManager()
+
+    assert odoo.export('res.partner', tmp_path / 'partners.csv', fields= ['name'], page_size= 2) == 5
+
+    with open(tmp_path / 'partners.csv', encoding= 'utf-8', newline= '') as file:
+        rows = list(csv.reader(file))
+
+    assert rows[0] == ['id', 'name']
+    assert rows[1:] == [[str(i), f'Contacto {i}'] for i in range(1, 6)]
+
+@pytest.mark.parametrize('fields', [['name', 'country_id'], None])
+def test_empty_parquet_keeps_the_schema(tmp_path, fields):
+
+    pq = pytest.importorskip('pyarrow.parquet')
+    from odoo_api_manager._output._export import ParquetWriter
+
+    path = tmp_path / 'records.parquet'
+    with ParquetWriter(path, {'id': 'integer', 'name': 'char', 'country_id': 'many2one'}, fields) as writer:
+        writer.write([])
+
+    table = pq.read_table(path)
+    assert table.num_rows == 0
+    assert table.schema.names == ['id', 'name', 'country_id_id', 'country_id_name']
@@ -0,0 +1,57 @@
+from odoo_api_manager import OdooAPIManager
+
+def _partners(odoo_server) -> None:
+
+    odoo_server.add_fields(
+        'res.partner',
+        ('id', 'integer', False),
+        ('name', 'char', False),
+        ('image_1920', 'binary', False),
+        ('comment', 'html', False),
+        ('display_name', 'char', False, False),
+        ('country_id', 'many2one', 'res.country'),
+    )
+    odoo_server.add('res.partner', *[
+        {
+            'id': i, 'name': f'Contacto {i}', 'image_1920': 'A' * 5000, 'comment': '<p>Nota</p>',
+            'display_name': f'Contacto {i}', 'country_id': [156, 'México'],
+        }
+        for i in range(1, 6)
+    ])
+
+def test_field_costs(odoo_server):
+
+    _partners(odoo_server)
+    odoo = OdooAPIManager()
+
+    costs = odoo.field_costs('res.partner', sample_size= 3)
+
+    # Se lee una muestra con todos los campos
+    ( ( _, _, _, kwargs ), ) = [call for call in odoo_server.calls if call[0] == 'res.partner']
+    assert kwargs.get('limit') == 3 and not kwargs.get('fields')
+    # Campos ordenados del más costoso al menos costoso
+    assert costs[0].field == 'image_1920'
+    assert costs[0].ttype == 'binary'
+    assert costs[0].store is True
+    assert [cost.total_bytes for cost in costs] == sorted((cost.total_bytes for cost in costs), reverse= True)
+    assert sorted(cost.field for cost in costs) == ['comment', 'country_id', 'display_name', 'id', 'image_1920', 'name']
+    assert abs(sum(cost.share for cost in costs) - 1) < 1e-9
+    assert costs[0].bytes_per_record == costs[0].total_bytes / 3
+    assert costs[0].share > 0.9
+    assert [cost.store for cost in costs if cost.field == 'display_name'] == [False]
+
+def test_field_costs_without_records(odoo_server):
+
+    assert OdooAPIManager().field_costs('res.partner') == []
+
+def test_lean_projection(odoo_server):
+
+    _partners(odoo_server)
+    odoo = OdooAPIManager(default_output= 'dict', lean= True)
+
+    records = odoo.search_read('res.partner', [('id', '=', 1)])
+
+    assert records == [{'id': 1, 'name': 'Contacto 1', 'country_id': [156, 'México']}]
+    assert odoo.metadata.lean_fields('res.partner') == ['id', 'name', 'country_id']
+    # Los campos provistos explícitamente no se alteran
+    assert odoo.read('res.partner', 1, ['comment']) == [{'id': 1, 'comment': '<p>Nota</p>'}]
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+from odoo_api_manager import OdooAPIManager
+
+SERIES = [
+    [[1, 'Un vendedor'], [2, 'Vendedor estrella'], False],
+    [False, False],
+    [[1, 'Un vendedor'], [2, 'Vendedor estrella']],
+    [],
+]
+
+@pytest.mark.parametrize('values', SERIES)
+@pytest.mark.parametrize('null_value', [False, None, -1])
+def test_extraction_matches_series_apply(values, null_value):
+
+    s = pd.Series(values, dtype= object, name= 'user_id')
+
+    for ( position, method ) in enumerate(( OdooAPIManager.extract_m2o_id, OdooAPIManager.extract_m2o_name )):
+        expected = s.apply(lambda m2o: m2o[position] if m2o else null_value)
+        pd.testing.assert_series_equal(method(s, null_value), expected)
+
+def test_empty_values_keep_bool_dtype():
+
+    s = pd.Series([False, False, False], dtype= object)
+
+    assert OdooAPIManager.extract_m2o_id(s).dtype == bool
+    assert OdooAPIManager.extract_m2o_name(s).dtype == bool
+    # Los valores mezclados con `False` se mantienen como `object`
+    assert OdooAPIManager.extract_m2o_id(pd.Series([[1, 'A'], False])).dtype == object
+
+def test_split_m2o_columns(odoo_server):
+
+    odoo_server.add_fields('res.partner', ('id', 'integer', False), ('name', 'char', False), ('country_id', 'many2one', 'res.country'))
+    odoo_server.add(
+        'res.partner',
+        {'id': 1, 'name': 'Un cliente', 'country_id': [156, 'México']},
+        {'id': 2, 'name': 'Mostrador', 'country_id': False},
+    )
+    odoo = OdooAPIManager(split_m2o= True)
+
+    data = odoo.search_read('res.partner', fields= ['name', 'country_id'])
+
+    assert list(data.columns) == ['id', 'name', 'country_id_id', 'country_id_name']
+    assert str(data['country_id_id'].dtype) == 'Int64'
+    assert isinstance(data['country_id_name'].dtype, pd.CategoricalDtype)
+    assert data['country_id_id'].tolist()[0] == 156
+    assert data['country_id_id'].isna().tolist() == [False, True]
+    assert data['country_id_name'].tolist()[0] == 'México'
@@ -0,0 +1,70 @@
+from odoo_api_manager import OdooAPIManager
+
+def _partner_fields(odoo_server) -> None:
+
+    odoo_server.add_fields(
+        'res.partner',
+        ('id', 'integer', False),
+        ('name', 'char', False),
+        ('country_id', 'many2one', 'res.country'),
+    )
+    odoo_server.add_fields('res.country', ('id', 'integer', False), ('code', 'char', False))
+
+def _loads(odoo_server) -> list:
+
+    return [args[0] for ( model, method, args, kwargs ) in odoo_server.calls if model == 'ir.model.fields']
+
+def test_definitions_are_loaded_once(odoo_server):
+
+    _partner_fields(odoo_server)
+    odoo = OdooAPIManager()
+
+    definitions = odoo.metadata.fields('res.partner')
+    odoo.metadata.fields('res.partner')
+
+    assert sorted(definitions) == ['country_id', 'id', 'name']
+    assert definitions['country_id']['relation'] == 'res.country'
+    assert _loads(odoo_server) == [[['model_id', '=', 'res.partner']]]
+
+def test_warm_up_loads_only_missing_models(odoo_server):
+
+    _partner_fields(odoo_server)
+    odoo = OdooAPIManager()
+    odoo.metadata.fields('res.partner')
+
+    odoo.metadata.warm_up(['res.partner', 'res.country', 'res.country'])
+
+    assert sorted(domain[0][2] for domain in _loads(odoo_server)) == ['res.country', 'res.partner']
+    assert sorted(odoo.metadata.fields('res.country')) == ['code', 'id']
+
+def test_refresh_reloads_definitions(odoo_server):
+
+    _partner_fields(odoo_server)
+    odoo = OdooAPIManager()
+    odoo.metadata.fields('res.partner')
+
+    odoo_server.add_fields('res.partner', ('vat', 'char', False))
+    assert 'vat' not in odoo.metadata.fields('res.partner')
+
+    odoo.metadata.refresh('res.partner')
+
+    assert 'vat' in odoo.metadata.fields('res.partner')
+    assert len(_loads(odoo_server)) == 2
+
+def test_disk_cache_is_invalidated_by_server_version(odoo_server, tmp_path):
+
+    _partner_fields(odoo_server)
+    path = str(tmp_path / 'metadata.json')
+    OdooAPIManager(metadata_cache= path).metadata.fields('res.partner')
+    assert len(_loads(odoo_server)) == 1
+
+    # Otra instancia reutiliza las definiciones guardadas en disco
+    assert 'country_id' in OdooAPIManager(metadata_cache= path).metadata.fields('res.partner')
+    assert len(_loads(odoo_server)) == 1
+
+    # Con una nueva versión del servidor las definiciones se vuelven a cargar
+    odoo_server.server_version = '17.1'
+    odoo_server.add_fields('res.partner', ('vat', 'char', False))
+
+    assert 'vat' in OdooAPIManager(metadata_cache= path).metadata.fields('res.partner')
+    assert len(_loads(odoo_server)) == 2
@@ -0,0 +1,165 @@
+import random
+import pytest
+from odoo_api_manager import (
+    OdooAPIManager,
+    normalize_criteria,
+)
+from odoo_api_manager._errors import InvalidCriteriaError
+from stand_in_odoo import evaluate
+
+@pytest.mark.parametrize(( 'criteria', 'expected' ), [
+    # Condiciones `=` e `in` sobre un mismo campo unidas por `|`
+    (
+        ['|', '|', ('state', '=', 'sale'), ('state', '=', 'done'), ('state', '=', 'sale')],
+        [('state', 'in', ['done', 'sale'])],
+    ),
+    (
+        ['|', ('state', 'in', ['sale', 'draft']), ('state', '=', 'done')],
+        [('state', 'in', ['done', 'draft', 'sale'])],
+    ),
+    # Los campos distintos y los valores booleanos no se combinan
+    (
+        ['|', ('b', '=', 2), ('a', '=', 1)],
+        ['|', ('a', '=', 1), ('b', '=', 2)],
+    ),
+    (
+        ['|', ('active', '=', True), ('active', '=', False)],
+        ['|', ('active', '=', False), ('active', '=', True)],
+    ),
+])
+def test_or_of_equalities_is_folded(criteria, expected):
+
+    assert normalize_criteria(criteria) == expected
+
+def test_in_lists_are_deduplicated():
+
+    assert normalize_criteria([('id', 'in', [3, 1, 3, 2])]) == [('id', 'in', [1, 2, 3])]
+    assert normalize_criteria([('tag_ids', 'not in', [5, 5, 4])]) == [('tag_ids', 'not in', [4, 5])]
+    # Una condición `in` de un solo valor equivale a una condición `=`
+    assert normalize_criteria([('id', 'in', [7, 7])]) == [('id', '=', 7)]
+    assert normalize_criteria([('active', 'in', [False])]) == [('active', 'in', [False])]
+    # Las listas con tipos mezclados se mantienen sin cambios
+    assert normalize_criteria([('x', 'in', [1, True, 1])]) == [('x', 'in', [1, True, 1])]
+
+@pytest.mark.parametrize(( 'criteria', 'expected' ), [
+    ( [(1, '=', 1), ('state', '=', 'sale')], [('state', '=', 'sale')] ),
+    ( ['|', (1, '=', 1), ('state', '=', 'sale')], [] ),
+    ( ['&', (0, '=', 1), ('state', '=', 'sale')], [(0, '=', 1)] ),
+    ( [('id', 'not in', [])], [] ),
+    ( [('id', 'in', [])], [(0, '=', 1)] ),
+    ( [('id', '!=', False), ('name', '=', 'A')], [('name', '=', 'A')] ),
+    ( [('a', '=', 1), ('a', '=', 1)], [('a', '=', 1)] ),
+])
+def test_tautologies_and_contradictions(criteria, expected):
+
+    assert normalize_criteria(criteria) == expected
+
+@pytest.mark.parametrize(( 'criteria', 'expected' ), [
+    ( ['!', (1, '=', 1)], [(0, '=', 1)] ),
+    ( ['!', (0, '=', 1)], [] ),
+    ( ['!', ('state', '=', 'sale')], ['!', ('state', '=', 'sale')] ),
+    ( ['!', '|', ('a', '=', 1), ('b', '=', 2)], ['!', '|', ('a', '=', 1), ('b', '=', 2)] ),
+    # Los `&` del nivel superior se vuelven implícitos
+    ( ['&', '&', ('a', '=', 1), ('b', '=', 2), ('c', '=', 3)], [('a', '=', 1), ('b', '=', 2), ('c', '=', 3)] ),
+    # Un operador binario por cada operando adicional
+    (
+        ['|', ('a', '=', 1), '|', ('b', '=', 2), '|', ('c', '=', 3), ('d', '=', 4)],
+        ['|', '|', '|', ('a', '=', 1), ('b', '=', 2), ('c', '=', 3), ('d', '=', 4)],
+    ),
+    (
+        ['|', ('a', '=', 1), '&', ('b', '=', 2), ('c', '=', 3)],
+        ['|', '&', ('b', '=', 2), ('c', '=', 3), ('a', '=', 1)],
+    ),
+    (
+        ['&', '!', ('a', '=', 1), '|', ('b', '=', 2), ('c', '=', 3)],
+        ['!', ('a', '=', 1), '|', ('b', '=', 2), ('c', '=', 3)],
+    ),
+])
+def test_negation_and_arity(criteria, expected):
+
+    assert normalize_criteria(criteria) == expected
+
+@pytest.mark.parametrize('criteria', [
+    'state',
+    ['|', ('a', '=', 1)],
+    ['!'],
+    [('a', '=', 1), '&'],
+    [('a', '=')],
+    [('a', 1, 2)],
+    [(2, '=', 1)],
+])
+def test_invalid_prefix_notation_raises(criteria):
+
+    with pytest.raises(InvalidCriteriaError):
+        normalize_criteria(criteria)
+    assert issubclass(InvalidCriteriaError, ValueError)
+
+def test_equivalent_criteria_share_canonical_form():
+
+    first = ['|', ('state', '=', 'sale'), '&', ('partner_id', '=', 7), ('state', '=', 'done')]
+    second = ['|', '&', ('state', '=', 'done'), ('partner_id', '=', 7), ('state', 'in', ['sale', 'sale'])]
+
+    assert normalize_criteria(first) == normalize_criteria(second)
+    # La normalización no modifica el criterio original y es idempotente
+    assert first == ['|', ('state', '=', 'sale'), '&', ('partner_id', '=', 7), ('state', '=', 'done')]
+    assert normalize_criteria(normalize_criteria(first)) == normalize_criteria(first)
+
+def _random_criteria(rng: random.Random, depth: int = 0) -> list:
+
+    choice = rng.random()
+    if depth > 3 or choice < 0.4:
+        field = rng.choice(['a', 'b'])
+        return [rng.choice([
+            ( field, '=', rng.randint(0, 3) ),
+            ( field, '!=', rng.randint(0, 3) ),
+            ( field, 'in', [rng.randint(0, 3) for _ in range(rng.randint(0, 3))] ),
+            ( field, 'not in', [rng.randint(0, 3) for _ in range(rng.randint(0, 2))] ),
+            (1, '=', 1),
+            (0, '=', 1),
+        ])]
+    if choice < 0.55:
+        return ['!', *_random_criteria(rng, depth + 1)]
+
+    return [rng.choice('&|'), *_random_criteria(rng, depth + 1), *_random_criteria(rng, depth + 1)]
+
+def test_normalized_criteria_select_the_same_records():
+
+    rng = random.Random(25)
+    records = [{'id': i, 'a': a, 'b': b} for ( i, ( a, b ) ) in enumerate(( a, b ) for a in range(4) for b in range(4))]
+
+    for _ in range(500):
+        criteria = _random_criteria(rng) + (_random_criteria(rng) if rng.random() < 0.3 else [])
+        normalized = normalize_criteria(criteria)
+        assert [evaluate(record, criteria) for record in records] == [evaluate(record, normalized) for record in records], criteria
+
+def test_normalization_is_opt_in(odoo_server):
+
+    odoo_server.add('sale.order', *[{'id': i, 'state': state} for ( i, state ) in enumerate(['sale', 'done', 'draft'], 1)])
+    criteria = ['|', ('state', '=', 'sale'), ('state', '=', 'done')]
+
+    assert OdooAPIManager().search('sale.order', criteria) == [1, 2]
+    assert OdooAPIManager(normalize_criteria= True).search('sale.order', criteria) == [1, 2]
+
+    ( plain, normalized ) = [args[0] for ( model, method, args, kwargs ) in odoo_server.calls]
+    assert plain == [ '|', ['state', '=', 'sale'], ['state', '=', 'done'] ]
+    assert normalized == [['state', 'in', ['done', 'sale']]]
+
+def test_invalid_criteria_fail_before_the_request(odoo_server):
+
+    odoo = OdooAPIManager(normalize_criteria= True)
+
+    with pytest.raises(InvalidCriteriaError):
+        odoo.search_read('sale.order', ['|', ('state', '=', 'sale')])
+
+    assert odoo_server.calls == []
+
+def test_equivalent_criteria_share_cache_entry(odoo_server):
+
+    odoo_server.add('sale.order', *[{'id': i, 'state': state} for ( i, state ) in enumerate(['sale', 'done', 'draft'], 1)])
+    odoo = OdooAPIManager(default_output= 'dict', cache= True, normalize_criteria= True)
+
+    first = odoo.search_read('sale.order', ['|', ('state', '=', 'sale'), ('state', '=', 'done')], ['state'])
+    second = odoo.search_read('sale.order', [('state', 'in', ['done', 'sale', 'sale'])], ['state'])
+
+    assert first == second
+    assert odoo_server.methods('sale.order') == ['search_read']
@@ -0,0 +1,77 @@
+import pytest
+from odoo_api_manager import OdooAPIManager
+
+def _orders(odoo_server) -> list:
+
+    return [kwargs.get('order') for ( model, method, args, kwargs ) in odoo_server.calls if method != 'search_count']
+
+def test_sibling_apis_share_the_keyset_default(odoo_server, tmp_path):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}'} for i in range(1, 8)])
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    ids = [record_id for page in odoo.iter_search('res.partner', page_size= 3) for record_id in page]
+    orders = _orders(odoo_server)
+    odoo_server.calls.clear()
+
+    records = [record['id'] for page in odoo.iter_search_read('res.partner', fields= ['name'], page_size= 3) for record in page]
+    assert _orders(odoo_server) == orders
+    odoo_server.calls.clear()
+
+    written = odoo.export('res.partner', tmp_path / 'partners.jsonl', fields= ['name'], page_size= 3)
+    assert _orders(odoo_server) == orders
+
+    assert orders == ['id asc'] * 3
+    assert ids == records == list(range(1, 8))
+    assert written == 7
+
+def test_offset_keeps_the_model_order(odoo_server):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}'} for i in range(1, 5)])
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    pages = list(odoo.iter_search_read('res.partner', fields= ['name'], page_size= 2, pagination= 'offset'))
+
+    assert [kwargs.get('order') for ( *_, kwargs ) in odoo_server.calls] == [None, None, None]
+    assert [len(page) for page in pages] == [2, 2]
+
+def test_iter_search_read_pages_cover_every_record_once(odoo_server):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}'} for i in range(1, 11)])
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    for pagination in ( 'offset', 'keyset' ):
+        pages = list(odoo.iter_search_read('res.partner', fields= ['name'], page_size= 4, pagination= pagination))
+
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert [record['id'] for page in pages for record in page] == list(range(1, 11))
+
+def test_iter_search_read_stops_after_an_exact_last_page(odoo_server):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}'} for i in range(1, 7)])
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    pages = list(odoo.iter_search_read('res.partner', fields= ['name'], page_size= 3))
+
+    assert [len(page) for page in pages] == [3, 3]
+    # La página completa final requiere una solicitud más, que llega vacía
+    assert odoo_server.methods('res.partner') == ['search_read'] * 3
+
+def test_iter_search_read_is_lazy_and_formats_each_page(odoo_server):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}'} for i in range(1, 5)])
+    odoo = OdooAPIManager()
+
+    pages = odoo.iter_search_read('res.partner', fields= ['name'], page_size= 2)
+    assert odoo_server.methods('res.partner') == []
+
+    first = next(pages)
+    assert list(first.columns) == ['id', 'name']
+    assert odoo_server.methods('res.partner') == ['search_read']
+
+def test_iter_search_read_rejects_invalid_page_size(odoo_server):
+
+    odoo = OdooAPIManager()
+
+    with pytest.raises(ValueError):
+        next(odoo.iter_search_read('res.partner', page_size= 0))
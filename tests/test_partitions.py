@@ -0,0 +1,46 @@
+import random
+import pytest
+from odoo_api_manager import OdooAPIManager
+
+def _partners(odoo_server) -> list[int]:
+
+    # IDs dispersas, con huecos
+    ids = sorted(random.Random(3).sample(range(1, 1000), 137))
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}', 'state': ['draft', 'done'][i % 2]} for i in ids])
+
+    return ids
+
+def test_partitions_cover_the_id_range_without_gaps_or_duplicates(odoo_server):
+
+    ids = _partners(odoo_server)
+    odoo = OdooAPIManager(default_output= 'dict', pool_size= 4)
+
+    for partitions in ( 1, 3, 8, 500 ):
+        response = odoo.search_read('res.partner', fields= ['name'], partitions= partitions)
+        assert [record['id'] for record in response] == ids
+
+def test_partitions_respect_the_search_criteria(odoo_server):
+
+    ids = _partners(odoo_server)
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    response = odoo.search_read('res.partner', [('state', '=', 'done')], ['name'], partitions= 5)
+
+    assert [record['id'] for record in response] == [i for i in ids if i % 2]
+    # Cada rango es una búsqueda acotada por ID
+    ranges = [args[0] for ( model, method, args, kwargs ) in odoo_server.calls if method == 'search_read']
+    assert len(ranges) == 5
+
+def test_partitions_without_records(odoo_server):
+
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    assert odoo.search_read('res.partner', fields= ['name'], partitions= 4) == []
+    assert 'search_read' not in odoo_server.methods('res.partner')
+
+def test_partitions_reject_offset_and_limit(odoo_server):
+
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    with pytest.raises(ValueError):
+        odoo.search_read('res.partner', limit= 10, partitions= 2)
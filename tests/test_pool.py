@@ -0,0 +1,68 @@
+import threading
+import pytest
+from odoo_api_manager import OdooAPIManager
+from odoo_api_manager._transport import ProxyPool
+from stand_in_odoo import (
+    DB,
+    TOKEN,
+    UID,
+)
+
+def test_timeout_matches_async_pool(odoo_server):
+
+    odoo_server.add('res.partner', {'id': 1, 'name': 'Contacto 1'})
+    pool = ProxyPool(f'{odoo_server.url}/xmlrpc/2/object', 1, 0.2)
+
+    odoo_server.delay = 1.0
+    with pytest.raises(TimeoutError):
+        with pool.connection() as proxy:
+            proxy.execute_kw(DB, UID, TOKEN, 'res.partner', 'read', [[1]], {'fields': ['name']})
+
+    # La conexión se reabre en la siguiente solicitud
+    odoo_server.delay = 0.0
+    with pool.connection() as proxy:
+        assert proxy.execute_kw(DB, UID, TOKEN, 'res.partner', 'read', [[1]], {'fields': ['name']}) == [{'id': 1, 'name': 'Contacto 1'}]
+
+    pool.close()
+
+def test_threads_share_a_bounded_pool(odoo_server):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}'} for i in range(1, 21)])
+    odoo_server.delay = 0.02
+    odoo = OdooAPIManager(default_output= 'dict', pool_size= 3)
+
+    results = {}
+    def read(record_id: int) -> None:
+        results[record_id] = odoo.read('res.partner', [record_id], ['name'])
+
+    threads = [threading.Thread(target= read, args= ( i, )) for i in range(1, 21)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: [{'id': i, 'name': f'Contacto {i}'}] for i in range(1, 21)}
+    assert odoo_server.max_in_flight <= 3
+    # Una conexión de autenticación y como máximo una por instancia del pool
+    assert odoo_server.connections <= 4
+    odoo.close()
+
+def test_connections_are_reused_between_requests(odoo_server):
+
+    odoo_server.add('res.partner', {'id': 1, 'name': 'Contacto 1'})
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    for _ in range(5):
+        odoo.read('res.partner', [1], ['name'])
+
+    # Una conexión de autenticación y una de solicitudes
+    assert odoo_server.connections == 2
+    odoo.close()
+
+def test_sync_client_waits_indefinitely_by_default(odoo_server):
+
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    assert odoo._timeout is None
+    assert odoo._models.timeout is None
+    odoo.close()
@@ -0,0 +1,25 @@
+import random
+from odoo_api_manager import OdooAPIManager
+
+def test_chunked_read_preserves_input_order(odoo_server):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}'} for i in range(1, 51)])
+    odoo = OdooAPIManager(default_output= 'dict', pool_size= 4)
+    ids = random.Random(7).sample(range(1, 51), 50)
+
+    response = odoo.read('res.partner', ids, ['name'], chunk_size= 7)
+
+    assert [record['id'] for record in response] == ids
+    # Un bloque de como máximo `chunk_size` IDs por solicitud
+    chunks = [args[0] for ( model, method, args, kwargs ) in odoo_server.calls if method == 'read']
+    assert sorted(len(chunk) for chunk in chunks) == [1] + [7] * 7
+    assert sorted(record_id for chunk in chunks for record_id in chunk) == sorted(ids)
+
+def test_small_read_is_a_single_request(odoo_server):
+
+    odoo_server.add('res.partner', *[{'id': i, 'name': f'Contacto {i}'} for i in range(1, 4)])
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    assert odoo.read('res.partner', 2, ['name']) == [{'id': 2, 'name': 'Contacto 2'}]
+    assert odoo.read('res.partner', [3, 1], ['name']) == [{'id': 3, 'name': 'Contacto 3'}, {'id': 1, 'name': 'Contacto 1'}]
+    assert odoo_server.methods('res.partner') == ['read', 'read']
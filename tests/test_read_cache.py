@@ -0,0 +1,48 @@
+from odoo_api_manager import OdooAPIManager
+
+def _requested_fields(odoo_server, model: str) -> list:
+
+    return [
+        ( method, kwargs.get('fields') )
+        for ( name, method, args, kwargs ) in odoo_server.calls
+        if name == model
+    ]
+
+def test_read_is_revalidated_by_write_date(odoo_server, tmp_path):
+
+    odoo_server.add_fields('product.product', ('id', 'integer', False), ('name', 'char', False), ('write_date', 'datetime', False))
+    odoo_server.add('product.product', *[
+        {'id': i, 'name': f'Producto {i}', 'write_date': '2026-01-01 00:00:00'}
+        for i in range(1, 4)
+    ])
+    odoo = OdooAPIManager(default_output= 'dict', read_cache= str(tmp_path / 'records.sqlite3'))
+
+    first = odoo.search_read('product.product', fields= ['name'])
+    second = odoo.search_read('product.product', fields= ['name'])
+
+    assert first == second == [{'id': i, 'name': f'Producto {i}'} for i in range(1, 4)]
+    assert _requested_fields(odoo_server, 'product.product') == [
+        ( 'search_read', ['write_date'] ),
+        ( 'read', ['name'] ),
+        # La segunda lectura sólo revalida las fechas de modificación
+        ( 'search_read', ['write_date'] ),
+    ]
+
+    # Sólo se vuelve a leer el registro modificado
+    odoo_server.calls.clear()
+    odoo_server.records['product.product'][2].update({'name': 'Cambio', 'write_date': '2026-01-02 00:00:00'})
+    third = odoo.search_read('product.product', fields= ['name'])
+
+    assert [record['name'] for record in third] == ['Producto 1', 'Cambio', 'Producto 3']
+    assert [args for ( model, method, args, kwargs ) in odoo_server.calls if method == 'read'] == [[[2]]]
+
+def test_model_without_write_date_is_read_directly(odoo_server, tmp_path):
+
+    odoo_server.add_fields('product.tag.rel', ('id', 'integer', False), ('name', 'char', False))
+    odoo_server.add('product.tag.rel', {'id': 1, 'name': 'Etiqueta'})
+    odoo = OdooAPIManager(default_output= 'dict', read_cache= str(tmp_path / 'records.sqlite3'))
+
+    assert odoo.search_read('product.tag.rel', fields= ['name']) == [{'id': 1, 'name': 'Etiqueta'}]
+    assert odoo.read('product.tag.rel', 1, ['name']) == [{'id': 1, 'name': 'Etiqueta'}]
+    # No se solicita `write_date`, que no existe en el modelo
+    assert _requested_fields(odoo_server, 'product.tag.rel') == [( 'search_read', ['name'] ), ( 'read', ['name'] )]
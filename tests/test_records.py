@@ -0,0 +1,60 @@
+import sys
+import pytest
+from odoo_api_manager import OdooAPIManager
+from odoo_api_manager.typing import (
+    Record,
+    RecordTable,
+)
+
+ORDERS = [
+    {'id': 52, 'name': 'S00052', 'amount_total': 1250.0, '__last_update': '2026-01-02 10:30:00'},
+    {'id': 87, 'name': 'S00087', 'amount_total': 830.5, '__last_update': '2026-01-03 08:00:00'},
+]
+
+def test_tuples_output(odoo_server):
+
+    odoo_server.add('sale.order', *ORDERS)
+    odoo = OdooAPIManager()
+
+    table = odoo.search_read('sale.order', fields= ['name', 'amount_total'], output= 'tuples')
+
+    assert isinstance(table, RecordTable)
+    assert table.fields == ('id', 'name', 'amount_total')
+    assert len(table) == 2
+    assert table[0] == (52, 'S00052', 1250.0)
+    assert table[1, 'name'] == 'S00087'
+    assert table.column('amount_total') == [1250.0, 830.5]
+    assert list(table) == table.rows
+    assert table.to_dicts() == [{key: order[key] for key in table.fields} for order in ORDERS]
+    assert repr(table) == "RecordTable(fields=('id', 'name', 'amount_total'), rows=2)"
+
+def test_tuples_output_without_records(odoo_server):
+
+    table = OdooAPIManager().search_read('sale.order', fields= ['name'], output= 'tuples')
+
+    assert table.fields == ()
+    assert len(table) == 0
+
+def test_records_output(odoo_server):
+
+    odoo_server.add('sale.order', *ORDERS)
+    odoo = OdooAPIManager(default_output= 'records')
+
+    records = odoo.read('sale.order', [87, 52], ['name', '__last_update'])
+
+    assert [type(record).__name__ for record in records] == ['SaleOrderRecord', 'SaleOrderRecord']
+    assert isinstance(records[0], Record)
+    # Una sola clase por modelo y conjunto de campos
+    assert type(records[0]) is type(records[1])
+    assert records[0]['name'] == records[0].name == 'S00087'
+    # Los campos que no son atributos válidos se consultan por llave
+    assert records[1]['__last_update'] == '2026-01-02 10:30:00'
+    assert records[1].get('vat', False) is False
+    assert list(records[1]) == ['id', 'name', '__last_update']
+    assert records[1].to_dict() == {'id': 52, 'name': 'S00052', '__last_update': '2026-01-02 10:30:00'}
+    assert repr(records[0]) == "SaleOrderRecord(id=87, name='S00087', __last_update='2026-01-03 08:00:00')"
+    with pytest.raises(KeyError):
+        records[0]['amount_total']
+    # Los registros no guardan un diccionario por instancia
+    assert not hasattr(records[0], '__dict__')
+    assert sys.getsizeof(records[0]) < sys.getsizeof(records[0].to_dict())
@@ -0,0 +1,89 @@
+import pytest
+from odoo_api_manager import OdooAPIManager
+
+def _orders(odoo_server) -> None:
+
+    odoo_server.add_fields(
+        'sale.order',
+        ('id', 'integer', False),
+        ('name', 'char', False),
+        ('partner_id', 'many2one', 'res.partner'),
+        ('partner_shipping_id', 'many2one', 'res.partner'),
+        ('user_id', 'many2one', 'res.users'),
+    )
+    odoo_server.add(
+        'sale.order',
+        {'id': 52, 'name': 'S00052', 'partner_id': [7, 'Un cliente'], 'partner_shipping_id': [8, 'Sucursal'], 'user_id': [2, 'Vendedor']},
+        {'id': 89, 'name': 'S00089', 'partner_id': [9, 'Mostrador'], 'partner_shipping_id': [7, 'Un cliente'], 'user_id': False},
+        {'id': 90, 'name': 'S00090', 'partner_id': False, 'partner_shipping_id': False, 'user_id': [2, 'Vendedor']},
+        {'id': 91, 'name': 'S00091', 'partner_id': [404, 'Eliminado'], 'partner_shipping_id': False, 'user_id': False},
+    )
+    odoo_server.add(
+        'res.partner',
+        {'id': 7, 'vat': 'XAXX010101000', 'country_id': [156, 'México']},
+        {'id': 8, 'vat': 'SUC010101000', 'country_id': [156, 'México']},
+        {'id': 9, 'vat': False, 'country_id': False},
+    )
+    odoo_server.add('res.users', {'id': 2, 'login': 'vendedor'})
+
+def _reads(odoo_server) -> list:
+
+    return [( model, sorted(args[0]), kwargs['fields'] ) for ( model, method, args, kwargs ) in odoo_server.calls if method == 'read']
+
+def test_related_fields_are_joined(odoo_server):
+
+    _orders(odoo_server)
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    records = odoo.search_read('sale.order', fields= ['name'], related= {'partner_id': ['vat', 'country_id']})
+
+    assert [( record['id'], record['partner_id.vat'], record['partner_id.country_id'] ) for record in records] == [
+        ( 52, 'XAXX010101000', [156, 'México'] ),
+        ( 89, False, False ),
+        # Sin referencia y con referencia que no pudo leerse
+        ( 90, False, False ),
+        ( 91, False, False ),
+    ]
+    # El campo Many2One se añade a los campos leídos
+    assert list(records[0]) == ['id', 'name', 'partner_id', 'partner_id.vat', 'partner_id.country_id']
+    # Una sola lectura con las IDs distintas
+    assert _reads(odoo_server) == [( 'res.partner', [7, 9, 404], ['vat', 'country_id'] )]
+
+def test_fields_of_the_same_model_share_one_read(odoo_server):
+
+    _orders(odoo_server)
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    records = odoo.read(
+        'sale.order',
+        [52, 89],
+        ['name', 'partner_id', 'partner_shipping_id', 'user_id'],
+        related= {'partner_id': ['vat'], 'partner_shipping_id': ['country_id'], 'user_id': ['login']},
+    )
+
+    assert records[0]['partner_shipping_id.country_id'] == [156, 'México']
+    assert records[1]['partner_shipping_id.country_id'] == [156, 'México']
+    assert [record['user_id.login'] for record in records] == ['vendedor', False]
+    assert sorted(_reads(odoo_server)) == [
+        ( 'res.partner', [7, 8, 9], ['vat', 'country_id'] ),
+        ( 'res.users', [2], ['login'] ),
+        ( 'sale.order', [52, 89], ['name', 'partner_id', 'partner_shipping_id', 'user_id'] ),
+    ]
+
+def test_related_dataframe_columns(odoo_server):
+
+    _orders(odoo_server)
+    odoo = OdooAPIManager()
+
+    data = odoo.read('sale.order', [52], ['name'], related= {'partner_id': ['vat']})
+
+    assert list(data.columns) == ['id', 'name', 'partner_id', 'partner_id.vat']
+    assert data['partner_id.vat'].tolist() == ['XAXX010101000']
+
+def test_related_field_must_be_many2one(odoo_server):
+
+    _orders(odoo_server)
+    odoo = OdooAPIManager(default_output= 'dict')
+
+    with pytest.raises(ValueError):
+        odoo.read('sale.order', [52], ['name'], related= {'name': ['vat']})
@@ -0,0 +1,41 @@
+import threading
+from odoo_api_manager import OdooAPIManager
+
+def test_read_in_flight_during_a_write_is_not_cached(odoo_server):
+
+    odoo_server.add('res.partner', {'id': 1, 'name': 'Antes'})
+    odoo = OdooAPIManager(default_output= 'dict', cache= True)
+
+    # La lectura obtiene su respuesta y se detiene antes de entregarla
+    computed = threading.Event()
+    release = threading.Event()
+    def pause(model, method):
+        if method == 'read' and not computed.is_set():
+            computed.set()
+            release.wait(5)
+    odoo_server.after_call = pause
+
+    responses = []
+    reader = threading.Thread(target= lambda: responses.append(odoo.read('res.partner', [1], ['name'])))
+    reader.start()
+    assert computed.wait(5)
+
+    # La escritura invalida la caché mientras la lectura sigue en curso
+    odoo.write('res.partner', [1], {'name': 'Después'})
+    release.set()
+    reader.join(5)
+
+    assert responses == [[{'id': 1, 'name': 'Antes'}]]
+    # La respuesta anterior a la escritura no se guardó
+    assert odoo.read('res.partner', [1], ['name']) == [{'id': 1, 'name': 'Después'}]
+    assert odoo_server.methods('res.partner') == ['read', 'write', 'read']
+
+def test_reads_are_served_from_the_cache(odoo_server):
+
+    odoo_server.add('res.partner', {'id': 1, 'name': 'Contacto'})
+    odoo = OdooAPIManager(default_output= 'dict', cache= True)
+
+    odoo.read('res.partner', [1], ['name'])
+    odoo.read('res.partner', [1], ['name'])
+
+    assert odoo_server.methods('res.partner') == ['read']
@@ -0,0 +1,45 @@
+from odoo_api_manager import (
+    OdooAPIManager,
+    SyncEngine,
+)
+
+def _partner(record_id: int, write_date: str) -> dict:
+
+    return {'id': record_id, 'name': f'Contacto {record_id}', 'write_date': write_date}
+
+def test_late_commit_inside_the_overlap_is_pulled(odoo_server, tmp_path):
+
+    odoo_server.add(
+        'res.partner',
+        _partner(1, '2024-01-01 09:00:00'),
+        _partner(2, '2024-01-01 10:00:00'),
+    )
+    sync = SyncEngine(OdooAPIManager(default_output= 'dict'), tmp_path / 'mirror.sqlite3', overlap= 300)
+
+    assert sync.sync('res.partner', ['name']).upserted == 2
+
+    # Una transacción iniciada a las 09:58 se confirma después de la
+    # sincronización anterior, con una fecha previa a la marca de agua
+    odoo_server.add('res.partner', _partner(3, '2024-01-01 09:58:00'))
+    sync.sync('res.partner', ['name'])
+
+    assert sorted(record['id'] for record in sync.records('res.partner', output= 'dict')) == [1, 2, 3]
+    sync.close()
+
+def test_overlap_bounds_the_requery(odoo_server, tmp_path):
+
+    odoo_server.add(
+        'res.partner',
+        _partner(1, '2024-01-01 09:00:00'),
+        _partner(2, '2024-01-01 10:00:00'),
+    )
+    sync = SyncEngine(OdooAPIManager(default_output= 'dict'), tmp_path / 'mirror.sqlite3', overlap= 300)
+    sync.sync('res.partner', ['name'])
+
+    # Sólo se vuelven a obtener los registros dentro de la ventana
+    result = sync.sync('res.partner', ['name'], detect_deletions= False)
+
+    assert result.upserted == 1
+    ( *_, ( model, method, args, kwargs ) ) = odoo_server.calls
+    assert ['write_date', '>=', '2024-01-01 09:55:00'] in args[0]
+    sync.close()
@@ -0,0 +1,86 @@
+import pandas as pd
+from odoo_api_manager import OdooAPIManager
+
+def _partners(odoo_server) -> None:
+
+    odoo_server.add_fields(
+        'res.partner',
+        ('id', 'integer', False),
+        ('name', 'char', False),
+        ('write_date', 'datetime', False),
+        ('birthday', 'date', False),
+        ('credit', 'monetary', False),
+        ('color', 'integer', False),
+        ('type', 'selection', False),
+        ('active', 'boolean', False),
+        ('country_id', 'many2one', 'res.country'),
+    )
+    odoo_server.add(
+        'res.partner',
+        {
+            'id': 1, 'name': 'Un cliente', 'write_date': '2026-01-02 10:30:00', 'birthday': '1990-05-17',
+            'credit': 10.5, 'color': 3, 'type': 'contact', 'active': True, 'country_id': [156, 'México'],
+        },
+        {
+            'id': 2, 'name': 'Mostrador', 'write_date': '2026-01-03 08:00:00', 'birthday': False,
+            'credit': False, 'color': False, 'type': 'invoice', 'active': False, 'country_id': False,
+        },
+    )
+
+FIELDS = ['name', 'write_date', 'birthday', 'credit', 'color', 'type', 'active', 'country_id']
+
+def test_typed_dataframe(odoo_server):
+
+    _partners(odoo_server)
+    odoo = OdooAPIManager(typed= True)
+
+    data = odoo.read('res.partner', [1, 2], FIELDS)
+
+    assert str(data['id'].dtype) == 'Int64'
+    assert str(data['color'].dtype) == 'Int64'
+    assert str(data['credit'].dtype) == 'Float64'
+    assert str(data['active'].dtype) == 'boolean'
+    assert isinstance(data['type'].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_dtype(data['write_date'])
+    assert pd.api.types.is_datetime64_dtype(data['birthday'])
+    assert data['write_date'][0] == pd.Timestamp('2026-01-02 10:30:00')
+    # El valor vacío `False` se convierte en nulo salvo en campos booleanos
+    assert data['color'].isna().tolist() == [False, True]
+    assert data['credit'].isna().tolist() == [False, True]
+    assert data['birthday'].isna().tolist() == [False, True]
+    assert data['active'].tolist() == [True, False]
+    # Los campos Many2One se mantienen sin cambios
+    assert data['country_id'].tolist() == [[156, 'México'], False]
+
+def test_typed_search_read(odoo_server):
+
+    _partners(odoo_server)
+    odoo = OdooAPIManager(typed= True)
+
+    data = odoo.search_read('res.partner', [('type', '=', 'contact')], ['name', 'color', 'type'])
+
+    assert data['name'].tolist() == ['Un cliente']
+    assert str(data['color'].dtype) == 'Int64'
+    assert isinstance(data['type'].dtype, pd.CategoricalDtype)
+
+def test_untyped_dataframe_keeps_object_columns(odoo_server):
+
+    _partners(odoo_server)
+    odoo = OdooAPIManager()
+
+    data = odoo.read('res.partner', [1, 2], FIELDS)
+
+    assert data['color'].tolist() == [3, False]
+    assert data['credit'].dtype == object
+    # Sin tipos no se consultan los metadatos
+    assert odoo_server.methods('ir.model.fields') == []
+
+def test_typed_applies_only_to_dataframes(odoo_server):
+
+    _partners(odoo_server)
+    odoo = OdooAPIManager(typed= True)
+
+    records = odoo.read('res.partner', [2], ['color'], output= 'dict')
+
+    assert records == [{'id': 2, 'color': False}]
+    assert odoo_server.methods('ir.model.fields') == []
@@ -0,0 +1,57 @@
+from odoo_api_manager import OdooAPIManager
+
+def _orders(odoo_server) -> None:
+
+    odoo_server.add_fields('sale.order', ('id', 'integer', False), ('order_line', 'one2many', 'sale.order.line'))
+    odoo_server.add_fields(
+        'sale.order.line',
+        ('id', 'integer', False),
+        ('price', 'float', False),
+        ('product_id', 'many2one', 'product.product'),
+    )
+    odoo_server.add_fields('product.product', ('id', 'integer', False), ('default_code', 'char', False))
+    odoo_server.add(
+        'sale.order',
+        {'id': 1, 'order_line': [10, 11]},
+        {'id': 2, 'order_line': [11, 12]},
+        {'id': 3, 'order_line': []},
+    )
+    odoo_server.add(
+        'sale.order.line',
+        {'id': 10, 'price': 1.0, 'product_id': [7, 'Café']},
+        {'id': 11, 'price': 2.0, 'product_id': [8, 'Té']},
+        {'id': 12, 'price': 3.0, 'product_id': False},
+    )
+    odoo_server.add('product.product', {'id': 7, 'default_code': 'CAF'}, {'id': 8, 'default_code': 'TE'})
+
+def test_records_output_is_not_named_after_the_child_model(odoo_server):
+
+    _orders(odoo_server)
+    odoo = OdooAPIManager()
+
+    records = odoo.expand_x2many('sale.order', 'order_line', child_fields= ['price'], output= 'records')
+
+    assert [record.to_dict() for record in records] == [
+        {'parent_id': 1, 'child_id': 10, 'order_line.price': 1.0},
+        {'parent_id': 1, 'child_id': 11, 'order_line.price': 2.0},
+        {'parent_id': 2, 'child_id': 11, 'order_line.price': 2.0},
+        {'parent_id': 2, 'child_id': 12, 'order_line.price': 3.0},
+    ]
+    assert type(records[0]).__name__ == 'Record'
+
+def test_children_are_read_once_with_related_fields(odoo_server):
+
+    _orders(odoo_server)
+    odoo = OdooAPIManager()
+
+    rows = odoo.expand_x2many(
+        'sale.order',
+        'order_line',
+        child_fields= ['price'],
+        output= 'dict',
+        related= {'product_id': ['default_code']},
+    )
+
+    assert [row['order_line.product_id.default_code'] for row in rows] == ['CAF', 'TE', 'TE', False]
+    assert odoo_server.methods('sale.order.line') == ['read']
+    assert odoo_server.methods('product.product') == ['read']